@@ -1,5 +1,7 @@
 import csv
-import re
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from row_classifier import ROW_CLASSIFIER, clean_first_cell
 
 # Read CSV
 with open('checklist-final.csv', 'r', encoding='utf-8', errors='replace') as f:
@@ -27,7 +29,7 @@ for i, row in enumerate(data_rows, start=1):
     
     # If we're past the ultrasound section and hit another section header, stop
     if ultrasound_start and not ultrasound_end:
-        is_section = (first_col.isupper() and len(first_col) > 3) or first_col.startswith('FACILITY-')
+        is_section = ROW_CLASSIFIER.section_name(clean_first_cell(first_col)) is not None
         if is_section:
             ultrasound_end = i
             print(f"ULTRASOUND ROOM section ends at row {i} (next section: {first_col})")
@@ -0,0 +1,270 @@
+import argparse
+import json
+import sys
+import time
+
+from checklist_inputs import CSV_PATH, load_checklist
+from section_resolver import compact_key
+
+# Set algebra over the checklist applicability matrix ("?" cells). Replaces the
+# one-off scripts with hard-coded columns and row ranges
+# (scripts/check_hospital_applicability*.py, test_csv_parsing_v2.py):
+#
+#   python applicability_query.py only "Dental Laboratory"
+#   python applicability_query.py every
+#   python applicability_query.py diff Physiotherapy "Rehabilitation Centre"
+#   python applicability_query.py all Hospital Clinic --section "BLEEDING ROOM"
+#
+# Every question row gets an int bitmask over the facility columns, and every
+# facility column gets an int bitset over the question rows. Python ints are
+# arbitrary precision, so "applies to A and B but not C" is one & / ~ over
+# bitsets however many facility columns the CSV grows. Results come back
+# grouped by section with CSV row numbers.
+
+
+class Selection:
+    """A set of checklist questions, stored as a bitset over question positions"""
+
+    def __init__(self, matrix, bits):
+        self.matrix = matrix
+        self.bits = bits
+
+    def __and__(self, other):
+        return Selection(self.matrix, self.bits & other.bits)
+
+    def __or__(self, other):
+        return Selection(self.matrix, self.bits | other.bits)
+
+    def __sub__(self, other):
+        return Selection(self.matrix, self.bits & ~other.bits)
+
+    def __invert__(self):
+        return Selection(self.matrix, self.matrix.universe & ~self.bits)
+
+    def __len__(self):
+        return bin(self.bits).count('1')
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def positions(self):
+        """Question positions in CSV order"""
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def questions(self):
+        return [self.matrix.questions[p] for p in self.positions()]
+
+    def by_section(self):
+        """{section: [{'row_number', 'question', 'facility_types'}]} in CSV order"""
+        grouped = {}
+        for p in self.positions():
+            q = self.matrix.questions[p]
+            grouped.setdefault(q['section'], []).append({
+                'row_number': q['row_number'],
+                'question': q['question'],
+                'facility_types': self.matrix.facility_names(self.matrix.masks[p]),
+            })
+        return grouped
+
+
+class ApplicabilityMatrix:
+    """Question x facility type matrix of the checklist with set-algebra queries"""
+
+    def __init__(self, checklist):
+        self.facility_types = checklist['facility_types']
+        self.questions = checklist['questions']
+        self.all_facilities = (1 << len(self.facility_types)) - 1
+        self.universe = (1 << len(self.questions)) - 1
+
+        # Row masks (facility bits per question) and column bitsets (question bits per facility)
+        self.masks = []
+        self.columns = [0] * len(self.facility_types)
+        self.rows_by_mask = {}
+        self.sections = {}
+        for position, q in enumerate(self.questions):
+            bit = 1 << position
+            mask = 0
+            for column, applies in enumerate(q['applicability'][:len(self.facility_types)]):
+                if applies:
+                    mask |= 1 << column
+                    self.columns[column] |= bit
+            self.masks.append(mask)
+            self.rows_by_mask[mask] = self.rows_by_mask.get(mask, 0) | bit
+            self.sections[q['section']] = self.sections.get(q['section'], 0) | bit
+
+        self._columns_by_key = {compact_key(ft): i for i, ft in enumerate(self.facility_types)}
+        self._sections_by_key = {compact_key(s): s for s in self.sections}
+
+    def column(self, facility_type):
+        """Column index of a facility type (case- and space-insensitive)"""
+        column = self._columns_by_key.get(compact_key(facility_type))
+        if column is None:
+            raise KeyError(f"Unknown facility type: {facility_type} (known: {', '.join(self.facility_types)})")
+        return column
+
+    def facility_mask(self, facility_types):
+        mask = 0
+        for facility_type in facility_types:
+            mask |= 1 << self.column(facility_type)
+        return mask
+
+    def facility_names(self, mask):
+        return [ft for i, ft in enumerate(self.facility_types) if mask >> i & 1]
+
+    def selection(self, bits):
+        return Selection(self, bits)
+
+    def everything(self):
+        return Selection(self, self.universe)
+
+    def facility(self, facility_type):
+        """Questions marked "?" for the facility type"""
+        return Selection(self, self.columns[self.column(facility_type)])
+
+    def section(self, name):
+        section = self._sections_by_key.get(compact_key(name))
+        if section is None:
+            raise KeyError(f"Unknown section: {name}")
+        return Selection(self, self.sections[section])
+
+    def any_of(self, facility_types):
+        """Questions that apply to at least one of the facility types"""
+        bits = 0
+        for facility_type in facility_types:
+            bits |= self.columns[self.column(facility_type)]
+        return Selection(self, bits)
+
+    def all_of(self, facility_types):
+        """Questions that apply to every one of the facility types (and maybe others)"""
+        bits = self.universe
+        for facility_type in facility_types:
+            bits &= self.columns[self.column(facility_type)]
+        return Selection(self, bits)
+
+    def none_of(self, facility_types):
+        return ~self.any_of(facility_types)
+
+    def exactly(self, facility_types):
+        """Questions that apply to these facility types and no others"""
+        return Selection(self, self.rows_by_mask.get(self.facility_mask(facility_types), 0))
+
+    def only(self, facility_types):
+        """Questions that apply to none but (a subset of) these facility types"""
+        allowed = self.facility_mask(facility_types)
+        bits = 0
+        for mask, rows in self.rows_by_mask.items():
+            if mask and not mask & ~allowed:
+                bits |= rows
+        return Selection(self, bits)
+
+    def every(self):
+        """Questions that apply to every facility type"""
+        return Selection(self, self.rows_by_mask.get(self.all_facilities, 0))
+
+    def unassigned(self):
+        """Questions with no facility type marked"""
+        return Selection(self, self.rows_by_mask.get(0, 0))
+
+    def diff(self, left, right):
+        """{'only_left', 'only_right', 'both'} selections for two facility types"""
+        a, b = self.facility(left), self.facility(right)
+        return {'only_left': a - b, 'only_right': b - a, 'both': a & b}
+
+
+def format_selection(title, selection, show_facilities=False):
+    lines = [f"{title}: {len(selection)} questions"]
+    for section, questions in selection.by_section().items():
+        lines.append(f"  [{section}] ({len(questions)})")
+        for q in questions:
+            suffix = f"  ({', '.join(q['facility_types'])})" if show_facilities else ''
+            lines.append(f"    Row {q['row_number']}: {q['question']}{suffix}")
+    return '\n'.join(lines)
+
+
+def run_query(matrix, args):
+    """[(title, selection)] for the parsed command line"""
+    names = [matrix.facility_types[matrix.column(ft)] for ft in args.facility]
+    if args.query == 'only':
+        results = [(f"Only {' / '.join(names)}", matrix.only(names))]
+    elif args.query == 'exactly':
+        results = [(f"Exactly {' + '.join(names)}", matrix.exactly(names))]
+    elif args.query == 'all':
+        results = [(f"All of {' + '.join(names)}", matrix.all_of(names))]
+    elif args.query == 'any':
+        results = [(f"Any of {' / '.join(names)}", matrix.any_of(names))]
+    elif args.query == 'none':
+        results = [(f"None of {' / '.join(names)}", matrix.none_of(names))]
+    elif args.query == 'every':
+        results = [("Every facility type", matrix.every())]
+    elif args.query == 'unassigned':
+        results = [("No facility type", matrix.unassigned())]
+    else:
+        left, right = names
+        parts = matrix.diff(left, right)
+        results = [
+            (f"{left} but not {right}", parts['only_left']),
+            (f"{right} but not {left}", parts['only_right']),
+            (f"Both {left} and {right}", parts['both']),
+        ]
+
+    if args.section:
+        scope = matrix.section(args.section)
+        results = [(title, selection & scope) for title, selection in results]
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Set-algebra queries over the checklist applicability matrix")
+    parser.add_argument('query', choices=['only', 'exactly', 'all', 'any', 'none', 'every', 'unassigned', 'diff'],
+                        help="only: none but these types; exactly: these types and no others; "
+                             "all/any/none: at least all / one / none of these types; "
+                             "every: all facility types; unassigned: no type; diff: A vs B")
+    parser.add_argument('facility', nargs='*', help="facility types (case- and space-insensitive)")
+    parser.add_argument('--csv', default=CSV_PATH, help=f"checklist CSV (default: {CSV_PATH})")
+    parser.add_argument('--section', help="restrict results to one section")
+    parser.add_argument('--count', action='store_true', help="print counts only")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    parser.add_argument('--facilities', action='store_true', help="list the facility types of every question")
+    args = parser.parse_args(argv)
+
+    if args.query in ('every', 'unassigned') and args.facility:
+        parser.error(f"{args.query} takes no facility types")
+    if args.query == 'diff' and len(args.facility) != 2:
+        parser.error("diff takes exactly two facility types")
+    if args.query not in ('every', 'unassigned', 'diff') and not args.facility:
+        parser.error(f"{args.query} needs at least one facility type")
+
+    matrix = ApplicabilityMatrix(load_checklist(args.csv))
+    started = time.perf_counter()
+    try:
+        results = run_query(matrix, args)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return 1
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(
+            [{'query': title, 'count': len(selection), 'sections': selection.by_section()}
+             for title, selection in results],
+            indent=2, ensure_ascii=False
+        ))
+        return 0
+
+    for title, selection in results:
+        if args.count:
+            print(f"{title}: {len(selection)} questions in {len(selection.by_section())} sections")
+        else:
+            print(format_selection(title, selection, args.facilities))
+            print()
+    print(f"({len(matrix.questions)} questions x {len(matrix.facility_types)} facility types, "
+          f"query {elapsed_ms:.2f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
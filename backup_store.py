@@ -0,0 +1,262 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+from datetime import datetime
+
+# Content-addressed store for generated config backups (replaces the
+# src/config/backup-<timestamp> directory copies made by generate-filters.ps1).
+#
+#   src/config/backups/objects/ab/cdef...   zlib-compressed file contents, by sha256
+#   src/config/backups/runs/<run_id>.json   one small manifest per generation run
+#   src/config/backups/index.json           run history, so listing reads one file
+#
+# Files are recorded by their path relative to the repository root. Generated
+# files differ between runs at most in a generation timestamp (the "Generated on:"
+# header of older modules, "generated_on" in the JSON reports), so that value is
+# kept in the run manifest and the object holds the rest of the file; identical
+# generations then share every object.
+
+STORE_DIR = 'src/config/backups'
+# Everything src/config/generateFilters.py writes into src/config (its checklist
+# chunks go to .checklist_cache/ and are rebuilt from the CSV, so they are not kept)
+DEFAULT_PATTERNS = [
+    'src/config/*.js',
+    'src/config/generation_report.json',
+    'src/config/generation_manifest.json',
+    'src/config/filter_source_map.json',
+    'src/config/coverage_matrix.csv',
+    'src/config/coverage_matrix.json',
+]
+RUN_ID_FORMAT = '%Y%m%d-%H%M%S'
+# Runs recorded before paths were kept name their files by basename only
+LEGACY_FILE_DIR = 'src/config'
+
+# (prefix, value) of the generation timestamp, tried in order
+_GENERATED_ON_RES = [
+    re.compile(rb'^( \* Generated on: )([^\r\n]*)', re.MULTILINE),
+    re.compile(rb'^(\s*"generated_on":\s*")([^"\r\n]*)', re.MULTILINE),
+]
+
+
+def _find_timestamp(data):
+    for pattern in _GENERATED_ON_RES:
+        match = pattern.search(data)
+        if match:
+            return match
+    return None
+
+
+def split_timestamp(data):
+    """Return (data without the generated-on value, value or None)"""
+    match = _find_timestamp(data)
+    if not match:
+        return data, None
+    return data[:match.start(2)] + data[match.end(2):], match.group(2).decode('utf-8')
+
+
+def join_timestamp(data, generated_on):
+    if generated_on is None:
+        return data
+    match = _find_timestamp(data)
+    return data[:match.end(1)] + generated_on.encode('utf-8') + data[match.end(1):]
+
+
+def file_name(path):
+    """Name of a file in a run: its path relative to the repository root, with '/' separators"""
+    return os.path.relpath(path).replace(os.sep, '/')
+
+
+class BackupStore:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.runs_dir = os.path.join(root, 'runs')
+        self.index_path = os.path.join(root, 'index.json')
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def put_object(self, data):
+        """Store bytes once; returns (sha256, newly_written)"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(zlib.compress(data, 9))
+        os.replace(tmp_path, path)
+        return digest, True
+
+    def get_object(self, digest):
+        with open(self._object_path(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def load_index(self):
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['runs']
+
+    def _save_index(self, runs):
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump({'runs': runs}, f, indent=2)
+            f.write('\n')
+
+    def load_run(self, run_id):
+        path = os.path.join(self.runs_dir, f'{run_id}.json')
+        if not os.path.exists(path):
+            raise KeyError(f"Unknown backup run: {run_id}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def new_run_id(self):
+        """Timestamp run id; a second run within the same second gets a -2, -3, ... suffix"""
+        base = datetime.now().strftime(RUN_ID_FORMAT)
+        run_id, n = base, 2
+        while os.path.exists(os.path.join(self.runs_dir, f'{run_id}.json')):
+            run_id, n = f'{base}-{n}', n + 1
+        return run_id
+
+    def store(self, paths, run_id=None, label=None, names=None):
+        """Record one generation run: every file stored once, plus a manifest
+
+        Files are named by file_name(path) unless names maps the path to another name.
+        An explicit run_id replaces an earlier run with that id.
+        """
+        run_id = run_id or self.new_run_id()
+        names = names or {}
+        files = {}
+        new_objects = 0
+        new_bytes = 0
+
+        for path in sorted(paths):
+            with open(path, 'rb') as f:
+                data = f.read()
+            body, generated_on = split_timestamp(data)
+            if join_timestamp(body, generated_on) != data:
+                body, generated_on = data, None
+            digest, written = self.put_object(body)
+            if written:
+                new_objects += 1
+                new_bytes += os.path.getsize(self._object_path(digest))
+
+            entry = {'sha256': digest, 'size': len(data)}
+            if generated_on is not None:
+                entry['generated_on'] = generated_on
+            files[names.get(path) or file_name(path)] = entry
+
+        run = {
+            'run_id': run_id,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'label': label,
+            'files': files,
+        }
+        os.makedirs(self.runs_dir, exist_ok=True)
+        with open(os.path.join(self.runs_dir, f'{run_id}.json'), 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2)
+            f.write('\n')
+
+        runs = [r for r in self.load_index() if r['run_id'] != run_id]
+        runs.append({'run_id': run_id, 'created': run['created'], 'label': label,
+                     'files': len(files), 'new_objects': new_objects, 'new_bytes': new_bytes})
+        runs.sort(key=lambda r: r['run_id'])
+        self._save_index(runs)
+        return run, new_objects, new_bytes
+
+    def restore(self, run_id, target_dir='.', only=None):
+        """Write the files of an earlier run back out under target_dir (optionally just some of them)
+
+        only matches a file's full name or its basename.
+        """
+        run = self.load_run(run_id)
+        restored = []
+        for name, entry in run['files'].items():
+            if only and name not in only and os.path.basename(name) not in only:
+                continue
+            relative = name if '/' in name else f'{LEGACY_FILE_DIR}/{name}'
+            path = os.path.join(target_dir, *relative.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = join_timestamp(self.get_object(entry['sha256']), entry.get('generated_on'))
+            with open(path, 'wb') as f:
+                f.write(data)
+            restored.append(name)
+        return restored
+
+    def read_file(self, run_id, name):
+        entry = self.load_run(run_id)['files'][name]
+        return join_timestamp(self.get_object(entry['sha256']), entry.get('generated_on'))
+
+
+def collect_files(patterns=DEFAULT_PATTERNS):
+    paths = set()
+    for pattern in patterns:
+        paths.update(glob.glob(pattern))
+    return sorted(paths)
+
+
+def import_legacy(store, config_dir='src/config'):
+    """Move the old backup-<timestamp> directories' contents into the store"""
+    imported = []
+    for directory in sorted(glob.glob(os.path.join(config_dir, 'backup-*'))):
+        run_id = os.path.basename(directory)[len('backup-'):]
+        paths = [p for p in glob.glob(os.path.join(directory, '*')) if os.path.isfile(p)]
+        if paths:
+            # The directories held copies of src/config files
+            names = {p: file_name(os.path.join(config_dir, os.path.basename(p))) for p in paths}
+            store.store(paths, run_id=run_id, label='legacy ' + os.path.basename(directory), names=names)
+            imported.append(run_id)
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed backups of generated config files")
+    parser.add_argument('--store', default=STORE_DIR, help="store directory (default: src/config/backups)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_store = sub.add_parser('store', help="back up the current generated files as a new run")
+    p_store.add_argument('paths', nargs='*', help="files to back up (default: everything the generator writes)")
+    p_store.add_argument('--label', help="free-form note saved with the run")
+
+    sub.add_parser('list', help="list recorded runs")
+
+    p_restore = sub.add_parser('restore', help="restore the files of an earlier run")
+    p_restore.add_argument('run_id')
+    p_restore.add_argument('--to', default='.', help="repository root to restore into (default: .)")
+    p_restore.add_argument('files', nargs='*', help="restore only these files (path or file name)")
+
+    sub.add_parser('import-legacy', help="import src/config/backup-* directories as runs")
+
+    args = parser.parse_args()
+    store = BackupStore(args.store)
+
+    if args.command == 'store':
+        paths = args.paths or collect_files()
+        run, new_objects, new_bytes = store.store(paths, label=args.label)
+        print(f"Backup run {run['run_id']}: {len(run['files'])} files, "
+              f"{new_objects} new objects ({new_bytes / 1024:.1f} KB)")
+    elif args.command == 'list':
+        for run in store.load_index():
+            label = f"  {run['label']}" if run.get('label') else ''
+            print(f"{run['run_id']}  {run['files']:3d} files  +{run['new_objects']} objects{label}")
+    elif args.command == 'restore':
+        try:
+            restored = store.restore(args.run_id, args.to, set(args.files) or None)
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            sys.exit(1)
+        print(f"Restored {len(restored)} files from {args.run_id} into {args.to}")
+    elif args.command == 'import-legacy':
+        imported = import_legacy(store)
+        print(f"Imported {len(imported)} legacy backup directories")
+
+
+if __name__ == "__main__":
+    main()
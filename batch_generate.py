@@ -0,0 +1,190 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from generateFilters import FacilityFilterGenerator
+
+# Batch mode for FacilityFilterGenerator: generate several checklist revisions in
+# parallel, each into its own output directory (never src/config), then compare
+# per-facility question counts across the revisions.
+#
+#   <out>/<revision>/config/      facility modules, manifest, report, coverage matrix
+#   <out>/<revision>/checklist/   per-section checklist chunks
+#   <out>/<revision>/generation.log
+#   <out>/comparison_report.json / comparison_report.txt
+
+OUTPUT_DIR = os.path.join('.checklist_cache', 'revisions')
+DEFAULT_PATTERNS = ['checklist*.csv', os.path.join('src', 'config', 'checklist*.csv')]
+
+
+def discover_checklists(patterns=DEFAULT_PATTERNS):
+    paths = set()
+    for pattern in patterns:
+        paths.update(glob.glob(pattern))
+    return sorted(paths)
+
+
+def revision_name(csv_path):
+    """Directory-safe name for a checklist path ("checklist-final-old (2).csv" -> "checklist-final-old-2")"""
+    base = os.path.splitext(os.path.basename(csv_path))[0]
+    return re.sub(r'[^A-Za-z0-9._-]+', '-', base).strip('-') or 'checklist'
+
+
+def generate_revision(job):
+    """Worker: generate one checklist into its own directory; returns a summary dict"""
+    csv_path, out_dir = job
+    started = time.perf_counter()
+    generator = FacilityFilterGenerator(
+        csv_path,
+        config_dir=os.path.join(out_dir, 'config'),
+        chunks_dir=os.path.join(out_dir, 'checklist'),
+    )
+
+    os.makedirs(out_dir, exist_ok=True)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        ok = generator.run()
+    with open(os.path.join(out_dir, 'generation.log'), 'w', encoding='utf-8') as f:
+        f.write(log.getvalue())
+
+    counts = {}
+    for i, facility_type in enumerate(generator.facility_types):
+        counts[facility_type] = sum(
+            1 for q in generator.questions_data if i < len(q['applicability']) and q['applicability'][i]
+        )
+
+    return {
+        'csv': csv_path,
+        'revision': os.path.basename(out_dir),
+        'out_dir': out_dir,
+        'ok': ok,
+        'sha256': generator.checklist_hash,
+        'seconds': round(time.perf_counter() - started, 3),
+        'facility_types': generator.facility_types,
+        'sections': len(generator.sections),
+        'questions': len(generator.questions_data),
+        'counts': counts,
+    }
+
+
+def generate_all(csv_paths, out_root=OUTPUT_DIR, workers=None):
+    names = []
+    for path in csv_paths:
+        name = revision_name(path)
+        # Same base name in different directories (root vs src/config)
+        if name in names:
+            name = f"{name}-{len(names)}"
+        names.append(name)
+    jobs = [(path, os.path.join(out_root, name)) for path, name in zip(csv_paths, names)]
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [generate_revision(job) for job in jobs]
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # map() yields in submission order, keeping the report deterministic
+        return list(pool.map(generate_revision, jobs))
+
+
+def compare_revisions(results, baseline=0):
+    """Facility x revision question counts with deltas against the baseline revision"""
+    facility_types = []
+    for result in results:
+        for facility_type in result['facility_types']:
+            if facility_type not in facility_types:
+                facility_types.append(facility_type)
+
+    base = results[baseline]
+    rows = []
+    for facility_type in facility_types:
+        counts = [r['counts'].get(facility_type) for r in results]
+        base_count = base['counts'].get(facility_type)
+        deltas = [
+            None if c is None or base_count is None else c - base_count
+            for c in counts
+        ]
+        rows.append({'facility_type': facility_type, 'counts': counts, 'deltas': deltas})
+
+    return {
+        'baseline': base['revision'],
+        'revisions': [
+            {k: r[k] for k in ('revision', 'csv', 'ok', 'sha256', 'sections', 'questions', 'seconds', 'out_dir')}
+            for r in results
+        ],
+        'facilities': rows,
+    }
+
+
+def format_report(comparison):
+    revisions = comparison['revisions']
+    width = min(40, max([len('Facility type')] + [len(row['facility_type']) for row in comparison['facilities']])) + 2
+    col = 13
+
+    lines = [f"Checklist revision comparison (baseline: {comparison['baseline']})", ""]
+    for i, r in enumerate(revisions):
+        status = 'ok' if r['ok'] else 'FAILED'
+        lines.append(f"  [{i}] {r['revision']}: {r['csv']} ({status}, {r['sections']} sections, "
+                     f"{r['questions']} questions, {r['seconds']:.2f}s)")
+    lines.append("")
+
+    lines.append('Facility type'.ljust(width) + ''.join(f"[{i}]".rjust(col) for i in range(len(revisions))))
+    for row in comparison['facilities']:
+        cells = []
+        for count, delta in zip(row['counts'], row['deltas']):
+            if count is None:
+                cells.append('-'.rjust(col))
+            elif delta:
+                cells.append(f"{count} ({delta:+d})".rjust(col))
+            else:
+                cells.append(str(count).rjust(col))
+        lines.append(row['facility_type'][:width - 2].ljust(width) + ''.join(cells))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate several checklist revisions in parallel and compare them")
+    parser.add_argument('csv', nargs='*', help="checklist CSVs (default: checklist*.csv in the repo root and src/config)")
+    parser.add_argument('--out', default=OUTPUT_DIR, help=f"output root (default: {OUTPUT_DIR})")
+    parser.add_argument('--baseline', default='checklist-final.csv',
+                        help="checklist the deltas are computed against (default: checklist-final.csv, else the first)")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    csv_paths = args.csv or discover_checklists()
+    if not csv_paths:
+        print("❌ No checklist CSVs found")
+        sys.exit(1)
+    baseline = 0
+    if os.path.exists(args.baseline):
+        baseline = next((i for i, p in enumerate(csv_paths) if os.path.samefile(p, args.baseline)), 0)
+
+    print(f"Generating {len(csv_paths)} checklist revisions into {args.out}...")
+    results = generate_all(csv_paths, args.out, args.jobs)
+    comparison = compare_revisions(results, baseline)
+    report = format_report(comparison)
+    print(report)
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, 'comparison_report.json'), 'w', encoding='utf-8') as f:
+        json.dump(comparison, f, indent=2, ensure_ascii=False)
+    with open(os.path.join(args.out, 'comparison_report.txt'), 'w', encoding='utf-8') as f:
+        f.write(report + '\n')
+    print(f"\nReport saved to: {os.path.join(args.out, 'comparison_report.txt')}")
+
+    if not all(r['ok'] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
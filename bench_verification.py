@@ -0,0 +1,357 @@
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from checklist_inputs import CSV_PATH, METADATA_PATH, file_sha256, load_checklist
+from fix_near_misses import build_form_name_index, near_miss_key
+from generation_manifest import MANIFEST_PATH, load_manifest, questions_by_section
+from section_resolver import load_metadata
+from verify_all_sections_strict import build_dhis2_view, resolve_section_candidates, verify_section
+from verify_data_elements import build_dhis2_index, check_facility_type, form_name_elements
+
+# Scale benchmark for the metadata matching / verification code paths
+# (verify_all_sections_strict.py, verify_data_elements.py, fix_near_misses.py).
+#
+# The DHIS2 program stage is grown synthetically: every programStageDataElement,
+# its nested optionSet and every programStageSection (with its nested data
+# element copies) is cloned N times with fresh ids, in the shape written by
+# scripts/fetch-metadata.js. Copy 0 is the real export, so 1x is today's stage;
+# later copies carry suffixed names plus a share of near-miss variants (case and
+# spacing edits) so the near-miss indexes see realistic key collisions.
+#
+# The checklist side (CSV sections, generated facility modules) stays fixed, and
+# each scale runs the same phases:
+#
+#   load       json -> dict (section_resolver.load_metadata)
+#   index      SectionResolver + candidate map, form name index, near-miss key index
+#   exact      strict section resolution + set differences, exact module lookups
+#   near_miss  verify_section reports, verify_data_elements checks, near-miss key lookups
+#
+# Phases are timed (best of --repeat) and then re-run once under tracemalloc for
+# the peak memory each phase allocates. Every run is appended to
+# .checklist_cache/bench/results.jsonl and compared with the previous run.
+
+BENCH_DIR = os.path.join('.checklist_cache', 'bench')
+RESULTS_PATH = os.path.join(BENCH_DIR, 'results.jsonl')
+DEFAULT_SCALES = [1, 10, 100]
+PHASES = ['load', 'index', 'exact', 'near_miss']
+NEAR_MISS_SHARE = 0.1
+SEED = 2331
+
+_UID_CHARS = string.ascii_letters + string.digits
+
+
+def make_uid(rng):
+    """DHIS2-style uid: a letter followed by 10 alphanumerics"""
+    return rng.choice(string.ascii_letters) + ''.join(rng.choice(_UID_CHARS) for _ in range(10))
+
+
+def near_miss_variant(name, rng):
+    """Same near_miss_key as name, different text (case or spacing edits)"""
+    edits = [str.lower, str.upper, lambda s: s.replace(' ', '  ', 1), lambda s: s.replace(' ', '', 1)]
+    return rng.choice(edits)(name)
+
+
+def _rename(de, suffix, rng):
+    """Copy of a data element dict with new names (suffixed, or a near-miss variant)"""
+    renamed = dict(de)
+    near_miss = rng.random() < NEAR_MISS_SHARE
+    for field in ('name', 'shortName', 'formName', 'displayName', 'displayFormName', 'description'):
+        value = de.get(field)
+        if value:
+            renamed[field] = near_miss_variant(value, rng) if near_miss else f"{value} {suffix}"
+    return renamed
+
+
+def synthesize_metadata(metadata, scale, seed=SEED):
+    """Program stage with every data element, option set and section cloned `scale` times"""
+    if scale <= 1:
+        return metadata
+
+    rng = random.Random(seed)
+    psdes = list(metadata.get('programStageDataElements', []))
+    sections = list(metadata.get('programStageSections', []))
+
+    for copy_index in range(1, scale):
+        suffix = f"[{copy_index}]"
+        de_copies = {}
+        option_sets = {}
+
+        for psde in metadata.get('programStageDataElements', []):
+            de = psde.get('dataElement')
+            if not de:
+                continue
+            clone = _rename(de, suffix, rng)
+            clone['id'] = make_uid(rng)
+            if de.get('code'):
+                clone['code'] = f"{de['code']}-{copy_index}"
+            option_set = de.get('optionSet')
+            if option_set:
+                if option_set['id'] not in option_sets:
+                    option_sets[option_set['id']] = {
+                        **option_set,
+                        'id': make_uid(rng),
+                        'displayName': f"{option_set.get('displayName', '')} {suffix}",
+                        'options': [{**option, 'id': make_uid(rng)} for option in option_set.get('options', [])],
+                    }
+                clone['optionSet'] = option_sets[option_set['id']]
+            de_copies[de['id']] = clone
+            psdes.append({**psde, 'id': make_uid(rng), 'dataElement': clone,
+                          'sortOrder': len(psdes) + 1})
+
+        for section in metadata.get('programStageSections', []):
+            sections.append({
+                **section,
+                'id': make_uid(rng),
+                'name': f"{section.get('name', '')} {suffix}",
+                'displayName': f"{section.get('displayName', '')} {suffix}",
+                'sortOrder': len(sections),
+                # Section entries are full data element copies in the fetch-metadata.js shape
+                'dataElements': [
+                    {field: de_copies[d['id']].get(field, value) for field, value in d.items()}
+                    for d in section.get('dataElements', []) if d.get('id') in de_copies
+                ],
+            })
+
+    return {**metadata, 'programStageDataElements': psdes, 'programStageSections': sections}
+
+
+def synthetic_metadata_path(source_path, scale, seed=SEED, out_dir=BENCH_DIR, regenerate=False):
+    """Write (or reuse) the scaled metadata file; returns (path, stats)"""
+    os.makedirs(out_dir, exist_ok=True)
+    source_digest = file_sha256(source_path)
+    path = os.path.join(out_dir, f"metadata-x{scale}.json")
+    meta_path = path + '.meta.json'
+    wanted = {'source_sha256': source_digest, 'scale': scale, 'seed': seed}
+
+    if not regenerate and os.path.exists(path) and os.path.exists(meta_path):
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if all(meta.get(k) == v for k, v in wanted.items()):
+            return path, meta['stats']
+
+    metadata = synthesize_metadata(load_metadata(source_path), scale, seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False)
+    stats = {
+        'program_stage_data_elements': len(metadata.get('programStageDataElements', [])),
+        'sections': len(metadata.get('programStageSections', [])),
+        'section_data_elements': sum(len(s.get('dataElements', [])) for s in metadata.get('programStageSections', [])),
+        'option_sets': len({
+            psde['dataElement']['optionSet']['id']
+            for psde in metadata.get('programStageDataElements', [])
+            if psde.get('dataElement', {}).get('optionSet')
+        }),
+        'file_bytes': os.path.getsize(path),
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump({**wanted, 'stats': stats}, f, indent=2)
+    return path, stats
+
+
+def load_workload(csv_path=CSV_PATH, manifest_path=MANIFEST_PATH):
+    """Fixed checklist side: {'sections': {name: [questions]}, 'facilities': {module: {section: [questions]}}}"""
+    sections = {}
+    for q in load_checklist(csv_path)['questions']:
+        sections.setdefault(q['section'], []).append(q['question'].strip())
+
+    facilities = {}
+    manifest = load_manifest(manifest_path) or {}
+    for facility in manifest.get('facilities', []):
+        facilities[facility['module']] = questions_by_section(facility)
+    return {'sections': sections, 'facilities': facilities}
+
+
+def phase_load(state):
+    state['metadata'] = load_metadata(state['path'])
+
+
+def phase_index(state):
+    metadata = state['metadata']
+    state['resolver'], state['de_cand_map'] = build_dhis2_view(metadata)
+    state['dhis2_index'] = build_dhis2_index(form_name_elements(metadata))
+    state['global_index'], state['section_index'] = build_form_name_index(metadata)
+
+
+def phase_exact(state):
+    sections = {}
+    for name, questions in state['workload']['sections'].items():
+        dhis2_section, candidates = resolve_section_candidates(name, state['resolver'], state['de_cand_map'])
+        sections[name] = (dhis2_section, candidates, set(questions) - set(candidates))
+    exact = state['dhis2_index']['exact']
+    state['module_misses'] = sum(
+        1
+        for module in state['workload']['facilities'].values()
+        for questions in module.values()
+        for q in questions
+        if q.strip() not in exact
+    )
+    state['sections'] = sections
+
+
+def phase_near_miss(state):
+    reports = {}
+    for name, (dhis2_section, candidates, _) in state['sections'].items():
+        reports[name] = verify_section(name, state['workload']['sections'][name], dhis2_section, candidates)
+
+    index = state['dhis2_index']
+    buffer = io.StringIO()
+    for module, questions in state['workload']['facilities'].items():
+        check_facility_type(module, None, index['exact'], buffer, index['lower'], questions)
+
+    global_index = state['global_index']
+    state['near_hits'] = sum(
+        1 for questions in state['workload']['sections'].values() for q in questions
+        if near_miss_key(q) in global_index
+    )
+    state['reports'] = reports
+
+
+PHASE_FUNCTIONS = {'load': phase_load, 'index': phase_index, 'exact': phase_exact, 'near_miss': phase_near_miss}
+
+
+def run_phases(path, workload, trace_memory=False):
+    """{phase: seconds} or, with trace_memory, {phase: peak bytes allocated during the phase}"""
+    state = {'path': path, 'workload': workload}
+    results = {}
+    for phase in PHASES:
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        PHASE_FUNCTIONS[phase](state)
+        elapsed = time.perf_counter() - started
+        if trace_memory:
+            results[phase] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        else:
+            results[phase] = elapsed
+    return results
+
+
+def benchmark_scale(source_path, scale, workload, repeat=3, memory=True, regenerate=False):
+    path, stats = synthetic_metadata_path(source_path, scale, regenerate=regenerate)
+    timings = [run_phases(path, workload) for _ in range(max(1, repeat))]
+    peaks = run_phases(path, workload, trace_memory=True) if memory else {}
+    return {
+        'scale': scale,
+        'metadata': stats,
+        'phases': {
+            phase: {
+                'seconds': round(min(t[phase] for t in timings), 6),
+                'peak_bytes': peaks.get(phase),
+            }
+            for phase in PHASES
+        },
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_results(path=RESULTS_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_result(run, path=RESULTS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + '\n')
+
+
+def previous_scale(history, scale):
+    """Latest earlier result for the same scale, or None"""
+    for run in reversed(history):
+        for result in run['results']:
+            if result['scale'] == scale:
+                return result
+    return None
+
+
+def format_run(run, history):
+    lines = [f"Verification benchmark {run['timestamp']} (git {run['git'] or '?'}, Python {run['python']})", ""]
+    header = f"{'scale':>6} {'phase':<10} {'seconds':>10} {'vs prev':>9} {'peak MB':>9} {'vs prev':>9}"
+    for result in run['results']:
+        stats = result['metadata']
+        lines.append(f"{result['scale']}x: {stats['program_stage_data_elements']} PSDEs, {stats['sections']} sections, "
+                     f"{stats['option_sets']} option sets, {stats['file_bytes'] / 1e6:.1f} MB")
+    lines.append("")
+    lines.append(header)
+    lines.append('-' * len(header))
+    for result in run['results']:
+        before = previous_scale(history, result['scale'])
+        for phase in PHASES:
+            now = result['phases'][phase]
+            prev = before['phases'].get(phase) if before else None
+
+            def delta(key):
+                if not prev or not prev.get(key) or now.get(key) is None:
+                    return '-'
+                return f"{(now[key] - prev[key]) / prev[key] * 100:+.0f}%"
+
+            peak = f"{now['peak_bytes'] / 1e6:.1f}" if now['peak_bytes'] is not None else '-'
+            lines.append(f"{str(result['scale']) + 'x':>6} {phase:<10} {now['seconds']:>10.4f} {delta('seconds'):>9} "
+                         f"{peak:>9} {delta('peak_bytes'):>9}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark metadata matching and verification at synthetic scales")
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)),
+                        help="comma-separated metadata multipliers (default: 1,10,100)")
+    parser.add_argument('--metadata', default=METADATA_PATH, help="real program stage export to scale up")
+    parser.add_argument('--csv', default=CSV_PATH, help="checklist CSV for the fixed workload")
+    parser.add_argument('--repeat', type=int, default=3, help="timing runs per scale, best is kept (default: 3)")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--regenerate', action='store_true', help="rebuild the synthetic metadata files")
+    parser.add_argument('--results', default=RESULTS_PATH, help=f"results history (default: {RESULTS_PATH})")
+    parser.add_argument('--no-save', action='store_true', help="do not append this run to the history")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+    workload = load_workload(args.csv)
+    history = load_results(args.results)
+
+    results = []
+    for scale in scales:
+        print(f"Benchmarking {scale}x...", file=sys.stderr)
+        results.append(benchmark_scale(args.metadata, scale, workload, args.repeat, not args.no_memory,
+                                       args.regenerate))
+
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git': git_revision(),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'workload': {
+            'csv': args.csv,
+            'sections': len(workload['sections']),
+            'modules': len(workload['facilities']),
+        },
+        'results': results,
+    }
+    print(format_run(run, history))
+
+    if not args.no_save:
+        append_result(run, args.results)
+        print(f"\nResults appended to: {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from generateFilters import FacilityFilterGenerator
+from js_config_reader import read_all
+
+# Compares the CSV applicability matrix ("?" cells) against every generated facility
+# module in one pass. Replaces the single-column checks in verify_radiology.py /
+# check_csv.py and the hard-coded row dumps in scripts/check_hospital_applicability*.py.
+
+
+def load_expected(csv_path):
+    """Parse the CSV with the generator's own rules.
+
+    Returns (generator, expected) where expected[facility_index][section] is a
+    {question: [row numbers]} map of every row marked "?" for that facility.
+    """
+    generator = FacilityFilterGenerator(csv_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.parse_csv()
+
+    expected = [{} for _ in generator.facility_types]
+    for q in generator.questions_data:
+        section = generator.normalize_section_name(q['section'])
+        question = generator.sanitize_question(q['question'])
+        for i, applies in enumerate(q['applicability']):
+            if applies:
+                expected[i].setdefault(section, {}).setdefault(question, []).append(q['row_number'])
+    return generator, expected
+
+
+def compare_facility(expected_sections, emitted_sections):
+    """Set differences per section: rows marked "?" but not emitted, and the reverse"""
+    issues = {}
+    for section in sorted(set(expected_sections) | set(emitted_sections)):
+        expected = expected_sections.get(section, {})
+        emitted = set(emitted_sections.get(section, []))
+        missing = expected.keys() - emitted
+        extra = emitted - expected.keys()
+        if missing or extra:
+            issues[section] = {
+                'missing_from_module': sorted(
+                    ({'question': q, 'rows': expected[q]} for q in missing),
+                    key=lambda item: item['rows'][0]
+                ),
+                'not_marked_in_csv': sorted(extra),
+            }
+    return issues
+
+
+def check_all(csv_path='checklist-final.csv', config_dir='src/config', workers=None):
+    generator, expected = load_expected(csv_path)
+
+    modules = [os.path.join(config_dir, generator.sanitize_filename(ft)) for ft in generator.facility_types]
+    emitted = read_all([m for m in modules if os.path.exists(m)], workers=workers)
+
+    report = {}
+    for i, facility_type in enumerate(generator.facility_types):
+        module = modules[i]
+        if module not in emitted:
+            report[facility_type] = {'module': module, 'error': 'module not found'}
+            continue
+        report[facility_type] = {
+            'module': module,
+            'expected_questions': sum(len(qs) for qs in expected[i].values()),
+            'sections': compare_facility(expected[i], emitted[module] or {}),
+        }
+    return report
+
+
+def print_report(report):
+    failing = 0
+    for facility_type, result in report.items():
+        if 'error' in result:
+            failing += 1
+            print(f"❌ {facility_type}: {result['error']} ({result['module']})")
+            continue
+        if not result['sections']:
+            print(f"✅ {facility_type}: all {result['expected_questions']} applicable questions emitted")
+            continue
+
+        failing += 1
+        print(f"\n❌ {facility_type} ({result['module']})")
+        for section, issues in result['sections'].items():
+            print(f"  📂 {section}")
+            for item in issues['missing_from_module']:
+                rows = ', '.join(str(r) for r in item['rows'])
+                print(f"     - marked '?' (row {rows}) but not emitted: \"{item['question']}\"")
+            for question in issues['not_marked_in_csv']:
+                print(f"     + emitted but not marked '?': \"{question}\"")
+
+    print(f"\nFacility types checked: {len(report)}")
+    print(f"Facility types with differences: {failing}")
+    return failing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check CSV applicability against all generated facility modules")
+    parser.add_argument('--csv', default='checklist-final.csv', help="checklist CSV (default: checklist-final.csv)")
+    parser.add_argument('--config-dir', default='src/config', help="directory holding the generated modules")
+    parser.add_argument('--json', metavar='PATH', help="also write the report as JSON")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="worker processes for module parsing")
+    args = parser.parse_args(argv)
+
+    report = check_all(args.csv, args.config_dir, args.jobs)
+    failing = print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to: {args.json}")
+
+    return 1 if failing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from canonical_keys import clean_dhis2_name
+from generateFilters import COMMENT_FIELD_RE, FacilityFilterGenerator
+
+# Checks src/config/commentFieldPairs.js against the DHIS2 metadata it was built from:
+# the emitted pairs must match a fresh build, every pair must point at data elements
+# that exist in the program stage, and every Comments/Remarks field of the stage
+# (in a section or not) must be paired, so FormPage.jsx only falls back to its name
+# check for comment fields added to DHIS2 after the export.
+
+PAIR_RE = re.compile(r'^\s*"([^"]+)":\s*\[(null|"[^"]*"),\s*0x([0-9a-f]+)\]', re.MULTILINE)
+
+
+def read_emitted_pairs(path):
+    """{comment id: (main id or None, mask)} from a generated commentFieldPairs.js, or None when missing"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return {
+        de_id: (json.loads(main_id), int(mask, 16))
+        for de_id, main_id, mask in PAIR_RE.findall(content)
+    }
+
+
+def is_comment_field(de):
+    return bool(COMMENT_FIELD_RE.search(clean_dhis2_name(de.get('formName') or de.get('displayFormName')
+                                                         or de.get('displayName'))))
+
+
+def build_pairs(csv_path, metadata_path):
+    """(generator, metadata, pairs) with the facility filters built from csv_path as the generator does"""
+    generator = FacilityFilterGenerator(csv_path, metadata_path=metadata_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.parse_csv()
+        filter_configs = {}
+        for i, facility_type in enumerate(generator.facility_types):
+            config = generator.generate_facility_filter(i, facility_type)
+            if config:
+                filter_configs[facility_type] = config
+    metadata = generator.load_metadata()
+    if metadata is None:
+        return generator, None, {}
+    return generator, metadata, generator.build_comment_field_pairs(filter_configs, metadata)
+
+
+def check(csv_path='checklist-final.csv', metadata_path='dhis2_full_metadata_v2.json',
+          pairs_path='src/config/commentFieldPairs.js'):
+    generator, metadata, pairs = build_pairs(csv_path, metadata_path)
+    if metadata is None:
+        return {'error': f"metadata not found or unreadable: {metadata_path}"}
+
+    stage = {psde['dataElement']['id']: psde['dataElement']
+             for psde in metadata.get('programStageDataElements', []) if psde.get('dataElement')}
+    in_sections = {de['id']: de for s in metadata.get('programStageSections', []) for de in s.get('dataElements', [])}
+    stage_comments = {de_id for de_id, de in stage.items() if is_comment_field(de)}
+    section_comments = {de_id for de_id, de in in_sections.items() if is_comment_field(de)}
+
+    emitted = read_emitted_pairs(pairs_path)
+    problems = []
+    if emitted is None:
+        problems.append(f"{pairs_path} not found")
+    elif emitted != pairs:
+        stale = sorted(set(emitted) ^ set(pairs) | {k for k in set(emitted) & set(pairs) if emitted[k] != pairs[k]})
+        problems.append(f"{pairs_path} is stale: {len(stale)} entries differ from a fresh build "
+                        f"(regenerate with python src/config/generateFilters.py)")
+    for de_id, (main_id, _) in sorted(pairs.items()):
+        if de_id not in stage and de_id not in in_sections:
+            problems.append(f"comment field {de_id} is not in the program stage")
+        if main_id is not None and main_id not in in_sections and main_id not in stage:
+            problems.append(f"comment field {de_id}: main data element {main_id} is not in the program stage")
+        if main_id in pairs:
+            problems.append(f"comment field {de_id}: main data element {main_id} is itself a comment field")
+    for de_id in sorted((stage_comments | section_comments) - set(pairs)):
+        problems.append(f"comment field {de_id} is not paired")
+
+    return {
+        'facility_types': len(generator.facility_types),
+        'stage_comment_fields': len(stage_comments | section_comments),
+        'section_comment_fields': len(section_comments),
+        'paired': len(pairs),
+        'paired_with_main': sum(1 for main_id, _ in pairs.values() if main_id is not None),
+        'problems': problems,
+    }
+
+
+def print_report(report):
+    if 'error' in report:
+        print(f"❌ {report['error']}")
+        return 1
+
+    print(f"Comments/Remarks fields in the program stage: {report['stage_comment_fields']}")
+    print(f"  placed in a section: {report['section_comment_fields']}")
+    print(f"  paired: {report['paired']} ({report['paired_with_main']} with a main data element, "
+          f"{report['paired'] - report['paired_with_main']} standalone)")
+
+    for problem in report['problems']:
+        print(f"❌ {problem}")
+    if not report['problems']:
+        print("✅ commentFieldPairs.js matches the metadata")
+    return 1 if report['problems'] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check commentFieldPairs.js against the DHIS2 metadata")
+    parser.add_argument('--csv', default='checklist-final.csv', help="checklist CSV (default: checklist-final.csv)")
+    parser.add_argument('--metadata', default='dhis2_full_metadata_v2.json', help="DHIS2 program stage metadata JSON")
+    parser.add_argument('--pairs', default='src/config/commentFieldPairs.js', help="generated module to check")
+    args = parser.parse_args(argv)
+
+    return print_report(check(args.csv, args.metadata, args.pairs))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
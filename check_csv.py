@@ -1,5 +1,8 @@
 import csv
 
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from row_classifier import ROW_CLASSIFIER, clean_first_cell
+
 # Open and read the CSV file
 with open('checklist-final.csv', 'r', encoding='latin-1') as f:
     reader = csv.reader(f)
@@ -35,10 +38,8 @@ for i, row in enumerate(lines[1:], start=2):
     
     # If we found the section, process its rows
     if section_found:
-        # Check if we've hit the next section (all caps, no ?, length > 3)
-        if (first_col.isupper() and 
-            not first_col.endswith('?') and 
-            len(first_col) > 3):
+        # Check if we've hit the next section header
+        if ROW_CLASSIFIER.section_name(clean_first_cell(first_col)) is not None:
             print(f"\n✓ Next section found at row {i}: {first_col}")
             break
         
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Checklist tooling CLI
+
+One entry point for the parse / search / compare / verify / generate scripts that
+used to live as standalone files (read_tens*.py, find_*.py, compare_*.py,
+verify_*.py, extract_*.py). Subcommands import only what they need, so `--help`
+and simple lookups start quickly. sections, section, search, element, compare,
+query and serve read the checklist CSV and the DHIS2 metadata through
+checklist_inputs (parsed once per file and parser version, cached); verify,
+generate, fix and history run their own scripts, which read the files themselves.
+--csv/--metadata are passed on to every subcommand that reads them. The exit
+status is non-zero when a lookup finds nothing or a check fails.
+
+Usage:
+    python checklist_cli.py sections
+    python checklist_cli.py section "X-RAY ROOM" [--facility Radiology]
+    python checklist_cli.py search "records available"
+    python checklist_cli.py element hUes6rnPV8h
+    python checklist_cli.py compare "INSTRUMENT WASHING/STERILISING ROOM"
+    python checklist_cli.py verify strict|elements|applicability|comments [args...]
+    python checklist_cli.py generate [--csv checklist-final.csv]
+    python checklist_cli.py fix [args...]
+    python checklist_cli.py history "question" [args...]
+    python checklist_cli.py query only|exactly|all|any|none|every|unassigned|diff [facility types...]
+    python checklist_cli.py serve [--port 8765]
+"""
+
+import argparse
+import sys
+
+DEFAULT_CSV = 'checklist-final.csv'
+DEFAULT_METADATA = 'dhis2_full_metadata_v2.json'
+
+
+def _section_matches(name, wanted):
+    from section_resolver import compact_key, stripped_key
+    return compact_key(name) == compact_key(wanted) or stripped_key(name) == stripped_key(wanted)
+
+
+def cmd_sections(args):
+    from checklist_inputs import load_checklist
+
+    checklist = load_checklist(args.csv)
+    counts = {}
+    for q in checklist['questions']:
+        counts[q['section']] = counts.get(q['section'], 0) + 1
+
+    for section in checklist['sections']:
+        print(f"{counts.get(section, 0):5d}  {section}")
+    print(f"\n{len(checklist['sections'])} sections, {len(checklist['questions'])} questions, "
+          f"{len(checklist['facility_types'])} facility types")
+
+
+def cmd_section(args):
+    from checklist_inputs import load_checklist
+
+    checklist = load_checklist(args.csv)
+    facility_types = checklist['facility_types']
+
+    column = None
+    if args.facility:
+        matches = [i for i, ft in enumerate(facility_types) if ft.strip().lower() == args.facility.strip().lower()]
+        if not matches:
+            print(f"❌ Unknown facility type: {args.facility}")
+            print(f"   Known: {', '.join(facility_types)}")
+            return 1
+        column = matches[0]
+
+    found = False
+    for q in checklist['questions']:
+        if not _section_matches(q['section'], args.name):
+            continue
+        found = True
+        if column is not None and not q['applicability'][column]:
+            continue
+        applies = [ft for ft, flag in zip(facility_types, q['applicability']) if flag]
+        suffix = '' if column is not None else f"  [{len(applies)} facility types]"
+        print(f"Row {q['row_number']}: {q['question']}{suffix}")
+
+    if not found:
+        known = any(_section_matches(s, args.name) for s in checklist['sections'])
+        print(f"Section has no questions: {args.name}" if known else f"Section not found: {args.name}")
+        return 1
+
+
+def cmd_search(args):
+    from checklist_inputs import candidate_names, form_name, load_checklist, load_metadata_index
+
+    keyword = args.keyword.lower()
+
+    if not args.dhis2_only:
+        print("--- CSV ---")
+        for q in load_checklist(args.csv)['questions']:
+            if keyword in q['question'].lower():
+                print(f"Row {q['row_number']} [{q['section']}]: {q['question']}")
+
+    if not args.csv_only:
+        print("--- DHIS2 ---")
+        for de in load_metadata_index(args.metadata)['data_elements'].values():
+            if any(keyword in name.lower() for name in candidate_names(de)):
+                print(f"{de['id']}  {form_name(de)}")
+
+
+def cmd_element(args):
+    from checklist_inputs import candidate_names, load_metadata_index
+
+    index = load_metadata_index(args.metadata)
+    wanted = args.id_or_name.strip().lower()
+    matches = [
+        de for de in index['data_elements'].values()
+        if de['id'].lower() == wanted or any(n.lower() == wanted for n in candidate_names(de))
+    ]
+    if not matches:
+        print(f"No data element matches: {args.id_or_name}")
+        return 1
+
+    for de in matches:
+        sections = [
+            s['displayName'] or s['name'] for s in index['sections']
+            if any(d['id'] == de['id'] for d in s['dataElements'])
+        ]
+        for field, value in de.items():
+            if value:
+                print(f"{field}: {value}")
+        print(f"sections: {sections}")
+        print("-" * 40)
+
+
+def cmd_compare(args):
+    from checklist_inputs import candidate_names, load_checklist, load_metadata_index
+    from section_resolver import SectionResolver, load_aliases
+    from verify_all_sections_strict import resolve_section_candidates, verify_section
+
+    questions = [q['question'].strip() for q in load_checklist(args.csv)['questions']
+                 if _section_matches(q['section'], args.section)]
+    if not questions:
+        print(f"Section not found in CSV (or has no questions): {args.section}")
+        return 1
+
+    index = load_metadata_index(args.metadata)
+    resolver = SectionResolver(index['sections'], load_aliases())
+    de_cand_map = {de_id: candidate_names(de) for de_id, de in index['data_elements'].items()}
+
+    dhis2_section, candidates = resolve_section_candidates(args.section, resolver, de_cand_map)
+    result = verify_section(args.section, questions, dhis2_section, candidates)
+
+    print(f"Found {len(questions)} questions in CSV for '{args.section}'")
+    if result['status'] == 'ok':
+        print("\nPERFECT STRICT MATCH! All CSV elements have an exact match in DHIS2.")
+    for line in result['lines']:
+        print(line)
+    return 0 if result['status'] == 'ok' else 1
+
+
+def cmd_verify(args):
+    if args.check == 'strict':
+        from verify_all_sections_strict import verify_all_sections
+        ok = verify_all_sections(full='--full' in args.args, csv_path=args.csv, metadata_path=args.metadata)
+        return 0 if ok else 1
+    if args.check == 'elements':
+        # Checks the generated modules, which already reflect the CSV they came from
+        from verify_data_elements import main
+        return main(args.args)
+    if args.check == 'applicability':
+        from check_applicability_matrix import main
+        # An explicit --csv after the check name still wins (argparse keeps the last value)
+        return main(['--csv', args.csv] + args.args)
+    if args.check == 'comments':
+        from check_comment_field_pairs import main
+        return main(['--csv', args.csv, '--metadata', args.metadata] + args.args)
+
+
+def cmd_generate(args):
+    import config_path  # noqa: F401  (puts src/config on sys.path)
+    from generateFilters import FacilityFilterGenerator
+
+    return 0 if FacilityFilterGenerator(args.csv).run() else 1
+
+
+def cmd_fix(args):
+    from fix_near_misses import main
+    return main(['--csv', args.csv, '--metadata', args.metadata] + args.args)
+
+
+def cmd_history(args):
+    from filter_history import main
+    return main(args.args)
+
+
+def cmd_query(args):
+    from applicability_query import main
+    return main(args.args + ['--csv', args.csv])
+
+
+def cmd_serve(args):
+    from checklist_server import main
+    main(['--csv', args.csv, '--metadata', args.metadata] + args.args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='checklist_cli.py', description="Checklist / DHIS2 metadata tooling")
+    parser.add_argument('--csv', default=DEFAULT_CSV, help="checklist CSV (default: checklist-final.csv)")
+    parser.add_argument('--metadata', default=DEFAULT_METADATA, help="DHIS2 program stage metadata JSON")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('sections', help="list CSV sections with question counts")
+    p.set_defaults(func=cmd_sections)
+
+    p = sub.add_parser('section', help="show the questions of one CSV section")
+    p.add_argument('name')
+    p.add_argument('--facility', help="only rows marked '?' for this facility type")
+    p.set_defaults(func=cmd_section)
+
+    p = sub.add_parser('search', help="keyword search over CSV questions and DHIS2 data elements")
+    p.add_argument('keyword')
+    group = p.add_mutually_exclusive_group()
+    group.add_argument('--csv-only', action='store_true')
+    group.add_argument('--dhis2-only', action='store_true')
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser('element', help="look up a DHIS2 data element by id or name")
+    p.add_argument('id_or_name')
+    p.set_defaults(func=cmd_element)
+
+    p = sub.add_parser('compare', help="strict CSV vs DHIS2 comparison of one section")
+    p.add_argument('section')
+    p.set_defaults(func=cmd_compare)
+
+    p = sub.add_parser('verify', help="run a verifier (extra args are passed through)")
+    p.add_argument('check', choices=['strict', 'elements', 'applicability', 'comments'])
+    p.add_argument('args', nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_verify)
+
+    p = sub.add_parser('generate', help="regenerate the facility filter modules")
+    p.set_defaults(func=cmd_generate)
+
+    p = sub.add_parser('fix', help="preview/apply near-miss fixes (see fix_near_misses.py)")
+    p.add_argument('args', nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_fix)
+
+    p = sub.add_parser('history', help="question history across generations (see filter_history.py)")
+    p.add_argument('args', nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_history)
+
+    p = sub.add_parser('query', help="applicability set algebra (see applicability_query.py)")
+    p.add_argument('args', nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser('serve', help="resident HTTP query server (see checklist_server.py)")
+    p.add_argument('args', nargs=argparse.REMAINDER)
+    p.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    # REMAINDER does not pick up leading options ("fix --apply"), so pass-through
+    # subcommands collect whatever the top-level parser didn't recognise
+    args, extra = parser.parse_known_args(argv)
+    if extra:
+        if not hasattr(args, 'args'):
+            parser.error(f"unrecognized arguments: {' '.join(extra)}")
+        args.args = extra + args.args
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import contextlib
+import functools
+import hashlib
+import io
+import os
+import pickle
+
+from config_path import CONFIG_DIR  # also puts src/config on sys.path
+
+# Parsed checklist CSV and DHIS2 metadata shared by the checklist tools.
+#
+# Both loaders are memoized in-process and cached on disk under .checklist_cache/,
+# keyed by the sha256 of the source file and of the code that parses it, so a tool
+# only pays for parsing the CSV or the 4 MB metadata JSON the first time a given
+# version is seen, and a parser or classifier change never serves a stale result.
+
+CSV_PATH = 'checklist-final.csv'
+METADATA_PATH = 'dhis2_full_metadata_v2.json'
+CACHE_DIR = '.checklist_cache'
+CACHE_VERSION = 2
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Code the cached structures are built with
+PARSER_SOURCES = [
+    os.path.join(ROOT_DIR, 'checklist_inputs.py'),
+    os.path.join(ROOT_DIR, 'section_resolver.py'),
+    os.path.join(CONFIG_DIR, 'generateFilters.py'),
+    os.path.join(CONFIG_DIR, 'checklist_pipeline.py'),
+    os.path.join(CONFIG_DIR, 'row_classifier.py'),
+    os.path.join(CONFIG_DIR, 'canonical_keys.py'),
+]
+
+# Data element fields kept in the metadata index
+DATA_ELEMENT_FIELDS = ['id', 'code', 'name', 'shortName', 'formName', 'displayFormName', 'displayName', 'valueType']
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def parser_digest():
+    digest = hashlib.sha256()
+    for path in PARSER_SOURCES:
+        digest.update(file_sha256(path).encode('ascii'))
+    return digest.hexdigest()
+
+
+def _cached(kind, path, build):
+    digest = file_sha256(path)
+    parser = parser_digest()
+    cache_path = os.path.join(CACHE_DIR, f"{kind}-{hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:12]}.pickle")
+
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if (cached.get('version') == CACHE_VERSION and cached.get('sha256') == digest
+                    and cached.get('parser') == parser):
+                return cached['data']
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            pass
+
+    data = build(path)
+    data['sha256'] = digest
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'version': CACHE_VERSION, 'sha256': digest, 'parser': parser, 'data': data}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return data
+
+
+def _parse_checklist(csv_path):
+    from generateFilters import FacilityFilterGenerator
+
+    generator = FacilityFilterGenerator(csv_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.parse_csv()
+
+    return {
+        'source': csv_path,
+        'facility_types': generator.facility_types,
+        'sections': [generator.normalize_section_name(s) for s in generator.sections],
+        'questions': [
+            {
+                'section': generator.normalize_section_name(q['section']),
+                'question': q['question'],
+                'applicability': q['applicability'],
+                'row_number': q['row_number'],
+            }
+            for q in generator.questions_data
+        ],
+    }
+
+
+def _parse_metadata(metadata_path):
+    from section_resolver import load_metadata
+
+    metadata = load_metadata(metadata_path) or {}
+    data_elements = {}
+    for psde in metadata.get('programStageDataElements', []):
+        de = psde.get('dataElement')
+        if de and 'id' in de:
+            data_elements[de['id']] = {field: de.get(field) for field in DATA_ELEMENT_FIELDS}
+
+    sections = [
+        {
+            'id': s.get('id'),
+            'name': s.get('name'),
+            'displayName': s.get('displayName'),
+            'dataElements': [{'id': d.get('id')} for d in s.get('dataElements', [])],
+        }
+        for s in metadata.get('programStageSections', [])
+    ]
+
+    return {
+        'source': metadata_path,
+        'program_stage': {'id': metadata.get('id'), 'name': metadata.get('name')},
+        'data_elements': data_elements,
+        'sections': sections,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def load_checklist(csv_path=CSV_PATH):
+    """{'facility_types', 'sections', 'questions': [{section, question, applicability, row_number}]}
+
+    Parsed with FacilityFilterGenerator's rules, so every tool sees the same structure
+    the generated filters were built from.
+    """
+    return _cached('checklist', csv_path, _parse_checklist)
+
+
+@functools.lru_cache(maxsize=None)
+def load_metadata_index(metadata_path=METADATA_PATH):
+    """{'program_stage', 'data_elements': {id: fields}, 'sections': [{id, name, displayName, dataElements}]}"""
+    return _cached('metadata', metadata_path, _parse_metadata)
+
+
+def form_name(de):
+    # App logic: formName || displayFormName || name (displayName)
+    return de.get('formName') or de.get('displayFormName') or de.get('displayName') or de.get('name') or ''
+
+
+def candidate_names(de):
+    return [n.strip() for n in (de.get('formName'), de.get('displayFormName'), de.get('displayName'), de.get('name')) if n]
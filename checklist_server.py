@@ -0,0 +1,340 @@
+import argparse
+import bisect
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from checklist_inputs import CSV_PATH, METADATA_PATH, candidate_names, form_name, load_checklist, load_metadata_index
+from section_resolver import SectionResolver, compact_key, load_aliases, stripped_key
+
+# Resident query service for the checklist CSV and the DHIS2 metadata.
+#
+# Both files are parsed once (through checklist_inputs, so a warm .checklist_cache
+# makes startup fast) and turned into lookup tables that stay in memory; every
+# query is then a dict lookup or a scan over pre-lowered strings. A watcher thread
+# polls the two files' mtimes and swaps in a freshly built index when either changes.
+#
+#   GET /sections                                  section names with question counts
+#   GET /section?name=X-RAY ROOM[&facility=Hospital]
+#   GET /applicability?facility=Hospital[&section=...]
+#   GET /applicability?question=<exact text>       facility types a question applies to
+#   GET /element?id=hUes6rnPV8h  |  /element?name=<form name>
+#   GET /search?q=records available[&limit=50]
+#   GET /status                                    load time, file versions, reload count
+
+
+class ChecklistIndex:
+    """In-memory lookup tables built from one version of the CSV and the metadata"""
+
+    def __init__(self, checklist, metadata):
+        self.checklist_sha256 = checklist['sha256']
+        self.metadata_sha256 = metadata['sha256']
+        self.facility_types = checklist['facility_types']
+        self.facility_columns = {ft.strip().lower(): i for i, ft in enumerate(self.facility_types)}
+
+        # CSV sections by compact and prefix-stripped keys
+        self.sections = {}
+        self.section_keys = {}
+        for name in checklist['sections']:
+            self.sections.setdefault(name, [])
+            self.section_keys.setdefault(compact_key(name), name)
+            self.section_keys.setdefault(stripped_key(name), name)
+
+        self.questions_by_text = {}
+        for q in checklist['questions']:
+            entry = {
+                'section': q['section'],
+                'question': q['question'],
+                'row_number': q['row_number'],
+                'facility_types': [ft for ft, flag in zip(self.facility_types, q['applicability']) if flag],
+                'columns': frozenset(i for i, flag in enumerate(q['applicability']) if flag),
+            }
+            self.sections.setdefault(q['section'], []).append(entry)
+            self.questions_by_text.setdefault(q['question'].strip().lower(), []).append(entry)
+
+        # DHIS2 data elements by id and by every candidate name
+        self.data_elements = metadata['data_elements']
+        self.elements_by_name = {}
+        for de_id, de in self.data_elements.items():
+            for name in candidate_names(de):
+                ids = self.elements_by_name.setdefault(name.lower(), [])
+                if de_id not in ids:
+                    ids.append(de_id)
+
+        self.dhis2_resolver = SectionResolver(metadata['sections'], load_aliases())
+        self.element_sections = {}
+        for s in metadata['sections']:
+            for d in s['dataElements']:
+                self.element_sections.setdefault(d['id'], []).append(s['displayName'] or s['name'])
+
+        # Keyword search runs str.find over one pre-lowered blob (one line per item);
+        # match offsets map back to items by bisecting the line start offsets
+        items = [('csv', entry) for entries in self.sections.values() for entry in entries]
+        items.extend(('dhis2', de_id) for de_id in self.data_elements)
+        lines = [
+            (item['question'] if kind == 'csv' else ' | '.join(candidate_names(self.data_elements[item])))
+            .lower().replace('\n', ' ')
+            for kind, item in items
+        ]
+        self.search_items = items
+        self.search_blob = '\n'.join(lines)
+        self.search_starts = []
+        offset = 0
+        for line in lines:
+            self.search_starts.append(offset)
+            offset += len(line) + 1
+
+    def _section_name(self, name):
+        return self.section_keys.get(compact_key(name)) or self.section_keys.get(stripped_key(name))
+
+    def _column(self, facility):
+        return self.facility_columns.get((facility or '').strip().lower())
+
+    @staticmethod
+    def _public(entry):
+        return {k: v for k, v in entry.items() if k != 'columns'}
+
+    def _element(self, de_id):
+        de = self.data_elements[de_id]
+        return dict(de, form_name=form_name(de), sections=self.element_sections.get(de_id, []))
+
+    def list_sections(self):
+        return [{'section': name, 'questions': len(entries)} for name, entries in self.sections.items()]
+
+    def section(self, name, facility=None):
+        section = self._section_name(name)
+        if section is None:
+            raise LookupError(f"Section not found: {name}")
+        entries = self.sections[section]
+        if facility:
+            column = self._column(facility)
+            if column is None:
+                raise LookupError(f"Unknown facility type: {facility}")
+            entries = [e for e in entries if column in e['columns']]
+
+        resolved = self.dhis2_resolver.resolve(section)
+        return {
+            'section': section,
+            'dhis2_section': self.dhis2_resolver.display_name(resolved) if resolved else None,
+            'questions': [self._public(e) for e in entries],
+        }
+
+    def applicability(self, facility=None, section=None, question=None):
+        if question:
+            matches = self.questions_by_text.get(question.strip().lower())
+            if not matches:
+                raise LookupError(f"Question not found: {question}")
+            return {'question': question, 'rows': [self._public(e) for e in matches]}
+
+        column = self._column(facility)
+        if column is None:
+            raise LookupError(f"Unknown facility type: {facility}")
+        names = [self._section_name(section)] if section else list(self.sections)
+        if None in names:
+            raise LookupError(f"Section not found: {section}")
+
+        result = {}
+        for name in names:
+            questions = [e['question'] for e in self.sections[name] if column in e['columns']]
+            if questions:
+                result[name] = questions
+        return {'facility_type': self.facility_types[column], 'sections': result}
+
+    def element(self, de_id=None, name=None):
+        if de_id:
+            if de_id not in self.data_elements:
+                raise LookupError(f"Unknown data element id: {de_id}")
+            return [self._element(de_id)]
+        ids = self.elements_by_name.get((name or '').strip().lower())
+        if not ids:
+            raise LookupError(f"No data element named: {name}")
+        return [self._element(i) for i in ids]
+
+    def search(self, keyword, limit=100):
+        needle = keyword.lower().replace('\n', ' ')
+        blob, starts = self.search_blob, self.search_starts
+        csv_hits, dhis2_hits = [], []
+        totals = {'csv': 0, 'dhis2': 0}
+        pos = blob.find(needle)
+        while pos != -1:
+            line = bisect.bisect_right(starts, pos) - 1
+            kind, item = self.search_items[line]
+            totals[kind] += 1
+            if kind == 'csv' and len(csv_hits) < limit:
+                csv_hits.append(self._public(item))
+            elif kind == 'dhis2' and len(dhis2_hits) < limit:
+                dhis2_hits.append({'id': item, 'form_name': form_name(self.data_elements[item])})
+            # Next match must start on a later line: each item is reported once
+            next_line = line + 1
+            if next_line >= len(starts):
+                break
+            pos = blob.find(needle, starts[next_line])
+        return {'csv': csv_hits, 'dhis2': dhis2_hits, 'total': totals}
+
+
+class ResidentIndex:
+    """Holds the current ChecklistIndex and rebuilds it when a source file changes"""
+
+    def __init__(self, csv_path=CSV_PATH, metadata_path=METADATA_PATH):
+        self.csv_path = csv_path
+        self.metadata_path = metadata_path
+        self.lock = threading.Lock()
+        self.reloads = 0
+        self.index = None
+        self.mtimes = None
+        self.loaded_at = None
+        self.load_seconds = None
+        self.reload()
+
+    def _current_mtimes(self):
+        return (os.path.getmtime(self.csv_path), os.path.getmtime(self.metadata_path))
+
+    def reload(self):
+        started = time.perf_counter()
+        mtimes = self._current_mtimes()
+        # load_* are memoized per path; bypass that so a changed file is re-read
+        checklist = load_checklist.__wrapped__(self.csv_path)
+        metadata = load_metadata_index.__wrapped__(self.metadata_path)
+        index = ChecklistIndex(checklist, metadata)
+        with self.lock:
+            self.index = index
+            self.mtimes = mtimes
+            self.loaded_at = time.strftime('%Y-%m-%d %H:%M:%S')
+            self.load_seconds = time.perf_counter() - started
+            self.reloads += 1
+
+    def check(self):
+        """Reload if either file changed; returns True when a new index was swapped in"""
+        try:
+            mtimes = self._current_mtimes()
+        except OSError:
+            return False
+        if mtimes == self.mtimes:
+            return False
+        try:
+            self.reload()
+        except Exception as e:
+            # Keep serving the previous index while a file is half-written or broken
+            print(f"⚠️  Reload failed, keeping previous index: {e}")
+            self.mtimes = mtimes
+            return False
+        print(f"🔄 Reloaded in {self.load_seconds:.2f}s")
+        return True
+
+    def watch(self, interval):
+        def loop():
+            while True:
+                time.sleep(interval)
+                self.check()
+        thread = threading.Thread(target=loop, name='checklist-watcher', daemon=True)
+        thread.start()
+        return thread
+
+    def status(self):
+        index = self.index
+        return {
+            'csv': self.csv_path,
+            'csv_sha256': index.checklist_sha256,
+            'metadata': self.metadata_path,
+            'metadata_sha256': index.metadata_sha256,
+            'loaded_at': self.loaded_at,
+            'load_seconds': round(self.load_seconds, 3),
+            'loads': self.reloads,
+            'sections': len(index.sections),
+            'data_elements': len(index.data_elements),
+        }
+
+
+def handle_query(resident, path, params):
+    """Dispatch one query; returns (status, payload)"""
+    index = resident.index
+
+    def arg(name):
+        return params.get(name, [None])[0]
+
+    try:
+        if path == '/sections':
+            return 200, index.list_sections()
+        if path == '/section':
+            if not arg('name'):
+                return 400, {'error': "missing 'name'"}
+            return 200, index.section(arg('name'), arg('facility'))
+        if path == '/applicability':
+            if not (arg('facility') or arg('question')):
+                return 400, {'error': "need 'facility' or 'question'"}
+            return 200, index.applicability(arg('facility'), arg('section'), arg('question'))
+        if path == '/element':
+            if not (arg('id') or arg('name')):
+                return 400, {'error': "need 'id' or 'name'"}
+            return 200, index.element(arg('id'), arg('name'))
+        if path == '/search':
+            if not arg('q'):
+                return 400, {'error': "missing 'q'"}
+            return 200, index.search(arg('q'), int(arg('limit') or 100))
+        if path == '/status':
+            return 200, resident.status()
+    except LookupError as e:
+        return 404, {'error': str(e)}
+    except ValueError as e:
+        return 400, {'error': str(e)}
+    return 404, {'error': f"Unknown endpoint: {path}"}
+
+
+def make_handler(resident):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            started = time.perf_counter()
+            status, payload = handle_query(resident, url.path, parse_qs(url.query))
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('X-Query-Time-Ms', f"{(time.perf_counter() - started) * 1000:.3f}")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if not self.server.quiet:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def serve(host='127.0.0.1', port=8765, csv_path=CSV_PATH, metadata_path=METADATA_PATH, interval=1.0, quiet=False):
+    resident = ResidentIndex(csv_path, metadata_path)
+    status = resident.status()
+    print(f"📚 Loaded {status['sections']} sections and {status['data_elements']} data elements "
+          f"in {status['load_seconds']:.2f}s")
+
+    resident.watch(interval)
+    server = ThreadingHTTPServer((host, port), make_handler(resident))
+    server.quiet = quiet
+    print(f"🚀 Serving on http://{host}:{port}/ (watching for changes every {interval:g}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resident query server for the checklist CSV and DHIS2 metadata")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--csv', default=CSV_PATH, help="checklist CSV (default: checklist-final.csv)")
+    parser.add_argument('--metadata', default=METADATA_PATH, help="DHIS2 program stage metadata JSON")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between file change checks")
+    parser.add_argument('--quiet', action='store_true', help="don't log each request")
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, args.csv, args.metadata, args.interval, args.quiet)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,29 @@
-import csv
 import json
-import re
 
-def normalize_name(name):
-    return name.strip() if name else ""
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from section_resolver import normalize_name
+from row_classifier import QUESTION, ROW_CLASSIFIER, SECTION, read_checklist_rows
 
 def compare_personnel():
     print("Starting Strict Comparison for 'PERSONNEL'")
     
     csv_questions = []
     target_section = "PERSONNEL"
-    in_target_section = False
-    
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-    lines = None
 
-    for encoding in encodings:
-        try:
-            with open('checklist-final.csv', 'r', encoding=encoding) as f:
-                reader = csv.reader(f)
-                lines = list(reader)
-            print(f"Successfully read CSV with {encoding} encoding")
-            break
-        except UnicodeDecodeError:
-            continue
-    
+    lines = read_checklist_rows('checklist-final.csv')
     if not lines:
         print("Failed to read CSV")
         return
 
-    try:
-        for row in lines[2:]:
-            if not row or not row[0]: continue
-            col1 = row[0].strip()
-            
-            is_section_format = (len(row) > 10 and all(not c.strip() for c in row[1:10]))
-            
-            if col1 == target_section:
-                in_target_section = True
-            elif is_section_format and col1 != target_section and in_target_section:
-                 # Check if it's really a new section or just a subsection like "Pharmacist"
-                 # Personnel often has subsections. We only stop if it's a MAIN section.
-                 # For now, let's assume ALL CAPS items in col1 are sections if they match specific patterns
-                 if col1.isupper() and len(col1) > 3:
-                     in_target_section = False
-            
-            if in_target_section and (col1.endswith('?') or col1 == "Other (specify)"):
-                 # Special case for Personnel which might have items without ? like "Other (specify)"
-                csv_questions.append(normalize_name(col1))
-            elif in_target_section and any(c.strip() == '?' for c in row[1:]):
-                csv_questions.append(normalize_name(col1))
-                    
-        print(f"Found {len(csv_questions)} questions in CSV for '{target_section}'")
-    except Exception as e:
-        print(f"Error parsing CSV data: {e}")
-        return
+    # Sections and questions as the generator sees them
+    for _, flags, section, col1, _ in ROW_CLASSIFIER.iter_rows(lines[2:]):
+        if flags == SECTION or section is None or normalize_name(section) != target_section:
+            continue
+        # Personnel also lists items without ? like "Other (specify)"
+        if flags & QUESTION or col1 == "Other (specify)":
+            csv_questions.append(normalize_name(col1))
+
+    print(f"Found {len(csv_questions)} questions in CSV for '{target_section}'")
 
     # 2. Parse DHIS2 Metadata
     dhis2_questions = []
@@ -1,56 +1,28 @@
-import csv
 import json
-import re
 
-def normalize_name(name):
-    return name.strip() if name else ""
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from section_resolver import normalize_name
+from row_classifier import QUESTION, ROW_CLASSIFIER, SECTION, read_checklist_rows
 
 def compare_sluice_room():
     print("Starting Strict Comparison for 'SLUICE ROOM'")
     
     csv_questions = []
     target_section = "SLUICE ROOM"
-    in_target_section = False
-    
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-    lines = None
 
-    for encoding in encodings:
-        try:
-            with open('checklist-final.csv', 'r', encoding=encoding) as f:
-                reader = csv.reader(f)
-                lines = list(reader)
-            print(f"Successfully read CSV with {encoding} encoding")
-            break
-        except UnicodeDecodeError:
-            continue
-    
+    lines = read_checklist_rows('checklist-final.csv')
     if not lines:
         print("Failed to read CSV")
         return
 
-    try:
-        for row in lines[2:]:
-            if not row or not row[0]: continue
-            col1 = row[0].strip()
-            
-            is_section_format = (len(row) > 10 and all(not c.strip() for c in row[1:10]))
-            has_question_mark = col1.endswith('?') or any(c.strip() == '?' for c in row[1:])
-            
-            if col1 and not has_question_mark and (col1.isupper() or is_section_format or col1.endswith('--')):
-                current_section = normalize_name(re.sub(r'\s*-\s*', '-', col1))
-                if current_section == target_section:
-                    in_target_section = True
-                else:
-                    in_target_section = False
-            
-            elif in_target_section and has_question_mark:
-                csv_questions.append(normalize_name(col1))
-                    
-        print(f"Found {len(csv_questions)} questions in CSV for '{target_section}'")
-    except Exception as e:
-        print(f"Error parsing CSV data: {e}")
-        return
+    # Sections and questions as the generator sees them
+    for _, flags, section, col1, _ in ROW_CLASSIFIER.iter_rows(lines[2:]):
+        if flags == SECTION or section is None or normalize_name(section) != target_section:
+            continue
+        if flags & QUESTION:
+            csv_questions.append(normalize_name(col1))
+
+    print(f"Found {len(csv_questions)} questions in CSV for '{target_section}'")
 
     # 2. Parse DHIS2 Metadata
     dhis2_questions = []
@@ -1,11 +1,8 @@
-import csv
 import json
-import re
 
-def normalize_name(name):
-    # Strictly return the name as is for "exact matching"
-    # Only stripping outer whitespace which is usually a file-reading artifact
-    return name.strip() if name else ""
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from section_resolver import normalize_name
+from row_classifier import QUESTION, ROW_CLASSIFIER, SECTION, read_checklist_rows
 
 def compare_ultrasound_room():
     print("Starting Strict Comparison for 'ULTRASOUND ROOM'")
@@ -13,49 +10,20 @@ def compare_ultrasound_room():
     # 1. Parse CSV
     csv_questions = []
     target_section = "ULTRASOUND ROOM"
-    in_target_section = False
-    
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-    lines = None
 
-    for encoding in encodings:
-        try:
-            with open('checklist-final.csv', 'r', encoding=encoding) as f:
-                reader = csv.reader(f)
-                lines = list(reader)
-            print(f"Successfully read CSV with {encoding} encoding")
-            break
-        except UnicodeDecodeError:
-            continue
-    
+    lines = read_checklist_rows('checklist-final.csv')
     if not lines:
-        print("Failed to read CSV with any supported encoding")
+        print("Failed to read CSV")
         return
 
-    try:
-        # lines is a list of lists.
-        # Skip header 1 and header 2
-        
-        for row in lines[2:]:
-            if not row or not row[0]: continue
-            
-            col1 = row[0].strip()
-            # Check for section header
-            if col1.isupper() and len(col1) > 3 and not col1.endswith('?'):
-                current_section = re.sub(r'\s*-\s*', '-', col1)
-                if normalize_name(current_section) == normalize_name(target_section):
-                    in_target_section = True
-                else:
-                    in_target_section = False
-            
-            # If inside target section, collect questions
-            elif in_target_section and (col1.endswith('?') or any(c.strip() == '?' for c in row[1:])):
-                csv_questions.append(normalize_name(col1))
-                    
-        print(f"Found {len(csv_questions)} questions in CSV for '{target_section}'")
-    except Exception as e:
-        print(f"Error parsing CSV data: {e}")
-        return
+    # Sections and questions as the generator sees them
+    for _, flags, section, col1, _ in ROW_CLASSIFIER.iter_rows(lines[2:]):
+        if flags == SECTION or section is None or normalize_name(section) != target_section:
+            continue
+        if flags & QUESTION:
+            csv_questions.append(normalize_name(col1))
+
+    print(f"Found {len(csv_questions)} questions in CSV for '{target_section}'")
 
     # 2. Parse DHIS2 Metadata
     dhis2_questions = []
@@ -0,0 +1,16 @@
+import os
+import sys
+
+# Makes the modules in src/config (canonical_keys, row_classifier,
+# checklist_pipeline, generateFilters) importable from the root-level tools.
+# Import it before any of them:
+#
+#     import config_path  # noqa: F401  (puts src/config on sys.path)
+#     from row_classifier import ROW_CLASSIFIER
+#
+# so no tool depends on another module having set up the path first.
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'config')
+
+if CONFIG_DIR not in sys.path:
+    sys.path.insert(0, CONFIG_DIR)
@@ -0,0 +1,209 @@
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from checklist_pipeline import detect_encoding
+from checklist_inputs import CACHE_DIR, CSV_PATH
+from section_resolver import compact_key, stripped_key
+
+# Sidecar index of the checklist CSV: for every section, the byte offsets and CSV
+# row numbers of the rows under each of its header rows. Built in one pass with the
+# generator's own header rule, stored in .checklist_cache/ and rebuilt only when the
+# CSV's sha256 changes (size + mtime are checked first so the hash is rarely needed).
+# extract_section() then seeks straight to a section and parses only its rows.
+
+INDEX_VERSION = 1
+
+def index_path_for(csv_path, cache_dir=CACHE_DIR):
+    base = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(cache_dir, f"{base}.sections.json")
+
+
+def _generator(csv_path):
+    from generateFilters import FacilityFilterGenerator
+    return FacilityFilterGenerator(csv_path)
+
+
+
+def iter_record_spans(data):
+    """Yield (start, end) byte offsets of each CSV record, honouring quoted newlines"""
+    start = 0
+    pos = 0
+    in_quotes = False
+    length = len(data)
+    while pos < length:
+        newline = data.find(b'\n', pos)
+        end = length if newline == -1 else newline + 1
+        # Each '"' toggles the quoted state ("" escapes toggle twice)
+        if data.count(b'"', pos, end) % 2:
+            in_quotes = not in_quotes
+        pos = end
+        if not in_quotes:
+            yield start, end
+            start = end
+    if start < length:
+        yield start, length
+
+
+def parse_record(data, encoding):
+    rows = list(csv.reader(io.StringIO(data.decode(encoding))))
+    return rows[0] if rows else []
+
+
+def build_index(csv_path):
+    from generateFilters import FACILITY_TYPE_STANDARDIZATION
+    with open(csv_path, 'rb') as f:
+        data = f.read()
+    encoding = detect_encoding(csv_path, log=lambda message: None)
+    generator = _generator(csv_path)
+
+    spans = iter_record_spans(data)
+    header_start, header_end = next(spans)
+    raw_types = [ft.strip() for ft in parse_record(data[header_start:header_end], encoding)[1:] if ft.strip()]
+    facility_types = [FACILITY_TYPE_STANDARDIZATION.get(ft, ft) for ft in raw_types]
+
+    sections = {}
+    current = None
+    for row_number, (start, end) in enumerate(spans, start=2):
+        row = parse_record(data[start:end], encoding)
+        if not row or not row[0].strip():
+            if current:
+                current['end_row'], current['end'] = row_number, end
+            continue
+        header = generator.section_header_name(generator.clean_question_text(row[0].strip()))
+        if header is not None:
+            current = {'header_row': row_number, 'start_row': row_number + 1, 'end_row': row_number,
+                       'start': end, 'end': end}
+            sections.setdefault(header, []).append(current)
+        elif current:
+            current['end_row'], current['end'] = row_number, end
+
+    return {
+        'version': INDEX_VERSION,
+        'csv': csv_path,
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'size': len(data),
+        'mtime': os.path.getmtime(csv_path),
+        'encoding': encoding,
+        'facility_types': facility_types,
+        'sections': sections,
+    }
+
+
+def load_index(csv_path=CSV_PATH, index_path=None, rebuild=False):
+    """Load the sidecar index, rebuilding it if the CSV content changed"""
+    index_path = index_path or index_path_for(csv_path)
+
+    if not rebuild and os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == INDEX_VERSION:
+            stat = os.stat(csv_path)
+            if index['size'] == stat.st_size and index['mtime'] == stat.st_mtime:
+                return index
+            with open(csv_path, 'rb') as f:
+                if hashlib.sha256(f.read()).hexdigest() == index['sha256']:
+                    # Touched but unchanged: refresh the stat shortcut only
+                    index['mtime'] = stat.st_mtime
+                    _save(index, index_path)
+                    return index
+
+    index = build_index(csv_path)
+    _save(index, index_path)
+    return index
+
+
+def _save(index, index_path):
+    os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+
+
+def find_section(index, name):
+    """Section name in the index matching name (space/case-insensitive, prefixes ignored)"""
+    if name in index['sections']:
+        return name
+    for key_fn in (compact_key, stripped_key):
+        key = key_fn(name)
+        for section in index['sections']:
+            if key_fn(section) == key:
+                return section
+    return None
+
+
+def extract_section(name, csv_path=CSV_PATH, index=None, include_all=False):
+    """Rows of one section, read by seeking to its byte ranges.
+
+    Returns {'section', 'facility_types', 'spans', 'rows': [{row_number, question,
+    applicability, applicable_to, raw}]} with the generator's question rule (text ends with '?' or at
+    least one '?' marker) unless include_all is set. None if the section is unknown.
+    """
+    index = index or load_index(csv_path)
+    section = find_section(index, name)
+    if section is None:
+        return None
+
+    facility_types = index['facility_types']
+    generator = _generator(csv_path)
+    rows = []
+    with open(csv_path, 'rb') as f:
+        for span in index['sections'][section]:
+            f.seek(span['start'])
+            data = f.read(span['end'] - span['start'])
+            records = csv.reader(io.StringIO(data.decode(index['encoding']), newline=''))
+            row_number = span['start_row']
+            for row in records:
+                if row and row[0].strip():
+                    text = generator.clean_question_text(row[0].strip())
+                    applicability = [
+                        (row[j + 1].strip() if j + 1 < len(row) else '') == '?'
+                        for j in range(len(facility_types))
+                    ]
+                    if include_all or text.endswith('?') or any(applicability):
+                        rows.append({
+                            'row_number': row_number,
+                            'question': text,
+                            'applicability': applicability,
+                            'applicable_to': [ft for ft, flag in zip(facility_types, applicability) if flag],
+                            'raw': row,
+                        })
+                row_number += 1
+
+    return {'section': section, 'facility_types': facility_types, 'spans': index['sections'][section], 'rows': rows}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Section row-range index for the checklist CSV")
+    parser.add_argument('section', nargs='?', help="print the rows of this section")
+    parser.add_argument('--csv', default=CSV_PATH, help="checklist CSV (default: checklist-final.csv)")
+    parser.add_argument('--all', action='store_true', help="include rows that are not questions")
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the index even if the CSV is unchanged")
+    args = parser.parse_args(argv)
+
+    index = load_index(args.csv, rebuild=args.rebuild)
+
+    if not args.section:
+        for section, spans in index['sections'].items():
+            ranges = ', '.join(f"{s['start_row']}-{s['end_row']}" for s in spans)
+            print(f"{section}: rows {ranges}")
+        print(f"\n{len(index['sections'])} sections indexed ({index_path_for(args.csv)})")
+        return
+
+    result = extract_section(args.section, args.csv, index, include_all=args.all)
+    if result is None:
+        print(f"❌ Section not found: {args.section}")
+        sys.exit(1)
+    print(f"📂 {result['section']}: {len(result['rows'])} rows")
+    for row in result['rows']:
+        print(f"Row {row['row_number']}: {row['question']}  [{', '.join(row['applicable_to']) or 'None'}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,11 @@
-import csv
+from csv_section_index import extract_section
 
-encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-lines = None
+# Seek straight to the section via the sidecar row-range index
+result = extract_section('BLEEDING ROOM', 'checklist-final.csv')
 
-for encoding in encodings:
-    try:
-        with open('checklist-final.csv', 'r', encoding=encoding) as file:
-            reader = csv.reader(file)
-            lines = list(reader)
-        break
-    except UnicodeDecodeError:
-        continue
+if result:
+    bleeding_room_questions = result['rows']
 
-if lines:
-    # Extract facility types from first row
-    facility_types = [ft.strip() for ft in lines[0][1:] if ft.strip()]
-    
-    # Find BLEEDING ROOM section
-    current_section = None
-    bleeding_room_questions = []
-    
-    for i, row in enumerate(lines[1:], start=2):
-        if not row or not row[0].strip():
-            continue
-        
-        first_column = row[0].strip()
-        
-        # Detect section headers
-        if (first_column and 
-            first_column.isupper() and 
-            len(first_column) > 3 and 
-            not first_column.endswith('?')):
-            current_section = first_column
-        
-        # If we're in BLEEDING ROOM section, collect questions
-        elif current_section == "BLEEDING ROOM":
-            # Check applicability per facility type
-            applicability = []
-            for j, ft in enumerate(facility_types):
-                cell_value = row[j + 1].strip() if j + 1 < len(row) else ''
-                applicability.append(cell_value == '?')
-            
-            # Check if this is a question
-            has_any_applicability = any(applicability)
-            if first_column.endswith('?') or has_any_applicability:
-                bleeding_room_questions.append({
-                    'question': first_column,
-                    'applicability': applicability,
-                    'applicable_to': [facility_types[i] for i, applicable in enumerate(applicability) if applicable]
-                })
-    
     # Write output to file
     with open('bleeding_room_data_elements_output.txt', 'w', encoding='utf-8') as output:
         output.write(f"BLEEDING ROOM Section - {len(bleeding_room_questions)} Data Elements\n")
@@ -75,4 +31,4 @@ if lines:
     print("✅ Output written to: bleeding_room_data_elements_output.txt")
     print(f"📊 Found {len(bleeding_room_questions)} data elements in BLEEDING ROOM section")
 else:
-    print("Failed to read CSV file")
+    print("BLEEDING ROOM section not found in CSV")
@@ -1,6 +1,8 @@
 import json
 import csv
-import re
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from row_classifier import ROW_CLASSIFIER, clean_first_cell
 
 def get_csv_ultrasound_elements(csv_path):
     elements = []
@@ -24,8 +26,8 @@ def get_csv_ultrasound_elements(csv_path):
                 found_section = True
                 continue
             if found_section:
-                # If we encounter another section (ALL CAPS, no ?), stop
-                if text.isupper() and not text.endswith('?') and len(text) > 3:
+                # If we encounter another section header, stop
+                if ROW_CLASSIFIER.section_name(clean_first_cell(text)) is not None:
                     break
                 elements.append(text)
     return elements
@@ -0,0 +1,205 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+
+from backup_store import STORE_DIR, BackupStore
+from js_config_reader import CACHE_DIR, JSConfigParseError, load_cache, parse_filter_config, save_cache
+
+# Per-question history ("blame") across every recorded generation of the facility
+# filter modules: legacy src/config/backup-<timestamp> directories, runs in the
+# backup store, and the current src/config tree. Each run is read once; the
+# inverted index (facility, section, question) -> added/removed events is cached
+# and only rebuilt when the set of runs changes.
+
+INDEX_PATH = os.path.join(CACHE_DIR, 'filter_history.json')
+INDEX_VERSION = 1
+CONFIG_DIR = 'src/config'
+
+# Modules in src/config that are not per-facility filters
+NON_FACILITY_MODULES = {
+    'facilityServiceDepartments', 'facilityServiceFilters', 'sectionVisibilityConfig',
+    'sectionVisibilityTable', 'commentFieldPairs',
+}
+
+_LEGACY_RUN_RE = re.compile(r'backup-(\d{8}-\d{6})$')
+
+
+def _facility_files(paths):
+    return {
+        os.path.splitext(os.path.basename(p))[0]: p
+        for p in paths
+        if p.endswith('.js') and os.path.splitext(os.path.basename(p))[0] not in NON_FACILITY_MODULES
+    }
+
+
+def discover_runs(config_dir=CONFIG_DIR, store_dir=STORE_DIR):
+    """Chronological list of runs: (run_id, source, {facility: loader}) where loader() -> bytes"""
+    runs = {}
+
+    for directory in glob.glob(os.path.join(config_dir, 'backup-*')):
+        match = _LEGACY_RUN_RE.search(directory)
+        if match:
+            files = _facility_files(glob.glob(os.path.join(directory, '*.js')))
+            runs[match.group(1)] = ('legacy', {f: _file_loader(p) for f, p in files.items()})
+
+    store = BackupStore(store_dir)
+    for entry in store.load_index():
+        run_id = entry['run_id']
+        if run_id in runs:
+            # Legacy directory already imported into the store: same contents
+            continue
+        run = store.load_run(run_id)
+        names = [n for n in run['files'] if n.endswith('.js')]
+        files = _facility_files(names)
+        runs[run_id] = ('store', {f: _store_loader(store, run_id, n) for f, n in files.items()})
+
+    ordered = [(run_id, source, files) for run_id, (source, files) in sorted(runs.items())]
+    current = _facility_files(glob.glob(os.path.join(config_dir, '*.js')))
+    ordered.append(('current', 'working tree', {f: _file_loader(p) for f, p in current.items()}))
+    return ordered
+
+
+def _file_loader(path):
+    def load():
+        with open(path, 'rb') as f:
+            return f.read()
+    load.key = ('file', path, os.path.getsize(path), os.path.getmtime(path))
+    return load
+
+
+def _store_loader(store, run_id, name):
+    def load():
+        return store.read_file(run_id, name)
+    entry = store.load_run(run_id)['files'][name]
+    load.key = ('store', entry['sha256'], entry.get('generated_on'))
+    return load
+
+
+def runs_signature(runs):
+    parts = [[run_id, sorted((f, list(load.key)) for f, load in files.items())] for run_id, _, files in runs]
+    return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+def build_index(runs):
+    """Diff consecutive runs per facility into {(facility, section, question): [events]}"""
+    parsed_cache = load_cache()
+    cache_dirty = False
+
+    def parse(data):
+        nonlocal cache_dirty
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in parsed_cache:
+            try:
+                parsed_cache[digest] = parse_filter_config(data.decode('utf-8', errors='replace'))
+            except JSConfigParseError as e:
+                parsed_cache[digest] = {'__error__': str(e)}
+            cache_dirty = True
+        config = parsed_cache[digest]
+        if not config or '__error__' in config:
+            return None
+        return {(section, q) for section, questions in config.items() for q in questions}
+
+    index = {}
+    state = {}
+    for run_id, _, files in runs:
+        for facility, load in sorted(files.items()):
+            entries = parse(load())
+            if entries is None:
+                continue
+            previous = state.get(facility, set())
+            for section, question in entries - previous:
+                index.setdefault((facility, section, question), []).append({'run': run_id, 'change': 'added'})
+            for section, question in previous - entries:
+                index.setdefault((facility, section, question), []).append({'run': run_id, 'change': 'removed'})
+            # A facility missing from a run carries its last known state forward
+            state[facility] = entries
+
+    if cache_dirty:
+        save_cache(parsed_cache)
+    return index
+
+
+def load_index(path=INDEX_PATH, rebuild=False):
+    runs = discover_runs()
+    signature = runs_signature(runs)
+
+    if not rebuild and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('version') == INDEX_VERSION and cached.get('signature') == signature:
+            return cached['runs'], {tuple(e['key']): e['events'] for e in cached['entries']}
+
+    index = build_index(runs)
+    run_ids = [run_id for run_id, _, _ in runs]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': INDEX_VERSION,
+            'signature': signature,
+            'runs': run_ids,
+            'entries': [{'key': list(key), 'events': events} for key, events in index.items()],
+        }, f, ensure_ascii=False)
+    return run_ids, index
+
+
+def question_index(index):
+    """{lower-cased question: [keys]}, so exact lookups are a dict hit rather than a scan"""
+    by_question = {}
+    for key in index:
+        by_question.setdefault(key[2].lower(), []).append(key)
+    return by_question
+
+
+def lookup(index, question, facility=None, section=None, contains=False, by_question=None):
+    """Matching (key, events) pairs; exact question text unless contains=True
+
+    Exact queries go through by_question (built from index when not given); only
+    substring queries scan every key.
+    """
+    needle = question.lower()
+    if contains:
+        keys = [key for key in index if needle in key[2].lower()]
+    else:
+        if by_question is None:
+            by_question = question_index(index)
+        keys = by_question.get(needle, [])
+
+    results = []
+    for key in keys:
+        f, s, _ = key
+        if facility and f.lower() != facility.lower():
+            continue
+        if section and s.lower() != section.lower():
+            continue
+        results.append((key, index[key]))
+    return sorted(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="History of questions across generated filter versions")
+    parser.add_argument('question', help="question text to look up")
+    parser.add_argument('--facility', help="module name, e.g. hospital or radiology")
+    parser.add_argument('--section', help="section name")
+    parser.add_argument('--contains', action='store_true', help="substring match instead of exact text")
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the index even if runs are unchanged")
+    args = parser.parse_args(argv)
+
+    runs, index = load_index(rebuild=args.rebuild)
+    results = lookup(index, args.question, args.facility, args.section, args.contains)
+
+    if not results:
+        print(f"No history found across {len(runs)} runs.")
+        return
+
+    for (facility, section, question), events in results:
+        print(f"{facility} / {section} / \"{question}\"")
+        for event in events:
+            marker = '+' if event['change'] == 'added' else '-'
+            print(f"   {marker} {event['change']:7s} in {event['run']}")
+
+
+if __name__ == "__main__":
+    main()
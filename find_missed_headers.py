@@ -1,17 +1,32 @@
 import re
 
-with open('src/config/hospital.js', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+from generation_manifest import describes_module, find_facility, load_manifest
+
+HOSPITAL_MODULE = 'src/config/hospital.js'
+
+def load_hospital_strings():
+    # Prefer the generator's manifest (exact question text, no JS escaping to undo),
+    # but only when it was written by the same generation as hospital.js
+    manifest = load_manifest()
+    facility = find_facility(manifest, 'hospital.js') if manifest and describes_module(manifest, HOSPITAL_MODULE) else None
+    if facility:
+        return [q['question'] for section in facility['sections'] for q in section['questions']]
+
+    with open(HOSPITAL_MODULE, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+
+    strings = []
+    for line in lines:
+        line = line.strip()
+        # Match strings in quotes
+        match = re.search(r'"([^"]+)"', line)
+        # Filter out known good sections if they appear in keys (lines ending with :)
+        if match and not line.endswith(':'):
+            strings.append(match.group(1))
+    return strings
 
 print("Potentially missed section headers (uppercase lines inside lists):")
-for line in lines:
-    line = line.strip()
-    # Match strings in quotes
-    match = re.search(r'"([^"]+)"', line)
-    if match:
-        content = match.group(1)
-        # Check if fully uppercase, long enough, and NOT ending with --
-        if content.isupper() and len(content) > 10 and not content.endswith('--'):
-            # Filter out known good sections if they appear in keys (lines ending with :)
-            if not line.endswith(':'): 
-                print(f"  {content}")
+for content in load_hospital_strings():
+    # Check if fully uppercase, long enough, and NOT ending with --
+    if content.isupper() and len(content) > 10 and not content.endswith('--'):
+        print(f"  {content}")
@@ -0,0 +1,215 @@
+import argparse
+import csv
+import os
+import sys
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from section_resolver import SectionResolver, load_metadata, normalize_name
+from canonical_keys import BULLET_RE
+from row_classifier import ROW_CLASSIFIER, SECTION, clean_first_cell
+from checklist_pipeline import detect_encoding
+
+# Streams checklist-final.csv once and rewrites question cells whose text is a
+# "Near Miss" of exactly one DHIS2 form name (same text ignoring case and spaces)
+# to that exact form name. Only the first cell of a row is ever touched; the
+# applicability columns are copied through byte for byte.
+
+CSV_PATH = 'checklist-final.csv'
+METADATA_PATH = 'dhis2_full_metadata_v2.json'
+
+
+def near_miss_key(text):
+    return text.lower().replace(" ", "")
+
+
+def build_form_name_index(metadata):
+    """Near-miss key -> set of form names, globally and per DHIS2 section id"""
+    form_names = {}
+    for psde in metadata.get('programStageDataElements', []):
+        de = psde.get('dataElement', {})
+        # App logic: formName || displayFormName || name (displayName)
+        best_name = de.get('formName') or de.get('displayFormName') or de.get('displayName')
+        if best_name and 'id' in de:
+            form_names[de['id']] = normalize_name(best_name)
+
+    global_index = {}
+    for name in form_names.values():
+        global_index.setdefault(near_miss_key(name), set()).add(name)
+
+    section_index = {}
+    for section in metadata.get('programStageSections', []):
+        index = section_index.setdefault(section['id'], {})
+        for de_ref in section.get('dataElements', []):
+            name = form_names.get(de_ref.get('id'))
+            if name:
+                index.setdefault(near_miss_key(name), set()).add(name)
+
+    return global_index, section_index
+
+
+def iter_records(f):
+    """Yield (row, raw_text) pairs, raw_text being the exact source text of the record"""
+    consumed = []
+
+    def tap():
+        for line in f:
+            consumed.append(line)
+            yield line
+
+    for row in csv.reader(tap()):
+        raw = ''.join(consumed)
+        consumed.clear()
+        yield row, raw
+
+
+def replace_first_cell(raw, new_value):
+    """Swap the first field of a raw CSV record, leaving the rest of the bytes untouched"""
+    if raw.startswith('"'):
+        i = 1
+        while True:
+            i = raw.index('"', i)
+            if raw[i + 1:i + 2] == '"':
+                i += 2
+                continue
+            end = i + 1
+            break
+    else:
+        end = min(
+            [pos for pos in (raw.find(','), raw.find('\n'), raw.find('\r')) if pos != -1] or [len(raw)]
+        )
+
+    if any(ch in new_value for ch in ',"\r\n'):
+        new_value = '"' + new_value.replace('"', '""') + '"'
+    return new_value + raw[end:]
+
+
+def is_section_header(row, col1):
+    # Same header rule as the generator and verify_all_sections_strict.py
+    return ROW_CLASSIFIER.classify(clean_first_cell(col1), row)[0] == SECTION
+
+
+def find_fixes(records, resolver, global_index, section_index):
+    """Yield (line_number, raw, fix) per record; fix is (new_raw, old_text, new_text) or None"""
+    line_number = 1
+    current = None
+    for record_index, (row, raw) in enumerate(records):
+        start_line = line_number
+        line_number += raw.count('\n')
+
+        # Skip header 1 and header 2
+        if record_index < 2 or not row or not row[0].strip():
+            yield start_line, raw, None
+            continue
+
+        col1 = row[0].strip()
+        if is_section_header(row, col1):
+            section = resolver.resolve(col1)
+            current = section_index.get(section['id']) if section else None
+            yield start_line, raw, None
+            continue
+
+        has_question_mark = col1.endswith('?') or any(c.strip() == '?' for c in row[1:])
+        if not has_question_mark or '\n' in row[0]:
+            yield start_line, raw, None
+            continue
+
+        # Leading bullets/dots/dashes the generator strips before emitting a question
+        prefix = BULLET_RE.match(row[0])
+        prefix = prefix.group() if prefix else ''
+        text = row[0][len(prefix):].strip()
+
+        # Prefer the resolved DHIS2 section's elements; fall back to the whole stage
+        matches = (current or {}).get(near_miss_key(text)) or global_index.get(near_miss_key(text))
+        if not matches or len(matches) != 1:
+            yield start_line, raw, None
+            continue
+
+        (form_name,) = matches
+        # Never change case on rows the generator reads as ALL CAPS section headers
+        if form_name == text or text.isupper() or form_name.isupper():
+            yield start_line, raw, None
+            continue
+
+        yield start_line, raw, (replace_first_cell(raw, prefix + form_name), text, form_name)
+
+
+def write_patch_hunk(out, line_number, old_raw, new_raw):
+    old_lines = old_raw.splitlines(keepends=True)
+    new_lines = new_raw.splitlines(keepends=True)
+    out.write(f"@@ -{line_number},{len(old_lines)} +{line_number},{len(new_lines)} @@\n")
+    for line in old_lines:
+        out.write('-' + line)
+    for line in new_lines:
+        out.write('+' + line)
+
+
+def run(csv_path=CSV_PATH, metadata_path=METADATA_PATH, apply=False, patch_path=None):
+    metadata = load_metadata(metadata_path)
+    if not metadata:
+        print(f"❌ Failed to read DHIS2 metadata: {metadata_path}")
+        return None
+
+    resolver = SectionResolver.from_metadata(metadata)
+    global_index, section_index = build_form_name_index(metadata)
+    # The preview patch may go to stdout, so encoding probes are reported on stderr
+    encoding = detect_encoding(csv_path, log=lambda message: print(message, file=sys.stderr))
+
+    # Same encoding and line endings as the CSV, so the patch applies to it byte for byte
+    patch = open(patch_path, 'w', encoding=encoding, newline='') if patch_path else sys.stdout
+    tmp_path = csv_path + '.fixing'
+    output = open(tmp_path, 'w', encoding=encoding, newline='') if apply else None
+    fixes = 0
+    skipped = 0
+
+    try:
+        patch.write(f"--- a/{csv_path}\n+++ b/{csv_path}\n")
+        with open(csv_path, 'r', encoding=encoding, newline='') as f:
+            for line_number, raw, fix in find_fixes(iter_records(f), resolver, global_index, section_index):
+                if fix:
+                    new_raw, old_text, new_text = fix
+                    try:
+                        new_raw.encode(encoding)
+                    except UnicodeEncodeError:
+                        # A form name the CSV's encoding cannot hold would fail the rewrite mid-file
+                        print(f"⚠️  Line {line_number}: skipped, \"{new_text}\" is not representable in {encoding}",
+                              file=sys.stderr)
+                        skipped += 1
+                        fix = None
+                if fix:
+                    write_patch_hunk(patch, line_number, raw, new_raw)
+                    raw = new_raw
+                    fixes += 1
+                if output:
+                    output.write(raw)
+        if output:
+            output.close()
+            os.replace(tmp_path, csv_path)
+    finally:
+        if patch is not sys.stdout:
+            patch.close()
+        if output:
+            output.close()
+            # Only left behind when the rewrite failed part way
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    action = "Applied" if apply else "Proposed"
+    print(f"{action} {fixes} near-miss fixes in {csv_path}"
+          + (f" ({skipped} skipped: not representable in {encoding})" if skipped else ""), file=sys.stderr)
+    return fixes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Rewrite near-miss checklist questions to their exact DHIS2 form names")
+    parser.add_argument('--csv', default=CSV_PATH, help="checklist CSV (default: checklist-final.csv)")
+    parser.add_argument('--metadata', default=METADATA_PATH, help="DHIS2 program stage metadata JSON")
+    parser.add_argument('--patch', metavar='PATH', help="write the preview patch here (in the CSV's encoding) instead of stdout")
+    parser.add_argument('--apply', action='store_true', help="rewrite the CSV in place (default: preview only)")
+    args = parser.parse_args(argv)
+
+    return 1 if run(args.csv, args.metadata, args.apply, args.patch) is None else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import json
+import os
+import re
+
+# "Checklist hash: <sha256>" line in the header comment of every generated module
+_CHECKLIST_HASH_RE = re.compile(r'^\s*\*\s*Checklist hash:\s*([0-9a-f]+)\s*$', re.MULTILINE)
+_HEADER_BYTES = 1024
+
+# Written by src/config/generateFilters.py alongside the generated modules
+MANIFEST_PATH = 'src/config/generation_manifest.json'
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Return the generation manifest, or None if the generator has not produced one yet"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def module_checklist_hash(path):
+    """Checklist hash from a generated module's header, or None (legacy / hand-written modules)"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            header = f.read(_HEADER_BYTES)
+    except OSError:
+        return None
+    match = _CHECKLIST_HASH_RE.search(header)
+    return match.group(1) if match else None
+
+
+def describes_module(generated, path):
+    """True when a manifest / source map was written by the same generation as the module at path
+
+    Compares checklist hashes rather than mtimes, which a checkout or copy reorders freely.
+    """
+    checklist_hash = (generated or {}).get('checklist_hash')
+    return bool(checklist_hash) and module_checklist_hash(path) == checklist_hash
+
+
+def find_facility(manifest, module_or_type):
+    """Look up a facility entry by module filename ("hospital.js") or facility type ("Hospital")"""
+    for facility in manifest.get('facilities', []):
+        if module_or_type in (facility['module'], facility['facility_type']):
+            return facility
+    return None
+
+
+def questions_by_section(facility):
+    """{section: [question text]} in emitted order, the shape of extract_questions_from_js_config"""
+    return {
+        section['section']: [q['question'] for q in section['questions']]
+        for section in facility['sections']
+    }
+
+
+def iter_questions(manifest):
+    """Yield (facility_type, section, question, row_number) for every emitted entry"""
+    for facility in manifest.get('facilities', []):
+        for section in facility['sections']:
+            for q in section['questions']:
+                yield facility['facility_type'], section['section'], q['question'], q['row_number']
+
+
+# (facility, section, showOnly index) -> CSV row and raw cell text, also written by the generator
+SOURCE_MAP_PATH = 'src/config/filter_source_map.json'
+
+
+def load_source_map(path=SOURCE_MAP_PATH):
+    """Return the filter source map, or None if the generator has not produced one yet"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def section_sources(source_map, module_or_type):
+    """{section: [[row_number, raw_text], ...]} aligned with the module's showOnly lists"""
+    for facility_type, facility in source_map.get('facilities', {}).items():
+        if module_or_type in (facility['module'], facility_type):
+            return facility['sections']
+    return None
+
+
+def source_of(source_map, module_or_type, section, index):
+    """(row_number, raw_text) of showOnly[index] in a facility module section, or None"""
+    sections = section_sources(source_map, module_or_type) or {}
+    entries = sections.get(section, [])
+    return tuple(entries[index]) if 0 <= index < len(entries) else None
@@ -0,0 +1,259 @@
+import argparse
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# Parsed modules are cached by content hash: the backup-* directories are mostly
+# byte-identical copies, so each distinct file is only ever tokenized once.
+CACHE_DIR = '.checklist_cache'
+CACHE_PATH = os.path.join(CACHE_DIR, 'js_configs.json')
+CACHE_VERSION = 1
+
+# Where generated filter modules (current, backed up and stale copies) live
+DEFAULT_PATTERNS = [
+    'src/config/*.js',
+    'src/config/backup-*/*.js',
+    '*.js',
+]
+
+TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')
+  | (?P<punct>[{}\[\]:,=;])
+  | (?P<word>[A-Za-z0-9_$.]+)
+  | (?P<other>.)
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPE_RE = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.DOTALL)
+_SIMPLE_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+
+class JSConfigParseError(ValueError):
+    pass
+
+
+def _unescape_char(match):
+    esc = match.group(1)
+    if esc[0] in 'ux' and len(esc) > 1:
+        return chr(int(esc[1:], 16))
+    if esc in ('\n', '\r\n'):
+        # Line continuation
+        return ''
+    return _SIMPLE_ESCAPES.get(esc, esc)
+
+
+def unescape_js_string(token):
+    """Decode a quoted JS string literal token (either quote style)"""
+    return _ESCAPE_RE.sub(_unescape_char, token[1:-1])
+
+
+def tokenize(text):
+    """Yield (kind, value) tokens, skipping whitespace and comments"""
+    for match in TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind in ('ws', 'comment'):
+            continue
+        value = match.group()
+        if kind == 'string':
+            value = unescape_js_string(value)
+        yield kind, value
+
+
+class _Parser:
+    def __init__(self, text):
+        self.tokens = list(tokenize(text))
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect(self, value):
+        kind, got = self.next()
+        if got != value or kind == 'string':
+            raise JSConfigParseError(f"expected {value!r}, got {got!r} at token {self.pos}")
+
+    def value(self):
+        kind, value = self.peek()
+        if value == '{' and kind == 'punct':
+            return self.obj()
+        if value == '[' and kind == 'punct':
+            return self.array()
+        if kind in ('string', 'word'):
+            self.pos += 1
+            return value
+        raise JSConfigParseError(f"unexpected {value!r} at token {self.pos}")
+
+    def obj(self):
+        self.expect('{')
+        result = {}
+        while True:
+            kind, key = self.next()
+            if key == '}' and kind == 'punct':
+                return result
+            if kind not in ('string', 'word'):
+                raise JSConfigParseError(f"bad object key {key!r} at token {self.pos}")
+            self.expect(':')
+            result[key] = self.value()
+            kind, sep = self.next()
+            if sep == '}' and kind == 'punct':
+                return result
+            if sep != ',' or kind != 'punct':
+                raise JSConfigParseError(f"expected ',' or '}}', got {sep!r} at token {self.pos}")
+
+    def array(self):
+        self.expect('[')
+        result = []
+        while True:
+            kind, value = self.peek()
+            if value == ']' and kind == 'punct':
+                self.pos += 1
+                return result
+            result.append(self.value())
+            kind, sep = self.next()
+            if sep == ']' and kind == 'punct':
+                return result
+            if sep != ',' or kind != 'punct':
+                raise JSConfigParseError(f"expected ',' or ']', got {sep!r} at token {self.pos}")
+
+    def filter_config(self):
+        """Find `const X = { ... }` and return {section: [questions]}, or None if absent"""
+        while self.pos < len(self.tokens):
+            kind, value = self.next()
+            if kind == 'word' and value == 'const':
+                self.next()  # identifier (legacy files even use `const 1 = {`)
+                kind, eq = self.next()
+                if eq == '=' and self.peek() == ('punct', '{'):
+                    start = self.pos
+                    try:
+                        config = self.obj()
+                    except JSConfigParseError:
+                        # Some other object literal (shorthand, functions...): keep scanning
+                        self.pos = start + 1
+                        continue
+                    if config and all(isinstance(v, dict) and isinstance(v.get('showOnly'), list) for v in config.values()):
+                        return {section: v['showOnly'] for section, v in config.items()}
+        return None
+
+
+def parse_filter_config(text):
+    """Parse the generated `const X = { "SECTION": { "showOnly": [...] } }` module shape.
+
+    Returns {section: [questions]} in source order, or None when the text is not a
+    filter module (e.g. facilityServiceFilters.js or sectionVisibilityConfig.js).
+    """
+    return _Parser(text).filter_config()
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def read_filter_config(path):
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return parse_filter_config(f.read())
+
+
+def _parse_job(path):
+    try:
+        return read_filter_config(path)
+    except JSConfigParseError as e:
+        return {'__error__': str(e)}
+
+
+def load_cache(path=CACHE_PATH):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache.get('entries', {}) if cache.get('version') == CACHE_VERSION else {}
+
+
+def save_cache(entries, path=CACHE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'entries': entries}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def discover_configs(patterns=DEFAULT_PATTERNS):
+    paths = set()
+    for pattern in patterns:
+        paths.update(glob.glob(pattern))
+    return sorted(paths)
+
+
+def read_all(paths=None, workers=None, cache_path=CACHE_PATH):
+    """Parse many filter modules at once: {path: {section: [questions]} or None}.
+
+    Files are hashed, cache hits are reused, and each remaining distinct hash is
+    parsed once, in a process pool when there is more than one to do.
+    """
+    if paths is None:
+        paths = discover_configs()
+
+    cache = load_cache(cache_path)
+    hashes = {path: file_hash(path) for path in paths}
+
+    pending = {}
+    for path, digest in hashes.items():
+        if digest not in cache and digest not in pending:
+            pending[digest] = path
+
+    if pending:
+        jobs = list(pending.items())
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(jobs) <= 1:
+            results = [_parse_job(path) for _, path in jobs]
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                results = list(pool.map(_parse_job, [path for _, path in jobs],
+                                        chunksize=max(1, len(jobs) // (workers * 4))))
+        for (digest, _), parsed in zip(jobs, results):
+            cache[digest] = parsed
+        save_cache(cache, cache_path)
+
+    return {path: cache[digest] for path, digest in hashes.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parse generated/legacy facility filter modules in bulk")
+    parser.add_argument('paths', nargs='*', help="files to parse (default: src/config, backups and root copies)")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--json', action='store_true', help="dump parsed configs as JSON")
+    args = parser.parse_args(argv)
+
+    results = read_all(args.paths or None, workers=args.jobs)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    for path, config in results.items():
+        if config is None:
+            continue
+        if '__error__' in config:
+            print(f"❌ {path}: {config['__error__']}")
+            continue
+        total = sum(len(q) for q in config.values())
+        print(f"{path}: {len(config)} sections, {total} questions")
+
+
+if __name__ == "__main__":
+    main()
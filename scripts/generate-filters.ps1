@@ -1,12 +1,6 @@
-# Backup current config files
-$ts = Get-Date -Format 'yyyyMMdd-HHmmss'
-$backup = Join-Path 'src/config' ('backup-' + $ts)
-New-Item -ItemType Directory -Force -Path $backup | Out-Null
-Copy-Item src/config/*.js $backup -Force
-if (Test-Path src/config/generation_report.json) {
-  Copy-Item src/config/generation_report.json $backup -Force
-}
-Write-Host ("Backup created at " + $backup)
+# Back up current config files into the content-addressed store
+# (src/config/backups; see backup_store.py for list/restore)
+python .\backup_store.py store --label "generate-filters.ps1"
 
 # Ensure UTF-8 output for Python on Windows
 try {
@@ -0,0 +1,141 @@
+import json
+import os
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+# Name normalization lives in src/config/canonical_keys.py (shared with the generator)
+from canonical_keys import (  # re-exported for the tools importing them from here
+    SECTION_PREFIX_RE,
+    canonical_key,
+    compact_key,
+    normalize_name,
+    repair_text,
+    strip_bullets,
+    strip_name_prefix,
+    strip_section_prefix,
+    stripped_key,
+)
+
+METADATA_PATH = 'dhis2_full_metadata_v2.json'
+ALIASES_PATH = 'section_aliases.json'
+
+# Number of leading characters used to group sections for "possible candidates"
+CANDIDATE_PREFIX_LEN = 10
+
+
+def load_metadata(path=METADATA_PATH):
+    """Read the DHIS2 program stage export, tolerating BOMs and legacy encodings"""
+    for encoding in ['utf-8-sig', 'utf-8', 'latin-1']:
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                return json.load(f)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+    return None
+
+
+def load_aliases(path=ALIASES_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('aliases', {})
+
+
+class SectionResolver:
+    """Resolve CSV/config section names to DHIS2 programStageSections with dictionary lookups.
+
+    All keys are computed once when the resolver is built; resolve() tries, in order,
+    the exact name, the space-insensitive key, the prefix-stripped key and finally the
+    persisted alias table (known renames such as "FACILITY-ENVIONMENT").
+    """
+
+    def __init__(self, sections, aliases=None, aliases_path=ALIASES_PATH):
+        self.sections = list(sections)
+        self.aliases_path = aliases_path
+        self.aliases = dict(aliases or {})
+
+        self.by_exact = {}
+        self.by_compact = {}
+        self.by_stripped = {}
+        self.by_prefix = {}
+        # Same stripped name used by more than one DHIS2 section id
+        self.groups = {}
+
+        for section in self.sections:
+            for name in self._names(section):
+                self.by_exact.setdefault(normalize_name(name), section)
+                self.by_compact.setdefault(compact_key(name), section)
+
+            key = stripped_key(self.display_name(section))
+            self.by_stripped.setdefault(key, section)
+            self.groups.setdefault(key, []).append(section)
+            self.by_prefix.setdefault(key[:CANDIDATE_PREFIX_LEN], []).append(section)
+
+        self._alias_keys = {stripped_key(k): v for k, v in self.aliases.items()}
+
+    @classmethod
+    def from_metadata(cls, metadata=None, path=METADATA_PATH, aliases_path=ALIASES_PATH):
+        if metadata is None:
+            metadata = load_metadata(path) or {}
+        return cls(metadata.get('programStageSections', []), load_aliases(aliases_path), aliases_path)
+
+    @staticmethod
+    def display_name(section):
+        return section.get('displayName') or section.get('name', '')
+
+    @staticmethod
+    def _names(section):
+        return [n for n in (section.get('name'), section.get('displayName')) if n]
+
+    def resolve(self, name):
+        """Return the DHIS2 section dict for a CSV/config section name, or None"""
+        if not name:
+            return None
+
+        section = (
+            self.by_exact.get(normalize_name(name))
+            or self.by_compact.get(compact_key(name))
+            or self.by_stripped.get(stripped_key(name))
+        )
+        if section:
+            return section
+
+        target = self._alias_keys.get(stripped_key(name))
+        if target and stripped_key(target) != stripped_key(name):
+            return self.resolve(target)
+        return None
+
+    def candidates(self, name):
+        """Near matches for a diagnostic: sections sharing the first few characters of the
+        prefix-stripped key, then sections whose name contains the name or is contained in it
+        """
+        if not name:
+            return []
+        found = list(self.by_prefix.get(stripped_key(name)[:CANDIDATE_PREFIX_LEN], []))
+        seen = {id(section) for section in found}
+        lower, key = name.lower(), stripped_key(name)
+        for section in self.sections:
+            if id(section) in seen:
+                continue
+            display, section_key = self.display_name(section).lower(), stripped_key(self.display_name(section))
+            if (lower in display or display in lower
+                    or (key and section_key and (key in section_key or section_key in key))):
+                seen.add(id(section))
+                found.append(section)
+        return found
+
+    def duplicates(self):
+        """{stripped name: [sections]} for names used by more than one section id"""
+        return {
+            self.display_name(group[0]): group
+            for group in self.groups.values()
+            if len(group) > 1
+        }
+
+    def add_alias(self, name, target):
+        self.aliases[name] = target
+        self._alias_keys[stripped_key(name)] = target
+
+    def save_aliases(self):
+        with open(self.aliases_path, 'w', encoding='utf-8') as f:
+            json.dump({'aliases': dict(sorted(self.aliases.items()))}, f, indent=2)
+            f.write('\n')
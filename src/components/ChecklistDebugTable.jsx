@@ -1,4 +1,4 @@
-import React, { useMemo, useState } from 'react';
+import React, { useEffect, useMemo, useState } from 'react';
 import facilityServiceFilters from '../config/facilityServiceFilters';
 import './ChecklistDebugTable.css';
 
@@ -7,6 +7,10 @@ import './ChecklistDebugTable.css';
  *
  * Compares expected data elements from CSV config against actual DHIS2 data elements
  * being loaded for a given facility type and service departments.
+ *
+ * Expected entries link back to their checklist CSV row through the generator's
+ * source map (filter_source_map.json), loaded lazily so it stays out of the main bundle
+ * and out of the service worker precache (see globIgnores in vite.config.js).
  */
 export function ChecklistDebugTable({
     facilityType,
@@ -16,6 +20,15 @@ export function ChecklistDebugTable({
 }) {
     // State to preserve expanded/collapsed state of details elements
     const [expandedSections, setExpandedSections] = useState({});
+    const [sourceMap, setSourceMap] = useState(null);
+
+    useEffect(() => {
+        let cancelled = false;
+        import('../config/filter_source_map.json')
+            .then((module) => { if (!cancelled) setSourceMap(module.default); })
+            .catch((error) => console.warn('Filter source map unavailable:', error));
+        return () => { cancelled = true; };
+    }, []);
 
     const debugData = useMemo(() => {
         if (!facilityType || !configuration) return [];
@@ -24,6 +37,8 @@ export function ChecklistDebugTable({
 
         // Get the filter config for this facility type
         const filterConfig = facilityServiceFilters[facilityType];
+        // [row, rawText] for each showOnly entry, keyed by section (empty until the source map loads)
+        const sourceSections = sourceMap?.facilities?.[facilityType.replace(/^Service /, '')]?.sections || {};
 
         if (!filterConfig) {
             return [{
@@ -231,6 +246,12 @@ export function ChecklistDebugTable({
                 }
             });
 
+			// CSV provenance of the expected entries
+			const sources = sourceSections[serviceDept] || [];
+			mergedRows.forEach(r => {
+				if (r.expectedIndex >= 0 && sources[r.expectedIndex]) r.source = sources[r.expectedIndex];
+			});
+
 			// Derive missing/extra from mergedRows (occurrence-aware, handles duplicates like multiple "Comments")
 			const missing = mergedRows
 				.filter(r => r.type === 'missing')
@@ -281,7 +302,7 @@ export function ChecklistDebugTable({
         });
 
         return results;
-    }, [facilityType, selectedServiceDepartments, visibleSections, configuration]);
+    }, [facilityType, selectedServiceDepartments, visibleSections, configuration, sourceMap]);
 
     const getStatusIcon = (status) => {
         switch (status) {
@@ -422,6 +443,11 @@ export function ChecklistDebugTable({
                                                         }}>
                                                             {row.expected}
                                                             <span className={`index-badge expected`}>#{row.expectedIndex + 1}</span>
+                                                            {row.source && (
+                                                                <span className="index-badge source" title={`CSV: ${row.source[1]}`}>
+                                                                    row {row.source[0]}
+                                                                </span>
+                                                            )}
                                                         </div>
                                                     ) : <span className="empty-cell">-</span>}
                                                 </td>
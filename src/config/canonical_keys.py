@@ -0,0 +1,187 @@
+"""
+Canonical keys for checklist questions, section names and DHIS2 data element names.
+
+One place for the normalization rules that the generator and the root-level tools
+apply before comparing names:
+
+    normalize_name        exact matching: outer whitespace only
+    repair_text           known mojibake / smart punctuation -> ASCII, one str.translate pass
+    strip_bullets         leading bullets, dots and dashes ("· Is there ...", "• Is there ...", "- Is there ...")
+    strip_name_prefix     DHIS2 "Inspection:" / "FACILITY:-" / "SO,n" prefixes, then bullets
+    strip_section_prefix  section prefixes incl. "SECTION A-", with spaces around '-' removed
+    compact_key           space- and case-insensitive section key
+    stripped_key          compact_key of the prefix-stripped section name
+    canonical_key         repaired, prefix/bullet-stripped, whitespace-collapsed, casefolded
+    service_filter_key    Python mirror of normalize() in facilityServiceFilters.js
+    clean_dhis2_name      data element name as the PWA shows it (cleanDHIS2Name in FormPage.jsx)
+    clean_dhis2_section_name  section name FormSection filters on (cleanDHIS2Name, keeping FACILITY-)
+    facility_type_key     facilityTypeKey() in sectionVisibilityTable.js
+
+The same few thousand names (2,331 data elements x 4 candidate names, the CSV
+questions, the section list) are normalized over and over by every tool, so all
+keys are memoized.
+"""
+
+import re
+from functools import lru_cache
+
+CACHE_SIZE = 1 << 16
+
+# Corrupted / typographic characters seen in the checklist CSV and DHIS2 exports
+MOJIBAKE_REPLACEMENTS = {
+    # Corrupted UTF-8 characters (Windows-1252 misread as UTF-8)
+    'ô': '"',       # Left double quote
+    'ö': '"',       # Right double quote
+    'ò': "'",       # Left single quote
+    'ó': "'",       # Right single quote
+    '–': '-',       # En dash
+    '—': '-',       # Em dash
+    '…': '...',     # Ellipsis
+    '�': '',        # Unicode replacement character (remove)
+
+    # Windows-1252 control characters (when read as Latin-1)
+    '\x91': "'",    # Left single quote
+    '\x92': "'",    # Right single quote / apostrophe
+    '\x93': '"',    # Left double quote
+    '\x94': '"',    # Right double quote
+    '\x96': '-',    # En dash
+    '\x97': '-',    # Em dash
+    '\x85': '...',  # Ellipsis
+
+    # Unicode curly quotes (normalize to straight quotes)
+    '‘': "'",       # Left single quote U+2018
+    '’': "'",       # Right single quote U+2019
+    '“': '"',       # Left double quote U+201C
+    '”': '"',       # Right double quote U+201D
+}
+MOJIBAKE_TABLE = str.maketrans(MOJIBAKE_REPLACEMENTS)
+
+# Prefixes that appear on one side (CSV or DHIS2) but not the other:
+#   "SECTION A-ORGANISATION AND MANAGEMENT" (CSV)
+#   "FACILITY:- ..." / "SO,3 SERVICES OFFERED: ..." / "SO,3 ..." (DHIS2 copies)
+#   "1- Inspection: ..." (older DHIS2 exports)
+SECTION_PREFIX_RE = re.compile(
+    r'^(?:'
+    r'SECTION\s+[A-Z0-9]+\s*[-:]\s*'
+    r'|FACILITY:-?\s*'
+    r'|SO,\d+\s+SERVICES OFFERED:\s*'
+    r'|SO,\d+\s*'
+    r'|[\d-]*\s*Inspection:\s*'
+    r')',
+    re.IGNORECASE
+)
+# Data element name prefixes, stripped in this order
+NAME_PREFIX_RES = [
+    re.compile(r'^[\d-]*\s*Inspection:\s*', re.IGNORECASE),
+    re.compile(r'^FACILITY:-?\s*', re.IGNORECASE),
+    re.compile(r'^SO,\d+\s*', re.IGNORECASE),
+]
+# Leading bullets (middle dot and U+2022), dots, dashes and spaces: the one rule the
+# generator, the row classifier and the fixers strip question text with
+BULLET_RE = re.compile(r'^[·•\.\-\s]+')
+# cleanDHIS2Name in FormPage.jsx, applied in order (each replaces the first match only)
+DHIS2_NAME_PREFIX_RES = [
+    re.compile(r'^(.*?)\s*Inspection\s*[:-]\s*', re.IGNORECASE),
+    re.compile(r'^FACILITY\s*[:-]\s*', re.IGNORECASE),
+    re.compile(r'^SO,\d+\s+SERVICES OFFERED\s*[:-]\s*', re.IGNORECASE),
+    re.compile(r'^SO,\d+\s*', re.IGNORECASE),
+    re.compile(r'^[A-Z\s]+-[\d-]+-?', re.IGNORECASE),
+    re.compile(r'^[^a-zA-Z0-9(]+'),
+]
+# FormSection's section name cleanup keeps the FACILITY- prefix (e.g. 'FACILITY-ENVIRONMENT' is a filter key)
+FACILITY_DASH_PREFIX_RE = re.compile(r'^FACILITY\s*-', re.IGNORECASE)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_DASH_RE = re.compile(r'\s*-\s*')
+_JS_LEADING_RE = re.compile(r'^[^a-zA-Z0-9(]+')
+
+
+def normalize_name(name):
+    # Strictly return the name as is for "exact matching"
+    # Only stripping outer whitespace which is usually a file-reading artifact
+    return name.strip() if name else ""
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def repair_text(text):
+    """Replace corrupted special characters from CSV encoding issues"""
+    if not text:
+        return text
+    return text.translate(MOJIBAKE_TABLE)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def strip_bullets(text):
+    return BULLET_RE.sub('', text.strip()).strip() if text else ""
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def strip_name_prefix(name):
+    """Remove DHIS2 "Inspection:", "FACILITY:-" and "SO,n" prefixes and leading bullets"""
+    if not name:
+        return ""
+    clean = name
+    for prefix_re in NAME_PREFIX_RES:
+        clean = prefix_re.sub('', clean)
+    return strip_bullets(clean)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def strip_section_prefix(name):
+    """Remove "SECTION X-", "FACILITY:-" and "SO,n" style prefixes"""
+    return SECTION_PREFIX_RE.sub('', normalize_name(_DASH_RE.sub('-', name or ''))).strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compact_key(name):
+    """Space- and case-insensitive key ("FACILITY- SCREENING ROOM" == "FACILITY-SCREENING ROOM")"""
+    return _WHITESPACE_RE.sub('', normalize_name(name)).upper()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def stripped_key(name):
+    return compact_key(strip_section_prefix(name))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_key(name):
+    """Key for loose question/data element matching across the CSV, configs and DHIS2"""
+    if not name:
+        return ""
+    return _WHITESPACE_RE.sub(' ', strip_name_prefix(repair_text(name))).casefold()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def service_filter_key(name):
+    """Same key the app's shouldShowDataElementForService() compares on
+
+    Must stay in step with the normalize() helper emitted into facilityServiceFilters.js.
+    """
+    if not name:
+        return ""
+    return _JS_LEADING_RE.sub('', name).replace("'", '').lower().strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_dhis2_name(name):
+    """Data element / section name as the PWA shows it (mirrors cleanDHIS2Name in FormPage.jsx)"""
+    cleaned = name or ''
+    for pattern in DHIS2_NAME_PREFIX_RES:
+        cleaned = pattern.sub('', cleaned, count=1)
+    return cleaned.strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_dhis2_section_name(name):
+    """Section name FormSection passes to the facility filters (cleanDHIS2Name, keeping FACILITY-)"""
+    cleaned = name or ''
+    for pattern in DHIS2_NAME_PREFIX_RES:
+        if pattern is DHIS2_NAME_PREFIX_RES[1] and FACILITY_DASH_PREFIX_RE.match(cleaned):
+            continue
+        cleaned = pattern.sub('', cleaned, count=1)
+    return cleaned.strip()
+
+
+def facility_type_key(label):
+    """Lookup key of a facility type label: lower case, single spaces (mirrors facilityTypeKey in JS)"""
+    return ' '.join(label.lower().split())
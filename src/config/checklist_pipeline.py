@@ -0,0 +1,149 @@
+"""
+Streaming stages for turning the checklist CSV into sections and questions.
+
+    decode      -> (row_number, cells) straight from the file, one row at a time
+    normalize   -> {'row_number', 'text', 'cells'} with the first cell run through
+                   a list of pluggable text normalizers
+    classify    -> section / question / subsection events, labelled by a
+                   row_classifier.RowClassifier (one pass per row)
+    aggregate   -> one block per run of rows under a section header
+    collect     -> sections / questions_data / subsection_rows as the generators use them
+
+Every stage is a generator, so the raw file is never held in memory: only the
+block being aggregated is. Generators differ only in the normalizers and the
+classifier rules they plug in (see generateFilters.py and genreateFilters.py).
+"""
+
+import codecs
+import csv
+import hashlib
+
+from row_classifier import QUESTION, ROW_CLASSIFIER, SECTION, SUBSECTION
+
+ENCODINGS = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
+CHUNK_SIZE = 1 << 16
+
+
+def detect_encoding(path, encodings=ENCODINGS, log=print):
+    """First encoding that decodes the whole file, checked chunk by chunk"""
+    for encoding in encodings:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+                    decoder.decode(chunk)
+                decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            log(f"[ERROR] Failed to read with {encoding} encoding")
+            continue
+        log(f"[OK] Successfully read CSV with {encoding} encoding")
+        return encoding
+    raise ValueError("Could not read CSV file with any supported encoding")
+
+
+def file_sha256(path):
+    """sha256 hex digest of the file bytes, read chunk by chunk"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def decode(path, encoding):
+    """Yield (row_number, cells) for every CSV record; row 1 is the facility type header"""
+    with open(path, 'r', encoding=encoding) as file:
+        yield from enumerate(csv.reader(file), start=1)
+
+
+def normalize(rows, normalizers=()):
+    """Drop rows with an empty first cell; run the first cell through each normalizer"""
+    for row_number, cells in rows:
+        if not cells or not cells[0].strip():
+            continue
+        text = cells[0].strip()
+        for normalizer in normalizers:
+            text = normalizer(text)
+        yield {'row_number': row_number, 'text': text, 'cells': cells}
+
+
+def classify(records, facility_count, classifier=ROW_CLASSIFIER, initial_section=None):
+    """Turn records into ('section' | 'question' | 'subsection', payload) events
+
+    Rows are labelled by a row_classifier.RowClassifier. A question keeps the
+    uncleaned first cell as raw_text; subsection rows are reported in addition to
+    (not instead of) being questions.
+    """
+    current_section = initial_section
+    for record in records:
+        text, cells = record['text'], record['cells']
+        flags, header, applicability = classifier.classify(text, cells, facility_count)
+        if flags == SECTION:
+            current_section = header
+            yield 'section', {'section': header, 'row_number': record['row_number']}
+            continue
+        if not current_section:
+            continue
+
+        if flags & QUESTION:
+            yield 'question', {
+                'section': current_section,
+                'question': text,
+                'applicability': applicability,
+                'row_number': record['row_number'],
+                'raw_text': cells[0]
+            }
+        if flags & SUBSECTION:
+            yield 'subsection', {
+                'section': current_section,
+                'name': text.replace('--', '').strip(),
+                'row_number': record['row_number']
+            }
+
+
+def aggregate(events):
+    """Group events into blocks: {'section', 'header_row', 'questions', 'subsections'}
+
+    A block ends at the next section header, so a section whose header appears twice
+    in the CSV arrives as two blocks. Rows before the first header (when the
+    classifier starts with an initial section) form a block with header_row None.
+    """
+    block = None
+    for kind, payload in events:
+        if kind == 'section':
+            if block is not None:
+                yield block
+            block = {'section': payload['section'], 'header_row': payload['row_number'],
+                     'questions': [], 'subsections': []}
+            continue
+        if block is None or block['section'] != payload['section']:
+            if block is not None:
+                yield block
+            block = {'section': payload['section'], 'header_row': None, 'questions': [], 'subsections': []}
+        block['questions' if kind == 'question' else 'subsections'].append(payload)
+    if block is not None:
+        yield block
+
+
+def collect(blocks, log=print):
+    """Fold blocks into (sections in first-appearance order, questions, subsection rows)"""
+    sections, questions, subsections = [], [], []
+    seen = set()
+    for block in blocks:
+        if block['header_row'] is not None and block['section'] not in seen:
+            seen.add(block['section'])
+            sections.append(block['section'])
+            log(f"Found section: {block['section']}")
+        questions.extend(block['questions'])
+        subsections.extend(block['subsections'])
+    return sections, questions, subsections
+
+
+def read_facility_types(rows, normalizers=()):
+    """Consume the header row from a decode() stream: the non-empty facility type cells"""
+    for _, cells in rows:
+        types = [ft.strip() for ft in cells[1:] if ft.strip()]
+        for normalizer in normalizers:
+            types = [normalizer(ft) for ft in types]
+        return types
+    raise ValueError("CSV file must have at least 2 rows (headers and facility types)")
@@ -0,0 +1,478 @@
+/**
+ * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+ * Generated from: checklist-final.csv, dhis2_full_metadata_v2.json
+ * Checklist hash: 0c210a23b2f563962022feede57914aec778ba206f43463ae854f080d5b50cbb
+ *
+ * Comments/Remarks data elements paired with the data element they annotate. A comment
+ * field is shown for a facility type exactly when its main element passes that facility's
+ * filter in the comment's section, so the visibility is resolved here once per facility type.
+ * To regenerate this file, run: python src/config/generateFilters.py
+ */
+
+import { FACILITY_TYPES } from './sectionVisibilityTable.js';
+
+// comment data element id -> [main data element id (null for a standalone "Comments"),
+// facility visibility bitmask: bit i = FACILITY_TYPES[i]]
+export const COMMENT_FIELD_PAIRS = {
+  "GUHm0ghp9Tc": ["njVbMxxuvg4", 0x7fff],
+  "EaIXCub2vjL": [null, 0x4000],
+  "LEghzfULkDb": ["djiYFyxGWZg", 0x4000],
+  "eeRbQoKbcSb": ["H7kdjWG5fJg", 0x7fff],
+  "wVNQ7Zr0P93": ["yHuVCptuYIz", 0x4000],
+  "gLmK1C8qN1l": ["TwRB3UCkOsj", 0x7fff],
+  "BG25OkY21ax": ["kEMGyPm8YgH", 0x4000],
+  "UjVkPqvlOzU": ["pn9KD7DP06F", 0x7fff],
+  "ugMMaTRPFPh": ["VVDIUCrOZhk", 0x4000],
+  "eP8lVpOLrmy": ["YjmaVOE6X5z", 0x7fff],
+  "gWvs8M5mHAc": [null, 0x4000],
+  "VqYw0Gpvrz7": ["K3me4A3CyVO", 0x4000],
+  "T6ttPAEWAXj": [null, 0x4000],
+  "j78xuAxLOth": ["cZKJjxPFoww", 0x7fff],
+  "MJkboKCSgga": ["RJpcV1quGsc", 0x7fff],
+  "FOW8R4nw0dk": ["pCxcolinfQ0", 0x4000],
+  "ZYNEpUXv8uP": ["n83udLneaeN", 0x4000],
+  "Mgiu2FWlOGn": ["WPDGx28ourO", 0x4000],
+  "RfJqhIBXV3x": ["byjOFHQoXeR", 0x4000],
+  "FRVzUbpB3kw": ["OQZmAQOdQdv", 0x4000],
+  "l2yEMFsg7x6": ["zpT3datWlth", 0x4000],
+  "yQzCZWyIB74": ["YbchXGeJ4wS", 0x4000],
+  "DNRrLf2rXrK": ["O9uvz9XSrYt", 0x4000],
+  "Wqm6cAXEKLz": ["le1TGgvCBZg", 0x4000],
+  "S6sEPw1cfga": ["DePRL1qhL2h", 0x4000],
+  "Rigi3JbD1uJ": ["yZdMdovmTe2", 0x4000],
+  "HOjhVEnT49V": ["IHkPBKIhdV3", 0x4000],
+  "saiEmCbYbfD": ["YEJzAWThlVn", 0x4000],
+  "u1Yn9drjTTz": ["Rkc2IeVH5q0", 0x4000],
+  "qLufVFoZKiC": ["gBeJ3K1ywkM", 0x4000],
+  "fE7NDHBnRZd": ["AjsjkTGb6VV", 0x4000],
+  "ZCFbmNeweD8": ["haCwS0XeDaw", 0x4000],
+  "eHYyGQU3frk": ["Infy1FYZ3zt", 0x4000],
+  "l67IsGE5wWx": ["uJ243pr9mO7", 0x4000],
+  "P92mYnnx4VY": ["a3svKHUhCMh", 0x4000],
+  "ZG5w29zA5qQ": ["mo76seUNRXJ", 0x5dbd],
+  "g19U15f78W5": ["iDpm4lfA1f5", 0x4000],
+  "iap0A6QnWw6": ["xchGmvuJOhZ", 0x4000],
+  "UORywBjNZeV": ["eSzOidGUJnk", 0x4000],
+  "S8hfXRzzUfP": ["F6KntHS4RIo", 0x4000],
+  "Uaad40dCbVW": ["xuH8hPaE7To", 0x4000],
+  "nt62A6IAEMH": ["K4sqpgtJ28e", 0x4000],
+  "tfamarWpCHB": ["Xij5taW10fM", 0x4000],
+  "ymNXj5Fydxo": ["DcYSLey6DEk", 0x4000],
+  "koFgx1iSDi0": ["A5YsBHBtMn2", 0x4000],
+  "ugMrcs18w43": ["CxyydiHkvet", 0x4000],
+  "U2OAwqbh2W2": ["GFSn9jzXGNJ", 0x4000],
+  "jyDQmeZBZcU": ["vQZaV9P5WXk", 0x4000],
+  "FVDuwsUWqIZ": ["B1B7IdZeuQv", 0x4000],
+  "U9fFELybnE2": ["r1dTSdepqn7", 0x4000],
+  "IdwmPDZpXzO": ["BC47IOOd0yl", 0x4000],
+  "yeJzdkq0ywd": ["xygCixf7oVJ", 0x4000],
+  "NrjuGt1MTya": ["r5FqfU2hd0C", 0x4000],
+  "ZD78gM9dQAw": ["vbqCxJpRbcI", 0x4000],
+  "tzTh5P22876": ["DRLr2esWhkd", 0x4000],
+  "YywcnHSUGb6": ["hp53H0CiDWI", 0x4000],
+  "kZhFrLm9L8p": ["Lc9DUcjNH0f", 0x4000],
+  "uFMrXuV9asJ": ["HfMeeUeaUFA", 0x4000],
+  "GAfKyHl4MRF": ["GwZ7JvMOBgj", 0x4000],
+  "xbZp2biEN5C": ["OBGwJ9q3Cfm", 0x4000],
+  "ohlRcjqOtFi": ["YVoJmSOJBiT", 0x4000],
+  "WuYppkTlIYB": ["UwyYC4prx2A", 0x4000],
+  "NVJH6mMz7wL": ["winQ6rQXyCM", 0x4000],
+  "FLVw3J4FoHc": ["iS3AGybAD05", 0x4000],
+  "VjB9l1Qq7VL": ["uRxqDvMln2Y", 0x4000],
+  "r6LirX0QUgB": ["MEGNOmFATyn", 0x4000],
+  "x7vAmwFZurs": ["zHMOXO7ECgU", 0x4000],
+  "GGx8DJSLlZ8": ["PzO585BTTPy", 0x4000],
+  "LFH973c60rS": ["d6niZSLwoUR", 0x4000],
+  "N3NsT5w6Hed": ["P8La3kQQ1rP", 0x4000],
+  "IpuKKtcO6je": ["MyjDDGswRIN", 0x4000],
+  "bCzXHFN0VlH": ["Umzh169D0Wh", 0x4000],
+  "ogDApKjWMqY": ["AHRRULVJm4Y", 0x4000],
+  "iv0Wa7Snsuj": ["twg67q9eKdY", 0x4000],
+  "MB0Q2jhmifM": ["e4ZEEvw6Cjh", 0x4000],
+  "zJH86y1NdWY": ["I4ZcYUZ1ggP", 0x4000],
+  "GiD59YEmCJs": ["pK9vpMzAwEY", 0x4000],
+  "m6Z7oKEFbLT": ["uGuVwJLFG5g", 0x4000],
+  "woS6vJMckjZ": ["orbxURyCuQS", 0x4000],
+  "vC3uuovkzO3": ["DXoaGMPAnQ4", 0x4000],
+  "n6Zj5yc9Hwp": ["gF5pKhm1RBp", 0x4000],
+  "JJJeV9kzoYI": ["gWQItUcNe8G", 0x4000],
+  "pwlGhNHKheD": ["JF2rIOx3JUN", 0x4000],
+  "zVAvOIhcEam": ["ehfkWXer1WA", 0x4000],
+  "gZQsC4my7BO": ["iQF6gidooWS", 0x4000],
+  "I1GXZIFIfW9": ["vMq03oLrWou", 0x4000],
+  "rD2LLIFRcYU": ["RF3UXrEbrI6", 0x4000],
+  "ZBc5BkL5FJm": ["YwWxBLDihHE", 0x4000],
+  "TtkKfQz0axf": ["a0ecmzaBfCx", 0x4000],
+  "ru1p5UAhjRi": ["E8XTvp5bxMY", 0x4000],
+  "Vhcvu4HhSjK": ["rHYMWYEXj58", 0x4000],
+  "OuTp47PGfAY": ["dQkdVnokKUO", 0x4000],
+  "NoBCZnghtuN": ["dkNXQ93w6oz", 0x4000],
+  "VCG3xulShR9": ["BM9G8urxNpR", 0x4000],
+  "dy7PPHmijGR": ["z5pZrimGCBT", 0x4000],
+  "O920tqz3NSL": ["O43TNlTuILx", 0x5500],
+  "xdnMabySpc0": ["zdk5WtBfjXV", 0x4000],
+  "dMHRRJjpnEj": ["LM0eOpbQ8q5", 0x4000],
+  "qXObNGH1LQz": ["bmuvQs1kObt", 0x4000],
+  "mTReV6rmsnc": ["oxRa0E3q8sy", 0x4000],
+  "Hsykxex2NWe": ["g2JbLWd4AF8", 0x5500],
+  "FU8LNF8GxQ7": ["iVJdIhhru00", 0x4000],
+  "Mk2mOKrDboK": ["hmkmGgPJyd8", 0x4000],
+  "DgigfHYZaTw": ["qIDRAU1vkR2", 0x4000],
+  "Sdrc7AEdtTX": ["kF88qfBqIcB", 0x5500],
+  "iE8Pg5qNJUA": ["lW0Dx4i283A", 0x4000],
+  "ZqQbyfX3qop": ["jmooozWpjPo", 0x4000],
+  "vjVHmnKju8n": ["mTkImaTiBTR", 0x4000],
+  "bVtiHzfFFT1": ["Jnrukde44f2", 0x4000],
+  "ZmWuJm2gec4": ["VAAHz1QbVuS", 0x4000],
+  "s6UQnWyoJKP": ["WjMIPLJ1OTb", 0x4000],
+  "wN9xa6mX5HI": ["xVDfHzjELPe", 0x4000],
+  "UnAgl6j4THS": ["Cs8A2v8l3fm", 0x4000],
+  "bxz2hAGqF9C": ["XzcrqE98Gpn", 0x4000],
+  "nS5dJelgafe": ["JhK5lZdEus3", 0x4000],
+  "d95nIUpmWLU": ["VogHjOL0Z37", 0x4000],
+  "Fw8821nrU2S": ["q1AEyGdxIzA", 0x4000],
+  "vtX8AREHQbR": ["eSQMC92XVCt", 0x4000],
+  "nzAkRayt7Df": ["dFWkedaAugM", 0x4000],
+  "q6B8SCKT3jG": ["janEKTBUbZ6", 0x4000],
+  "chUDJHMUUjo": ["SLggAQ5gjaC", 0x4000],
+  "rZEsvaJ2JAv": ["y3VlFwSuwyg", 0x4000],
+  "mKH5cDRtz5l": ["iv4KGZ31UFg", 0x4000],
+  "K3RWoqpzWO9": ["xe9EAoUO1BE", 0x4000],
+  "QigLhGVXktv": ["R6Igrc3HVrV", 0x4000],
+  "uwLIM4FEMCk": ["K7Zd59SAM08", 0x4000],
+  "QAypbtvakLk": ["PN33QzYhoW7", 0x4000],
+  "ubITLIKTz2b": ["lTEGBfbErJS", 0x4000],
+  "S5iUN7r2Ojy": ["vbliazYZkft", 0x4000],
+  "h29ApcUbvyv": ["NzOYhpNhIy0", 0x4000],
+  "MW1h1lWJJfi": ["neYLIyx4rg9", 0x4000],
+  "vtzflfbwuzR": ["ngZZd5XAE5C", 0x4000],
+  "rTDiy9GgI7u": ["xUsMco0m1Ku", 0x5d89],
+  "S5kmd3zhuEu": ["YSD5wVIlW6U", 0x4000],
+  "ooQXR7oI40l": ["eqe0aurZxdf", 0x4000],
+  "PM5r2ONOHk5": ["LmO0Ils21qL", 0x4000],
+  "SAMfLxd2pNM": ["vb3mOQ2oj8b", 0x4000],
+  "gYgvOP55b5n": ["aUJqc1Gv7Y6", 0x4000],
+  "sEDLFa90jCz": ["NMUUA9pTLyN", 0x4000],
+  "t4j3eT5RFvs": ["pC91NrzYu0D", 0x4000],
+  "onjFGoCsSXz": ["eFhoAEEddm6", 0x4000],
+  "kJWkOQr7uLb": ["mGODfyjP5IN", 0x4000],
+  "CZcjFOXwZxx": ["cRm1U6teydb", 0x4000],
+  "EVXXyE0Bd2d": ["G8xqY9IYmhs", 0x4000],
+  "Aqipqz6hAjf": ["yB63Q5ILmWX", 0x4000],
+  "sCPFvnYotxr": ["eJNWykNI72C", 0x4000],
+  "YuyvKv79jcM": ["CPIhqdWoJ4H", 0x4000],
+  "pRTCVYXGhjN": ["BhYBCdTDZES", 0x4000],
+  "GoknYoBmsM5": ["H7c3x7xnaBX", 0x4000],
+  "zka5uDTkwbu": ["BOQF7L1WllS", 0x4000],
+  "wmA8YtHj5VQ": ["D5iheXOXqin", 0x4000],
+  "oHk789J89CI": ["X9th53UN1sX", 0x4000],
+  "Zo25ctLMBAl": ["eDm06c3p5LA", 0x4000],
+  "tc1Ak7IXvsj": ["osc2PBLguXH", 0x4000],
+  "OPTBUXRD7Wd": ["zxQ0LLOwLUr", 0x4000],
+  "FxYQu8h52Oc": ["uprGmkTcGDO", 0x4000],
+  "JHNbOzJzshj": ["N6cHTdkWOWa", 0x4000],
+  "wUxkvmwX19K": ["Wo2N81JjOVH", 0x4000],
+  "trjTn4P5Jiu": ["uW30aQR0z2m", 0x4000],
+  "HvLH7RxqO6i": ["cCVd4zidD85", 0x4000],
+  "lB3AV9AZbEJ": ["WfPryEWvA9s", 0x4000],
+  "Efp8X1USxsU": ["Am0IsvZvqhQ", 0x4000],
+  "vd5zCeTi5vL": ["aid7a4cb6PA", 0x4000],
+  "XM8JkCAxO45": ["CiU8zpFW6W4", 0x4000],
+  "gVFmqkM5hDG": ["jBojyX4dHuF", 0x4000],
+  "c3zY2OG6vii": ["tYiRsHQDhB2", 0x4000],
+  "vuUnHFjHZpA": ["DTCLrW3QSrt", 0x5d29],
+  "mAOAXTaTUZc": ["X1QQZty5U2P", 0x4000],
+  "bK5eH6nvyUY": ["LpI6eMUD4OF", 0x4000],
+  "gjWL27VAIw6": ["j6fmNmTWnTb", 0x4000],
+  "cgN0RcKwAAR": ["fCB8hXblPO5", 0x4000],
+  "K0HFgEXeyL7": ["sosV6o6DAEW", 0x4000],
+  "udcD768KUjN": ["IvpAZpiMQzR", 0x4000],
+  "VQzDaGeOmPj": ["X46ihL9r8S8", 0x4000],
+  "Mq9Uun1ObDK": ["jsxcKUwL1Ft", 0x4000],
+  "jlAvR6Z3pMJ": ["dPrLz0FdGY0", 0x4000],
+  "w2fR29EccmY": ["nqVRSQd18Nc", 0x4000],
+  "JXjBeHLw0hu": ["ChQHZFANfPd", 0x4000],
+  "nN5FpGzEihb": ["UOqlntDQAsg", 0x4000],
+  "THROTdcCYG0": ["V7IsJYJyNc0", 0x4000],
+  "Fgx3zHCwJfO": ["O0WkkFFTIP9", 0x4000],
+  "CoLzWwtvCQt": ["e8mVNuCWZ7g", 0x4000],
+  "bDsn5kuyc2X": ["McZfVxzdyFn", 0x4000],
+  "HuT26KVJWCY": ["k2Kqq07XteH", 0x4000],
+  "W80MofUfuRj": ["Amir3tTAJrq", 0x4000],
+  "ZKO03p5kz3b": ["cqZvniNOp5s", 0x4000],
+  "UQiXFZV7d5S": ["Y5MHW0JXjqL", 0x4000],
+  "LugACSNH2kU": ["qsRQgxuOAHx", 0x4000],
+  "meDm05v8Fwn": ["elSFItm3gQH", 0x4000],
+  "iZ49lHj7Fw8": ["muD3dmn10SW", 0x4000],
+  "kLTctvF0Lew": ["NeSLwyAZTxk", 0x4000],
+  "UHzDFLdx2qS": ["klKFpC6kw7g", 0x4000],
+  "ynp8Fasqhgz": ["q4JvYRWW3iq", 0x4000],
+  "V1fvCFYECIc": ["HK0EIxLDvdL", 0x7fff],
+  "HBAGIpQVwqu": ["mr7utTaVawZ", 0x4000],
+  "gqTqyNVTkDn": ["BEGgTv7VEzv", 0x7fff],
+  "gh6YmywBDjX": ["ObDk0BPFJ3C", 0x7ff8],
+  "T052J2NQ5nu": ["xlpzuLT848a", 0x4000],
+  "ZcYQRf0rbqI": ["M6BSrH8PdOr", 0x7fff],
+  "KEoW67CAvGJ": ["YjcJfKC6VIC", 0x4000],
+  "nQgkxA3zCI7": ["GqBHBz6Xp76", 0x7fff],
+  "xKf23VEdKFn": ["vBEmqHMIVoU", 0x7fff],
+  "QdtmUMoNj3y": ["LZKc7eKcXwy", 0x7fff],
+  "nQRpgCXUtmo": ["k3tlxVoH9aI", 0x7fff],
+  "XDcLYgUt44r": ["Bn64KbsTatC", 0x7fff],
+  "v4DWRidWHX9": ["IjNRqWzYbJV", 0x4000],
+  "edNRtSgmfRp": ["D6yET9Rm3Ql", 0x4000],
+  "teFycnNHffg": ["WCys8b95Qrw", 0x4000],
+  "fFkxEotqKMr": ["qxWs7aK3qGZ", 0x4000],
+  "haL5NS846lD": [null, 0x4000],
+  "IDjbZEskcAn": ["nhvhnVAVvJL", 0x7fff],
+  "sVg1BfiYFOM": ["nMjmvLsuWb3", 0x4000],
+  "cGaXqJ3WQZv": ["yneU548JrPo", 0x4000],
+  "uLriFyMP67f": ["DRxm6doz4JE", 0x4000],
+  "QaMhlQmfDRg": ["Bk8F1hvx0e6", 0x4000],
+  "xbhua0cFLCK": ["hZVuGyAaPgo", 0x4000],
+  "cJLkxdEF8iW": ["zVMTQWBGylv", 0x4000],
+  "SayGs3BTNi8": ["tyDhn8gbUP7", 0x4000],
+  "LRbe4LXH2WL": ["wjLqyKpPclD", 0x7fff],
+  "BO2pHqfNnqe": ["uiwrRhfPUX9", 0x4000],
+  "I6ufJBs2eOj": ["bWVuvn0rN0W", 0x4000],
+  "AZYYyEXBPdq": ["mE0keb9FteW", 0x7fff],
+  "JXVYLrXU2Vf": ["B5nBVnHXJEI", 0x7fff],
+  "VdDglcXKhiG": ["RPb92dW0ny5", 0x7fff],
+  "DvS8d23SiCJ": ["j1NRM3qsjFs", 0x4000],
+  "dhxBGPErLPh": ["ov9luioZOzD", 0x4000],
+  "RjRlb6IGeyU": ["yS52oKKn7Dm", 0x7fff],
+  "ju8RJe5LO7W": ["WQXl9t7sg4A", 0x4000],
+  "auSZrMIETCg": ["IyElrjsbNSK", 0x4000],
+  "seFH9aQPjMx": ["gpdBxYMWuUc", 0x4000],
+  "COT9AytnY5p": ["JQMCknLVgt3", 0x4000],
+  "HBu1OamWYAb": ["jjBmnZ5uPlF", 0x4000],
+  "FHsoCW528YG": ["wtaUweJvX6N", 0x4000],
+  "I5Gy70cLa6F": ["orhCqYiOFPU", 0x4000],
+  "HeMqL4nwf3C": ["F02JZuMvB8w", 0x4000],
+  "EMZeNoY2HWf": ["otJMZLk4I6E", 0x4000],
+  "slV6j02dvPt": ["h5PA6lC8rWN", 0x4000],
+  "ts9I75VkrOQ": ["UZfV5AENy4S", 0x4000],
+  "v5MGHzetIoy": ["Z6URVZaSbHv", 0x4000],
+  "v0GzJqXRInF": ["MqxA8ZvHOD0", 0x4000],
+  "J5uId6RerzN": ["QBQdMkjxDLe", 0x4000],
+  "zT7g93Q1Akm": ["vBQOAa3JeHX", 0x4000],
+  "sb8c3rJK2EX": ["xA0nleomhMu", 0x4000],
+  "nFqmvyXapxt": ["BZiv8uEcgM9", 0x4000],
+  "O8xRBLEXCWI": ["u7lRxXvuKz5", 0x4000],
+  "jbhjTBqpvua": ["xzZ4Y1SGUct", 0x4000],
+  "TjeYTixIXBk": ["DD9HFimnuZb", 0x4000],
+  "rsLGWChqc56": ["KUSBel3xMZE", 0x4000],
+  "J9w20Ggafbd": ["OjLgrQM29mc", 0x4000],
+  "TMTpIy4x2lg": ["FH513Kqonwb", 0x4000],
+  "jIfkl1jQ0no": ["wKgJFo5ORyz", 0x4000],
+  "z7xTksaC92t": ["f1gqIUAaun0", 0x4000],
+  "i4ZCdYOGws0": ["Q9flk5haxWU", 0x4000],
+  "gqrDt8Ywi6b": ["ErZMtyvLUKl", 0x4000],
+  "zAyr6YtaS78": ["nf0ibZEJrI9", 0x4000],
+  "rc93Y6foSUB": ["eZzngIE36M0", 0x4000],
+  "c04loWRGnN1": ["VY5CtmNXpTn", 0x4000],
+  "bOBkPc5UHj9": ["nd0SpGJzbUQ", 0x4000],
+  "gzi7hq4K3Yn": ["kWneouHAmNv", 0x4000],
+  "BIjXBLpn6yq": ["j3ha85Bps1I", 0x4000],
+  "esGu6tTM35R": ["tF3pkEruK47", 0x4000],
+  "R2wQcMX7LO9": ["z0peYL9vJiE", 0x4000],
+  "xOq0K7gpeGV": ["DcS4GwpuF6m", 0x4000],
+  "wWyQZbPogn0": ["BTJ9WOXHBhu", 0x4000],
+  "AmP8abs7JOH": ["TYxFUR2O9Eg", 0x4000],
+  "vB78XjFk05d": ["Bn2OFSsyhz9", 0x4000],
+  "SJl9jPf3hMB": ["CCM9rHS6duO", 0x4000],
+  "QrZ26GUXAdM": ["a7hYm51MDoF", 0x4000],
+  "lh4z5ZXxN2V": ["tnYiadgz4S9", 0x4000],
+  "KiT95tIkF0B": ["baqufgpNTn9", 0x4000],
+  "oWVg3bcJmPl": ["NNt58Tkvyw6", 0x4000],
+  "s0WhHvD3KOF": ["hXj8lQIbpL0", 0x4000],
+  "GNGTdc78KMl": ["BUwpL1WisT5", 0x4000],
+  "qIvXmk4N8sa": ["Y9OMiAfwZB8", 0x4000],
+  "AyRdo6ZMOBN": ["K3PruiwDCy7", 0x4000],
+  "vpLDfPyEivG": ["HZxYhjSCAHl", 0x4000],
+  "dsRbhfFgBHY": ["l1OeZtgkVxf", 0x4000],
+  "JwXPU08TcJn": ["WFylfmCz5dU", 0x4000],
+  "p3a5yAIP8qX": ["ROt6RErbvGL", 0x4000],
+  "f9dnuCX0PaW": ["cMVRc9XPfp3", 0x4000],
+  "cvnVULjmAb4": ["u2SykBLAisV", 0x4000],
+  "uadJCOgmZ6c": ["vOqhc2r1GDL", 0x4000],
+  "GesZom4DpWa": ["yhNJZ28Xtf1", 0x4000],
+  "phKQVLNwyxt": ["ACEoW8fDK6I", 0x4000],
+  "hdbXHtL3e5Z": ["nBoclCIFz16", 0x4000],
+  "fcGi8YewENK": ["ocmAsTk1lX9", 0x4000],
+  "ZQ2j9TrAaMo": ["gCGEHLp0hld", 0x4000],
+  "KwZVfmYE7oK": ["cE7VBhWGkLt", 0x4000],
+  "g7qEQPANdVT": ["fFKsS2I4jAE", 0x4000],
+  "JNQSKje6Czt": ["DeSZPFojN7a", 0x4000],
+  "wvKlNAXtj17": ["XRV0DKkJdYC", 0x4000],
+  "Ugi8JBduQEP": ["cWlCpPrRwaq", 0x4000],
+  "KN0Fle8qXPM": ["HipjFtf9PQ4", 0x4000],
+  "zlJTMIxoAqm": ["HaIdvJupSsN", 0x4000],
+  "ZgWu5rxUjik": ["uiRQqOvAUW1", 0x4000],
+  "DteiWSs0RrB": ["UFX6ypsG9kq", 0x4000],
+  "MWy2BsRmPAV": ["DKQgL5Dvfsz", 0x4000],
+  "YOiqZSdPWYE": ["qln9Bj7oSNa", 0x4000],
+  "KlHTXSzsqUA": ["hINnmTBYV5C", 0x4000],
+  "LpDKc4t8Mi7": ["uGxFSskZQ94", 0x4000],
+  "bEOXuIQZsDR": ["KUlwg1fk8Pq", 0x4000],
+  "yjprZ2Mmxel": ["rNlpZif0tGb", 0x4000],
+  "S21PXaH4JKl": ["djMqd4QC9yT", 0x4000],
+  "BGN23l7xOEu": ["GXJR1Wiuo03", 0x4000],
+  "ogzraBdU0v7": ["NHn3kLEe4gS", 0x4000],
+  "G3EFIDLJtTH": ["HM6hczlyD1Q", 0x4000],
+  "ueWTpyokvtj": ["jgUqA4o17he", 0x4000],
+  "VNqO0ac2bmC": ["QCpu6hUrxIw", 0x4000],
+  "w83CyVS6ftJ": ["btMZceQiRXb", 0x4000],
+  "fq0C7hyUZIP": ["LtNpHobQgDE", 0x4000],
+  "Lvh7ByHRxSM": ["DELz6bgerlO", 0x4000],
+  "li1reDtVLWx": ["x2K1qhN4zRa", 0x4000],
+  "mATejfSILta": ["wzPnvGBcLQk", 0x4000],
+  "o6de5b7rNnZ": ["JFeK293ImPz", 0x4000],
+  "jaGzoNiD7um": ["d5SvzJXq38N", 0x4000],
+  "XnbVtlF4zyW": ["oQJXKpIAW86", 0x4000],
+  "QJQG6NBZjtH": ["Q9M2bFDmC1O", 0x4002],
+  "Kng8aidwdkZ": ["G51fp24m6iO", 0x4002],
+  "Ni3DTJH3vK0": ["um0kxgsB9ZV", 0x4002],
+  "oU10WUEU0jP": ["OerorbZ4pSz", 0x4002],
+  "ob72gtd9jiB": ["DULjt2RQ4PH", 0x4000],
+  "ZxyIZosbizI": ["rjUBDMazCek", 0x4002],
+  "hNo7PwMHrJZ": ["ilo5hCRWyge", 0x4000],
+  "DN6nVxTYK7o": ["Liz2H8o6eEG", 0x4000],
+  "jOgi6reFDsJ": ["StFXMrvoBEJ", 0x4000],
+  "HuYOpq2AzEj": ["Shx6AMR7K4W", 0x4000],
+  "Fh0vzmtUpbi": ["tbfBthpreIg", 0x4000],
+  "dNkjq7WDAyx": ["l7UQb1ZoMTp", 0x4000],
+  "MHI6fglN3qy": ["IfsBXmeU6gk", 0x4000],
+  "WPbI1ZfRYW4": ["evMYK5Ghz7s", 0x4000],
+  "UgR91FXYKsi": ["RmlfadyBeoH", 0x4000],
+  "cymka0UWQhb": ["OP9Cutvn4ND", 0x4000],
+  "nxGJwVeyq6F": ["b1NEdVFSHDq", 0x4000],
+  "JIdOXZN9HAb": ["ICDMbExecUI", 0x4000],
+  "hODQj6lNR25": ["dPjysaOLnGl", 0x4000],
+  "nYs5hptmjfW": ["iXNhKRuwTzd", 0x4000],
+  "m8jWf7RP0Bo": ["lImzHYr3DvW", 0x4000],
+  "OYn8uQdAXSe": ["bFeTVApy9WU", 0x4000],
+  "s9w4Rt1j7LZ": ["sWHNTVBvAM7", 0x4000],
+  "B0BI2YgUhLr": ["Cjmd79YiENJ", 0x4000],
+  "htXqpoGJVy0": ["z6aNHn10ZFr", 0x4000],
+  "OPVC7fURkTS": ["LLTePakYJZp", 0x4000],
+  "GXsGeQIoBOR": ["M2wWRuh1ofa", 0x4000],
+  "ZDrBtu9034d": ["MvifOLptWsy", 0x4000],
+  "S8XIPtap0z5": ["XlEdImtcBWX", 0x4000],
+  "LAbMQziZS9I": ["SHquYGF36m4", 0x4000],
+  "U7amOGhtAPr": ["xfqgRIrkO7w", 0x4000],
+  "WEA60lOaz14": ["JufFeGr1byp", 0x4000],
+  "a1TjiH7OESo": ["nVM9CpJDjFE", 0x4000],
+  "JFZEsUTX5if": ["ANp4HOXlLje", 0x4000],
+  "IuAYzt8Qo1P": ["GLGFz7ecAtB", 0x4000],
+  "dOkR1T1XQ9K": ["ChURE02RjGC", 0x4002],
+  "ek8CVg3ToMz": ["GLU3EmbtfwE", 0x4002],
+  "grY6PLmpfZ9": ["gQOPsLqBmUc", 0x4002],
+  "pTxszea9Wno": ["pK93BJVuOOq", 0x4002],
+  "qFG0UM8hoLv": ["UJJ82xou4ru", 0x4000],
+  "ZRFdTSJNtup": ["GyaoTiENRts", 0x4000],
+  "MGM8HkPWRdT": ["UkLYxpHZCA9", 0x4000],
+  "trgLW5ocSaX": ["ZBCo6gqpPxf", 0x4000],
+  "vP2EIQzhTvY": ["zejdzHN4UsE", 0x4000],
+  "dTRYcxnEFi0": ["uYobtn2u6XJ", 0x4000],
+  "OnxJaOZCzRv": ["zPlmzYaj7pA", 0x4000],
+  "EPvyYXjch3g": ["PT0clWS82nB", 0x4000],
+  "gco1e7vQgaF": ["huNcwGbsCKx", 0x4000],
+  "t48D37jiw9Q": ["JikOCz8GLUI", 0x4000],
+  "AG2QuHLjPOw": ["BvrGist5VMI", 0x4000],
+  "nkIMQqwThHF": ["RAjqmi64ICd", 0x4000],
+  "Ukbe7MuSxHV": ["EvWkwRxVL1f", 0x4000],
+  "Y1orYa2WeJ5": ["rz0wUP61dhv", 0x4000],
+  "Xq0cOnZE5Fb": ["oP3un19g068", 0x4002],
+  "sem8LRYtEPK": ["YBsU8tAJCkr", 0x4000],
+  "CLiBc7hFeCA": ["BQIMA4KxUFi", 0x4002],
+  "zHtX8rI3mMz": ["WEqOUI3kS94", 0x4000],
+  "XaEr24WfRKS": ["WHLKTra5tNI", 0x4002],
+  "kRVWlyJKzg5": ["hr8RKGlFB9E", 0x4000],
+  "aCRBvcfi4Od": ["oFKB1I6o0pt", 0x4002],
+  "t5aMms4HVrP": ["AWngVL0sBQ5", 0x4000],
+  "mp1N3PjVesc": ["lwesaoWrRHK", 0x4000],
+  "M0WzfFj3seV": ["xeR6XgkSdwo", 0x4000],
+  "t9h3O2MqreB": ["iMKU673RVcO", 0x4002],
+  "Pz1kReyVNAD": [null, 0x4000],
+  "p71hJCLc4uT": ["qfOD72zKM9T", 0x4000],
+  "oZdDR5tGlsM": ["qt5nMrdFE2D", 0x4000],
+  "W0fcpBXV8hl": [null, 0x4000],
+  "pYHm3hcuObx": ["UfXpwNjRD4d", 0x4000],
+  "n30ACQGOby9": ["vdGUrHfonEy", 0x4000],
+  "zwz7UUsGanR": ["ffLrKwZszUv", 0x4000],
+  "DknKcHmt1UV": ["Z7UXbNvALos", 0x4002],
+  "kSo3W57hJqq": ["B9VKB0UzWD1", 0x4002],
+  "M4cuJuKHQJW": ["vjsBWj6NdYv", 0x4002],
+  "Sgfl5fvkZO9": ["JHtmJZCpGFt", 0x4002],
+  "BxaBFV9XgcZ": ["PnNiNAwVXRN", 0x4000],
+  "kKZbtR6JXNZ": ["ACMJOJRDlHk", 0x4000],
+  "XiMNdtfWgGQ": ["dKrNVBiAD8e", 0x4000],
+  "Trsd0KHn7hm": ["TVt51kfb8PP", 0x4000],
+  "iGHfb8ijl4g": ["uaZes2l4J3p", 0x4000],
+  "BtkfvLbnymZ": ["AkBGqh54nJY", 0x4000],
+  "URK426P3h0v": ["uMjNPhCzKbr", 0x4000],
+  "iqlZBp56tEe": ["Ir6D9yvtehS", 0x4000],
+  "vTeMxGEHrhp": ["B4jnvHs7uAF", 0x4000],
+  "muvsGrJ1ODK": ["Bnswni8ILFc", 0x4020],
+  "tHgJlWQlLsw": ["dPUlwZYyVey", 0x4000],
+  "kbuadAIFMH2": ["Ddz5ryJDiSh", 0x4020],
+  "QbF9Vg0EgBz": ["zNAdST4Nxjc", 0x4000],
+  "C1oL9AqP5ZV": ["NfINL7jdyYK", 0x4000],
+  "lwuyOSgU5RL": ["ZAkJN3LjSgc", 0x4000],
+  "tIJgoE8a01H": ["tIfrQ29xKkL", 0x4000],
+  "mobF1r8q2Mp": ["cCD6Qc1zLEh", 0x4000],
+  "U84eETGQWCV": ["UiBt5XmrLO3", 0x4000],
+  "JVxIEHjybvt": ["CjbApxoWQ7P", 0x4000],
+  "y4HCKimnoTl": ["WZmNce2sD8T", 0x4000],
+  "b3HArGw2lIi": ["n9IlKqRouy2", 0x4000],
+  "HNICLFkiPs7": ["xAghrG8jac3", 0x4000],
+  "lzBsH9cKiCl": ["c8ghTN9LObA", 0x4000],
+  "NMPJxDGugAj": ["RDI7sB02UTl", 0x4000],
+  "xRImksQSr5q": ["mzsPChng1Aa", 0x4000],
+  "EWzJndC94I8": ["CZhR3ys9IFC", 0x4000],
+  "Sy934fhFiKl": ["L5bvLW6SG17", 0x7fff],
+  "q1DKSIAy45c": ["WCNbTYVwrjS", 0x7fbf],
+  "hWyO08dzUjb": [null, 0x4000],
+  "oIpfA7L87RU": ["lCsWdvBjhEE", 0x4000]
+};
+
+const SERVICE_PREFIX = /^Service\s+/;
+
+/**
+ * Whether a data element is a paired Comments/Remarks field
+ * @param {string} dataElementId - DHIS2 data element id
+ * @returns {boolean}
+ */
+export function isCommentField(dataElementId) {
+  return Object.prototype.hasOwnProperty.call(COMMENT_FIELD_PAIRS, dataElementId);
+}
+
+/**
+ * Data element a Comments/Remarks field annotates
+ * @param {string} dataElementId - DHIS2 data element id of the comment field
+ * @returns {string|null|undefined} Main data element id, null for a standalone comment, undefined when not a comment field
+ */
+export function getMainDataElementId(dataElementId) {
+  return isCommentField(dataElementId) ? COMMENT_FIELD_PAIRS[dataElementId][0] : undefined;
+}
+
+/**
+ * Whether a Comments/Remarks field is shown for a facility type (inherited from its main element)
+ * @param {string} dataElementId - DHIS2 data element id of the comment field
+ * @param {string} facilityType - Facility type as used by facilityServiceFilters ("X" or "Service X")
+ * @returns {boolean|undefined} Visibility, or undefined when the field is not paired or the facility type has no filter
+ */
+export function isCommentFieldVisible(dataElementId, facilityType) {
+  if (!facilityType || !isCommentField(dataElementId)) return undefined;
+  const facility = FACILITY_TYPES.indexOf(String(facilityType).replace(SERVICE_PREFIX, ''));
+  if (facility === -1) return undefined;
+  return Math.floor(COMMENT_FIELD_PAIRS[dataElementId][1] / 2 ** facility) % 2 === 1;
+}
+
+export default {
+  COMMENT_FIELD_PAIRS,
+  isCommentField,
+  getMainDataElementId,
+  isCommentFieldVisible
+};
@@ -1,7 +1,7 @@
 /**
  * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
  * Generated from: checklist-final.csv
- * Generated on: 2026-02-01 15:11:49
+ * Checklist hash: 0c210a23b2f563962022feede57914aec778ba206f43463ae854f080d5b50cbb
  * Facility Type: Eye (Opthalmology /Optometry)
  *
  * To regenerate this file, run: python src/config/generateFilters.py
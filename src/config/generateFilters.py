@@ -12,12 +12,23 @@ Usage:
 
 Input:
     - src/config/checklist for facilities2.0.csv
+    - dhis2_full_metadata_v2.json (optional; only for commentFieldPairs.js)
 
 Output:
     - Individual .js files for each facility type in src/config/
     - Updated facilityServiceFilters.js with proper imports
     - Auto-generated facilityServiceDepartments.js with department mappings
+    - sectionVisibilityTable.js (facility type aliases + per-facility section visibility bitmaps)
+    - commentFieldPairs.js (Comments/Remarks data elements -> main data element and inherited
+      facility visibility, resolved from dhis2_full_metadata_v2.json)
+    - sectionFieldCounts.js (answerable fields per DHIS2 section and facility type: the
+      progress bar denominators, resolved from dhis2_full_metadata_v2.json)
     - Generation summary report
+    - generation_manifest.json (facilities -> sections -> questions with CSV rows)
+    - filter_source_map.json ((facility, section, showOnly index) -> CSV row and raw cell text)
+    - coverage_matrix.csv / coverage_matrix.json (facility x section question counts)
+    - .checklist_cache/checklist/index.json + sections/<id>.json (per-section checklist tree
+      chunks; a local build artifact, not shipped with the PWA)
 
 Author: Auto-generated by Augment Agent
 Date: 2025-09-02
@@ -25,130 +36,128 @@ Updated: 2025-09-21 (Added facilityServiceDepartments.js generation)
 """
 
 import csv
+import hashlib
 import json
 import re
 from datetime import datetime
 from pathlib import Path
 
+import checklist_pipeline as pipeline
+from canonical_keys import (canonical_key, clean_dhis2_name, clean_dhis2_section_name, facility_type_key,
+                            service_filter_key)
+from row_classifier import ROW_CLASSIFIER, clean_first_cell
+
+# Spelling fixes applied to the CSV header row's facility types. Keep the exact
+# spacing of the CSV master (e.g. "Nursing  Home").
+FACILITY_TYPE_STANDARDIZATION = {
+    'Physiotheraphy': 'Physiotherapy',
+    'Nursing Home': 'Nursing  Home', # Ensure double space internally if single space in CSV
+}
+
+# Legacy / DHIS2 labels of the CSV facility types, matched case- and whitespace-insensitively
+# (facility_type_key). Emitted into sectionVisibilityTable.js for every type present in the CSV.
+FACILITY_TYPE_ALIASES = {
+    'Clinic': 'General Practice',
+    'Potrait clinic': 'General Practice',
+    'Gynae': 'Obstetrics & Gynaecology',
+    'Gynae Clinics': 'Obstetrics & Gynaecology',
+    'Psycology': 'Psychology',
+    'Psychology clinic': 'Psychology',
+    'Eye': 'Eye (Opthalmology /Optometry)',
+    'Eye (opthalmologyoptometry  optician) Clinics': 'Eye (Opthalmology /Optometry)',
+    'Physio': 'Physiotherapy',
+    'Physiotheraphy': 'Physiotherapy',
+    'Dental clinic': 'Dental',
+    'ENT': 'Ear, Nose & Throat',
+    'ENT clinic': 'Ear, Nose & Throat',
+    'Rehab': 'Rehabilitation Centre',
+    'EMS': 'Emergency Medical Services',
+}
+
+# "SECTION A-" prefix the PWA ignores when matching DHIS2 section names to CSV sections
+SECTION_LABEL_PREFIX_RE = re.compile(r'^SECTION\s+[A-Z0-9]+\s*-\s*')
+
+# Comments/Remarks data elements (mirrors the comment check in FormPage.jsx)
+COMMENT_FIELD_RE = re.compile(r'\s*(Comments?|Remarks?)\s*$', re.IGNORECASE)
+# Suffix of a comment data element's DHIS2 name ("...: Is there a waste bin? Comments" / "... cmts")
+COMMENT_NAME_SUFFIX_RE = re.compile(r'\s*\b(Comments?|Remarks?|cmts?)\s*$', re.IGNORECASE)
+NON_ALNUM_RE = re.compile(r'[^0-9a-z]+')
+
+# Form labels that are not input fields (mirrors src/utils/formUtils.js)
+SUBSECTION_LABEL_RE = re.compile(r'\s*--\s*$')
+LONG_DASH_LABEL_RE = re.compile(r'\s*---+\s*$')
+NUMBER_PREFIX_RE = re.compile(r'^[\d.]+\s+(.+)$')
+
+# "SECTION A-" prefix FormPage.jsx strips from a section name before filtering its fields
+FORM_SECTION_PREFIX_RE = re.compile(r'^SECTION\s+[A-Z]\s*-\s*', re.IGNORECASE)
+
 class FacilityFilterGenerator:
-    def __init__(self, csv_path="checklist-final.csv"):
+    def __init__(self, csv_path="checklist-final.csv", config_dir="src/config", chunks_dir=".checklist_cache/checklist",
+                 metadata_path="dhis2_full_metadata_v2.json"):
         self.csv_path = csv_path
+        # DHIS2 program stage export; only used to pair Comments/Remarks fields with their main data elements
+        self.metadata_path = metadata_path
         self.facility_types = []
         self.sections = []
         self.questions_data = []
-        self.config_dir = Path("src/config")
-
-    def parse_csv(self):
-        """Parse the CSV file and extract facility types, sections, and questions"""
+        self.subsection_rows = []
+        # sha256 of the CSV bytes; embedded in every generated artifact so readers can tell which checklist it came from
+        self.checklist_hash = None
+        # Output locations; point them elsewhere to evaluate a checklist revision without touching the live config
+        self.config_dir = Path(config_dir)
+        self.chunks_dir = Path(chunks_dir)
+        self.row_classifier = ROW_CLASSIFIER
+
+    def parse_csv(self, normalizers=None):
+        """Parse the CSV file and extract facility types, sections, and questions
+
+        Rows stream through checklist_pipeline's decode -> normalize -> classify ->
+        aggregate stages; only the questions are kept. normalizers replaces the
+        default first-column cleanup (clean_question_text) with other text stages.
+        """
         print(f"Parsing CSV file: {self.csv_path}")
 
         # Try different encodings to handle the CSV file
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-        lines = None
-
-        for encoding in encodings:
-            try:
-                with open(self.csv_path, 'r', encoding=encoding) as file:
-                    reader = csv.reader(file)
-                    lines = list(reader)
-                print(f"[OK] Successfully read CSV with {encoding} encoding")
-                break
-            except UnicodeDecodeError:
-                print(f"[ERROR] Failed to read with {encoding} encoding")
-                continue
-
-        if lines is None:
-            raise ValueError("Could not read CSV file with any supported encoding")
-
-        if len(lines) < 2:
-            raise ValueError("CSV file must have at least 2 rows (headers and facility types)")
+        encoding = pipeline.detect_encoding(self.csv_path)
+        self.checklist_hash = pipeline.file_sha256(self.csv_path)
+        rows = pipeline.decode(self.csv_path, encoding)
 
         # Extract facility types from row 1 (skip first empty column)
         # Keep exact spacing (e.g., "Nursing  Home") to match CSV master exactly
         # Apply name standardization (e.g., Physiotheraphy -> Physiotherapy)
-        raw_types = [ft.strip() for ft in lines[0][1:] if ft.strip()]
-        
-        name_standardization = {
-            'Physiotheraphy': 'Physiotherapy',
-            'Nursing Home': 'Nursing  Home', # Ensure double space internally if single space in CSV
-        }
-        
-        self.facility_types = [name_standardization.get(ft, ft) for ft in raw_types]
+        raw_types = pipeline.read_facility_types(rows)
+        self.facility_types = [FACILITY_TYPE_STANDARDIZATION.get(ft, ft) for ft in raw_types]
         print(f"Found {len(self.facility_types)} facility types: {self.facility_types}")
 
         # Parse sections and questions
-        current_section = "GENERAL"  # Default section if none found yet
-
-        # Start from row 2 (index 1): row0 = headers of facility types, row1+ = sections/questions
-        for i, row in enumerate(lines[1:], start=2):
-            if not row or not row[0].strip():
-                continue
-
-            first_column = row[0].strip()
-            # Clean bullet points, dots, dashes and other prefixes
-            # BUT keep trailing -- for detection
-            clean_text = re.sub(r'^[\.\-\s]+', '', first_column)
-            
-            # Determine applicability per facility type on this row
-            applicability = []
-            for j, _ in enumerate(self.facility_types):
-                cell_value = row[j + 1].strip() if j + 1 < len(row) else ''
-                applicability.append(cell_value == '?')
-            has_any_applicability = any(applicability)
-
-            # Detect section headers
-            # A row is a section header IF:
-            # 1. It matches strong section header patterns (regardless of '?' markers in CSV)
-            # 2. OR It is ALL CAPS with length > 3 (regardless of '?' markers)
-            # This allows sections like "DENTAL" to be recognized even if they have applicability markers
-            
-            clean_text_upper = clean_text.upper()
-            is_strong_header = (
-                (clean_text_upper.startswith('SECTION ') and not clean_text.strip().endswith('--')) or 
-                (clean_text_upper.startswith('FACILITY-') and not clean_text.strip().endswith('--')) or
-                (clean_text_upper.startswith('CUSTOMER SATISFACTION') and not clean_text.strip().endswith('--')) or
-                (clean_text_upper.startswith('LIASON WITH PRIMARY HEALTH CARE') and not clean_text.strip().endswith('--')) or
-                (clean_text_upper.startswith('TOILET FACILITIES') and not clean_text.strip().endswith('--')) or
-                (clean_text.isupper() and len(clean_text) > 5 and not clean_text.strip().endswith('?') and not clean_text.strip().endswith('--'))
-            )
-            
-            # Recognize ALL CAPS text as section headers regardless of ? markers
-            is_weak_header = (
-                (clean_text.isupper() and len(clean_text) > 3 and not clean_text.strip().endswith('--'))
-            )
-
-            is_section_header = (
-                (is_strong_header or is_weak_header) and 
-                (clean_text and not clean_text[0].isdigit())
-            )
-
-            if is_section_header:
-                # Normalize: Uppercase, remove spaces around hyphens, and strip trailing --/symbols
-                current_section = re.sub(r'\s*-\s*', '-', clean_text.upper())
-                current_section = re.sub(r'--\s*$', '', current_section).strip()
-                # Remove common ending punctuation if it was used as a marker
-                current_section = re.sub(r'[?:\.;]+$', '', current_section).strip()
-                
-                if current_section not in self.sections:
-                    self.sections.append(current_section)
-                    print(f"Found section: {current_section}")
-            elif current_section:
-                # Treat as a question if either:
-                # - The text ends with '?', or
-                # - At least one facility column marks applicability with '?'
-                if clean_text.endswith('?') or has_any_applicability:
-                    self.questions_data.append({
-                        'section': current_section,
-                        'question': clean_text,
-                        'applicability': applicability,
-                        'row_number': i
-                    })
+        # Rows before the first header fall into a default "GENERAL" section (never emitted)
+        if normalizers is None:
+            normalizers = [self.clean_question_text]
+        records = pipeline.normalize(rows, normalizers)
+        events = pipeline.classify(records, len(self.facility_types), self.row_classifier, initial_section="GENERAL")
+        self.sections, self.questions_data, self.subsection_rows = pipeline.collect(pipeline.aggregate(events))
 
         print(f"Found {len(self.sections)} sections")
         print(f"Found {len(self.questions_data)} questions")
 
         return True
 
+    def clean_question_text(self, first_column):
+        """Clean bullet points, dots, dashes and other prefixes (keeps trailing -- for header detection)"""
+        return clean_first_cell(first_column)
+
+    def section_header_name(self, clean_text):
+        """Return the normalized section name if this first-column text is a section header, else None"""
+        # A row is a section header IF (see RULES in row_classifier.py):
+        # 1. It starts with a strong header prefix ("SECTION ", "FACILITY-", ...) regardless of '?' markers
+        # 2. OR It is ALL CAPS with length > 3 (regardless of '?' markers)
+        # and it neither starts with a digit nor ends with '--'
+        return self.row_classifier.section_name(clean_text)
+
+    def is_subsection_text(self, clean_text):
+        """Subsection rows: numbered items like "22.7 ..." (not "22.7.1 ...?") and "--" rows"""
+        return self.row_classifier.is_subsection(clean_text)
+
     def normalize_section_name(self, section_name):
         """Normalize section names for consistency"""
         # Section names are already partially normalized in parse_csv
@@ -190,6 +199,10 @@ class FacilityFilterGenerator:
         filename = filename.replace(',', '').replace(':', '').replace(';', '')
         return filename + '.js'
 
+    def sanitize_question(self, question):
+        """Collapse newlines/CRs so the question fits on one line of the emitted module"""
+        return question.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ').strip()
+
     def generate_js_file_content(self, facility_type, config):
         """Generate the JavaScript file content for a facility filter"""
         sanitized_name = facility_type.replace(' ', '').replace('(', '').replace(')', '').replace('-', '').replace('/', '').replace(',', '').replace(':', '').replace(';', '').replace('&', 'and')
@@ -197,7 +210,7 @@ class FacilityFilterGenerator:
         content = f'''/**
  * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
  * Generated from: {self.csv_path}
- * Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+ * Checklist hash: {self.checklist_hash}
  * Facility Type: {facility_type}
  *
  * To regenerate this file, run: python src/config/generateFilters.py
@@ -212,7 +225,7 @@ const {sanitized_name} = {{
 
             for question in section_config["showOnly"]:
                 # Sanitize: collapse actual newlines, remove CRs, and escape backslashes/quotes
-                sanitized = question.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ').strip()
+                sanitized = self.sanitize_question(question)
                 sanitized = sanitized.replace('\\', '\\\\').replace('"', '\\"')
                 content += f'            "{sanitized}",\n'
 
@@ -260,7 +273,7 @@ export default {sanitized_name};
         header = f'''/**
  * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
  * Generated from: {self.csv_path}
- * Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+ * Checklist hash: {self.checklist_hash}
  *
  * This file imports all individual clinic filter files and combines them
  * To regenerate this file, run: python src/config/generateFilters.py
@@ -380,10 +393,8 @@ export default facilityServiceFilters;
         print(f"[DONE] Generated main file: {main_file_path}")
         return main_file_path
 
-    def generate_facility_service_departments_file(self):
-        """Generate the facilityServiceDepartments.js file based on actual sections from CSV"""
-        print("Generating facilityServiceDepartments.js...")
-
+    def build_department_mapping(self):
+        """All departments (normalized sections in CSV order) and the departments of each facility type"""
         # Get all unique sections (departments) from the CSV
         all_departments = []
         for section in self.sections:
@@ -413,13 +424,21 @@ export default facilityServiceFilters;
 
             specialization_mapping[facility_type] = facility_departments
 
-            print(f"  {facility_type}: {len(facility_departments)} departments")
+        return all_departments, specialization_mapping
+
+    def generate_facility_service_departments_file(self):
+        """Generate the facilityServiceDepartments.js file based on actual sections from CSV"""
+        print("Generating facilityServiceDepartments.js...")
+
+        all_departments, specialization_mapping = self.build_department_mapping()
+        for facility_type, departments in specialization_mapping.items():
+            print(f"  {facility_type}: {len(departments)} departments")
 
         # Generate the JavaScript content
         content = f'''/**
  * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
  * Generated from: {self.csv_path}
- * Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+ * Checklist hash: {self.checklist_hash}
  *
  * This file defines facility service departments based on actual sections
  * found in the CSV checklist configuration.
@@ -497,6 +516,528 @@ export default {
 
         return departments_file_path
 
+    def build_section_visibility(self):
+        """Facility type aliases, section lookup keys and per-facility visible-section bitmaps
+
+        Bit i of a facility's bitmap is set when the facility has at least one applicable
+        question in departments[i] (the same rule as SPECIALIZATION_DEPARTMENT_MAPPING).
+        """
+        departments, specialization_mapping = self.build_department_mapping()
+
+        # Exact (upper-case) names win over names with the "SECTION X-" prefix stripped
+        section_index = {}
+        for i, department in enumerate(departments):
+            section_index.setdefault(department.upper(), i)
+        for i, department in enumerate(departments):
+            section_index.setdefault(SECTION_LABEL_PREFIX_RE.sub('', department.upper()), i)
+
+        # Questions above the first header (the implicit GENERAL section) belong to no department
+        positions = {department: i for i, department in enumerate(departments)}
+        bitmaps = []
+        for facility_type in self.facility_types:
+            mask = 0
+            for department in specialization_mapping[facility_type]:
+                if department in positions:
+                    mask |= 1 << positions[department]
+            bitmaps.append(format(mask, 'x'))
+
+        aliases = {}
+        for i, facility_type in enumerate(self.facility_types):
+            aliases.setdefault(facility_type_key(facility_type), i)
+        for alias, facility_type in FACILITY_TYPE_ALIASES.items():
+            if facility_type in self.facility_types:
+                aliases.setdefault(facility_type_key(alias), self.facility_types.index(facility_type))
+
+        return {
+            "facility_types": list(self.facility_types),
+            "sections": departments,
+            "aliases": aliases,
+            "section_index": section_index,
+            "bitmaps": bitmaps,
+        }
+
+    def generate_section_visibility_file(self):
+        """Generate sectionVisibilityTable.js: direct lookups for facility type aliases and section visibility"""
+        table = self.build_section_visibility()
+
+        def literal(value):
+            return json.dumps(value, indent=2, ensure_ascii=False)
+
+        content = f'''/**
+ * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+ * Generated from: {self.csv_path}
+ * Checklist hash: {self.checklist_hash}
+ *
+ * Section visibility precomputed from the CSV applicability columns: a facility type
+ * sees a section when it has at least one applicable question in it.
+ * To regenerate this file, run: python src/config/generateFilters.py
+ */
+
+// Canonical facility types (CSV header order)
+export const FACILITY_TYPES = {literal(table['facility_types'])};
+
+// Sections in CSV order (same as ALL_FACILITY_DEPARTMENTS)
+export const SECTIONS = {literal(table['sections'])};
+
+// facilityTypeKey(label) -> index into FACILITY_TYPES (canonical names and legacy labels)
+export const FACILITY_TYPE_ALIASES = {literal(table['aliases'])};
+
+// Upper-case section name, with and without the "SECTION X-" prefix -> index into SECTIONS
+export const SECTION_INDEX = {literal(table['section_index'])};
+
+// Visible sections per facility type (aligned with FACILITY_TYPES), hex bitmaps: bit i = SECTIONS[i]
+export const SECTION_VISIBILITY = {literal(table['bitmaps'])};
+'''
+
+        content += r'''
+const SECTION_PREFIX = /^SECTION\s+[A-Z0-9]+\s*-\s*/;
+const WORD_COUNT = Math.max(1, Math.ceil(SECTIONS.length / 32));
+
+// Hex bitmap -> 32-bit words, least significant word first
+const decodeBitmap = (hex) => {
+  const words = new Uint32Array(WORD_COUNT);
+  for (let word = 0, end = hex.length; end > 0 && word < WORD_COUNT; word += 1, end -= 8) {
+    words[word] = parseInt(hex.slice(Math.max(0, end - 8), end), 16);
+  }
+  return words;
+};
+
+const VISIBILITY_WORDS = SECTION_VISIBILITY.map(decodeBitmap);
+
+const isBitSet = (words, index) => ((words[index >>> 5] >>> (index & 31)) & 1) === 1;
+
+export const facilityTypeKey = (label) => String(label).trim().toLowerCase().replace(/\s+/g, ' ');
+
+/**
+ * Index of a facility type or legacy label in FACILITY_TYPES
+ * @param {string} label - Facility type, legacy label or DHIS2 value
+ * @returns {number} Index, or -1 when unknown
+ */
+export function getFacilityTypeIndex(label) {
+  if (!label) return -1;
+  const index = FACILITY_TYPE_ALIASES[facilityTypeKey(label)];
+  return index === undefined ? -1 : index;
+}
+
+/**
+ * Canonical facility type for a facility type or legacy label
+ * @param {string} label - Facility type, legacy label or DHIS2 value
+ * @returns {string|null} Canonical facility type, or null when unknown
+ */
+export function getCanonicalFacilityType(label) {
+  const index = getFacilityTypeIndex(label);
+  return index === -1 ? null : FACILITY_TYPES[index];
+}
+
+/**
+ * Index of a (DHIS2 or CSV) section name in SECTIONS, ignoring case and "SECTION X-" prefixes
+ * @param {string} sectionName - Section name
+ * @returns {number} Index, or -1 when the CSV has no such section
+ */
+export function getSectionIndex(sectionName) {
+  const key = String(sectionName || '').trim().toUpperCase();
+  let index = SECTION_INDEX[key];
+  if (index === undefined) {
+    index = SECTION_INDEX[key.replace(SECTION_PREFIX, '')];
+  }
+  return index === undefined ? -1 : index;
+}
+
+/**
+ * Whether a CSV section is visible for a facility type
+ * @param {string} sectionName - Section name
+ * @param {string} facilityType - Facility type or legacy label
+ * @returns {boolean|undefined} Visibility, or undefined when the section or facility type is unknown
+ */
+export function isSectionVisibleForFacility(sectionName, facilityType) {
+  const facility = getFacilityTypeIndex(facilityType);
+  const section = getSectionIndex(sectionName);
+  if (facility === -1 || section === -1) return undefined;
+  return isBitSet(VISIBILITY_WORDS[facility], section);
+}
+
+/**
+ * Sections visible for a facility type, in CSV order
+ * @param {string} facilityType - Facility type or legacy label
+ * @returns {Array<string>} Section names (empty for unknown facility types)
+ */
+export function getVisibleSectionsForFacilityType(facilityType) {
+  const facility = getFacilityTypeIndex(facilityType);
+  if (facility === -1) return [];
+  return SECTIONS.filter((_, section) => isBitSet(VISIBILITY_WORDS[facility], section));
+}
+
+export default {
+  FACILITY_TYPES,
+  SECTIONS,
+  FACILITY_TYPE_ALIASES,
+  SECTION_INDEX,
+  SECTION_VISIBILITY,
+  facilityTypeKey,
+  getFacilityTypeIndex,
+  getCanonicalFacilityType,
+  getSectionIndex,
+  isSectionVisibleForFacility,
+  getVisibleSectionsForFacilityType
+};
+'''
+
+        table_path = self.config_dir / "sectionVisibilityTable.js"
+        with open(table_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+        print(f"[DONE] Generated: {table_path}")
+        print(f"Section visibility: {len(table['facility_types'])} facility types x {len(table['sections'])} sections, "
+              f"{len(table['aliases'])} facility type aliases")
+        return table_path
+
+    def load_metadata(self):
+        """DHIS2 program stage export (tolerating BOMs and legacy encodings), or None when unavailable"""
+        if not Path(self.metadata_path).exists():
+            return None
+        for encoding in ['utf-8-sig', 'utf-8', 'latin-1']:
+            try:
+                with open(self.metadata_path, 'r', encoding=encoding) as f:
+                    return json.load(f)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+        return None
+
+    def shows_data_element(self, config, name, section_name):
+        """shouldShowDataElementForService for one facility filter config and section (facilityServiceFilters.js)"""
+        key = service_filter_key(name)
+
+        def listed(section_config):
+            return any(item == name or service_filter_key(item) == key
+                       for item in (self.sanitize_question(q) for q in section_config['showOnly']))
+
+        if not section_name:
+            return any(listed(section_config) for section_config in config.values())
+
+        section_key = service_filter_key(section_name)
+        matched = section_name if section_name in config else next(
+            (k for k in config if service_filter_key(k) == section_key), None)
+        if matched is not None:
+            return listed(config[matched])
+
+        lower = section_name.lower()
+        loose = next((k for k in config if lower in k.lower() or k.lower() in lower), None)
+        if loose is not None and listed(config[loose]):
+            return True
+        return any(listed(section_config) for section_config in config.values())
+
+    def build_comment_field_pairs(self, filter_configs, metadata):
+        """{comment data element id: (main data element id or None, facility visibility bitmask)}
+
+        A comment field is a program stage data element whose form name ends in
+        Comments/Remarks (most are just "Comments"). Its main data element is found from the
+        DHIS2 name, which repeats the question ("...: Is there a waste bin? Comments"): that
+        name minus the suffix is matched against the names of the other data elements, then
+        with spacing and punctuation ignored, then as question text against their form names.
+        Of several matches the one nearest in programStageDataElements order wins; a comment
+        without a match is standalone. Bit i of the mask is set when the main element passes
+        the filter of facility_types[i] in the comment's section (the main's section, or the
+        whole filter, when the comment is not in one); a standalone comment is checked under
+        its own name minus the suffix, as FormPage.jsx does.
+        """
+        def form_name(de):
+            return clean_dhis2_name(de.get('formName') or de.get('displayFormName') or de.get('displayName'))
+
+        def loose_key(text):
+            return NON_ALNUM_RE.sub('', text.casefold())
+
+        name_keys = [lambda text: canonical_key(text).rstrip(' ?.:'), loose_key]
+
+        sections = metadata.get('programStageSections', [])
+        section_of = {}
+        for section in sections:
+            for de in section.get('dataElements') or []:
+                section_of.setdefault(de['id'], clean_dhis2_section_name(section.get('displayName')))
+
+        # Stage order first, then any section data element missing from the stage list
+        stage = {}
+        for de in [psde['dataElement'] for psde in metadata.get('programStageDataElements', []) if psde.get('dataElement')]:
+            stage.setdefault(de['id'], de)
+        for section in sections:
+            for de in section.get('dataElements') or []:
+                stage.setdefault(de['id'], de)
+        stage = list(stage.values())
+        names = [form_name(de) for de in stage]
+        comments = [bool(COMMENT_FIELD_RE.search(name)) for name in names]
+
+        name_indexes = [{} for _ in name_keys]
+        form_index = {}
+        for position, de in enumerate(stage):
+            if comments[position]:
+                continue
+            for key, index in zip(name_keys, name_indexes):
+                index.setdefault(key(de.get('name') or ''), []).append(position)
+            form_index.setdefault(loose_key(names[position]), []).append(position)
+
+        def find_main(position):
+            base = COMMENT_NAME_SUFFIX_RE.sub('', stage[position].get('name') or '').strip()
+            lookups = [(index, key(base)) for key, index in zip(name_keys, name_indexes)]
+            lookups.append((form_index, loose_key(clean_dhis2_name(base))))
+            for index, key in lookups:
+                if key and key in index:
+                    return min(index[key], key=lambda candidate: (abs(candidate - position), candidate > position))
+            return None
+
+        pairs = {}
+        for position, de in enumerate(stage):
+            if not comments[position]:
+                continue
+            main = find_main(position)
+            if main is None:
+                main_id = None
+                name = names[position]
+                check_name = name[:COMMENT_FIELD_RE.search(name).start()].strip() or name
+                section_name = section_of.get(de['id'], '')
+            else:
+                main_id = stage[main]['id']
+                check_name = names[main]
+                section_name = section_of.get(de['id'], section_of.get(main_id, ''))
+
+            mask = 0
+            for i, facility_type in enumerate(self.facility_types):
+                config = filter_configs.get(facility_type)
+                if (facility_type == 'Hospital' or not config
+                        or self.shows_data_element(config, check_name, section_name)):
+                    mask |= 1 << i
+            pairs[de['id']] = (main_id, mask)
+        return pairs
+
+    def generate_comment_field_pairs_file(self, filter_configs, metadata):
+        """Generate commentFieldPairs.js: comment field -> main data element and inherited facility visibility"""
+        if metadata is None:
+            print(f"[WARN] DHIS2 metadata not found or unreadable: {self.metadata_path} (no comment pairs emitted)")
+            pairs = {}
+        else:
+            pairs = self.build_comment_field_pairs(filter_configs, metadata)
+
+        entries = ',\n'.join(
+            f"  {json.dumps(de_id)}: [{json.dumps(main_id)}, 0x{mask:x}]"
+            for de_id, (main_id, mask) in pairs.items()
+        )
+
+        content = f'''/**
+ * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+ * Generated from: {self.csv_path}, {self.metadata_path}
+ * Checklist hash: {self.checklist_hash}
+ *
+ * Comments/Remarks data elements paired with the data element they annotate. A comment
+ * field is shown for a facility type exactly when its main element passes that facility's
+ * filter in the comment's section, so the visibility is resolved here once per facility type.
+ * To regenerate this file, run: python src/config/generateFilters.py
+ */
+
+import {{ FACILITY_TYPES }} from './sectionVisibilityTable.js';
+
+// comment data element id -> [main data element id (null for a standalone "Comments"),
+// facility visibility bitmask: bit i = FACILITY_TYPES[i]]
+export const COMMENT_FIELD_PAIRS = {{
+{entries}
+}};
+'''
+
+        content += r'''
+const SERVICE_PREFIX = /^Service\s+/;
+
+/**
+ * Whether a data element is a paired Comments/Remarks field
+ * @param {string} dataElementId - DHIS2 data element id
+ * @returns {boolean}
+ */
+export function isCommentField(dataElementId) {
+  return Object.prototype.hasOwnProperty.call(COMMENT_FIELD_PAIRS, dataElementId);
+}
+
+/**
+ * Data element a Comments/Remarks field annotates
+ * @param {string} dataElementId - DHIS2 data element id of the comment field
+ * @returns {string|null|undefined} Main data element id, null for a standalone comment, undefined when not a comment field
+ */
+export function getMainDataElementId(dataElementId) {
+  return isCommentField(dataElementId) ? COMMENT_FIELD_PAIRS[dataElementId][0] : undefined;
+}
+
+/**
+ * Whether a Comments/Remarks field is shown for a facility type (inherited from its main element)
+ * @param {string} dataElementId - DHIS2 data element id of the comment field
+ * @param {string} facilityType - Facility type as used by facilityServiceFilters ("X" or "Service X")
+ * @returns {boolean|undefined} Visibility, or undefined when the field is not paired or the facility type has no filter
+ */
+export function isCommentFieldVisible(dataElementId, facilityType) {
+  if (!facilityType || !isCommentField(dataElementId)) return undefined;
+  const facility = FACILITY_TYPES.indexOf(String(facilityType).replace(SERVICE_PREFIX, ''));
+  if (facility === -1) return undefined;
+  return Math.floor(COMMENT_FIELD_PAIRS[dataElementId][1] / 2 ** facility) % 2 === 1;
+}
+
+export default {
+  COMMENT_FIELD_PAIRS,
+  isCommentField,
+  getMainDataElementId,
+  isCommentFieldVisible
+};
+'''
+
+        pairs_path = self.config_dir / "commentFieldPairs.js"
+        with open(pairs_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+        print(f"[DONE] Generated: {pairs_path}")
+        print(f"Comment field pairs: {len(pairs)} ({sum(1 for main_id, _ in pairs.values() if main_id)} with a main data element)")
+        return pairs_path
+
+    def is_answerable_field(self, name):
+        """False for labels the form renders without an input ("...--", ALL CAPS, "1.0 GOVERNANCE") and comment fields"""
+        def is_all_caps(value):
+            return len(value) > 3 and re.search(r'[A-Z]', value) and not re.search(r'[a-z]', value)
+
+        if SUBSECTION_LABEL_RE.search(name) and not LONG_DASH_LABEL_RE.search(name):
+            return False
+        number_prefixed = NUMBER_PREFIX_RE.match(name)
+        if is_all_caps(name.strip()) or (number_prefixed and number_prefixed.group(1) == number_prefixed.group(1).upper()
+                                         and is_all_caps(number_prefixed.group(1))):
+            return False
+        return not COMMENT_FIELD_RE.search(name)
+
+    def build_section_field_counts(self, filter_configs, metadata):
+        """{DHIS2 section id: (data elements in the section, answerable fields per facility type)}
+
+        Counts what progressFieldsBySection in FormPage.jsx collects: the section's data
+        elements minus labels and Comments/Remarks fields, kept when they pass the facility
+        filter (all of them for Hospital and facility types without a filter).
+        """
+        counts = {}
+        for section in metadata.get('programStageSections', []):
+            data_elements = section.get('dataElements') or []
+            section_name = FORM_SECTION_PREFIX_RE.sub('', section.get('displayName') or '', count=1)
+            names = [clean_dhis2_name(de.get('formName') or de.get('displayFormName') or de.get('displayName'))
+                     for de in data_elements]
+            names = [name for name in names if self.is_answerable_field(name)]
+
+            facility_counts = []
+            for facility_type in self.facility_types:
+                config = filter_configs.get(facility_type)
+                if facility_type == 'Hospital' or not config:
+                    facility_counts.append(len(names))
+                else:
+                    facility_counts.append(sum(1 for name in names if self.shows_data_element(config, name, section_name)))
+            counts[section['id']] = (len(data_elements), facility_counts)
+        return counts
+
+    def generate_section_field_counts_file(self, filter_configs, metadata):
+        """Generate sectionFieldCounts.js: progress bar denominators per DHIS2 section and facility type"""
+        if metadata is None:
+            print(f"[WARN] DHIS2 metadata not found or unreadable: {self.metadata_path} (no field counts emitted)")
+            counts = {}
+        else:
+            counts = self.build_section_field_counts(filter_configs, metadata)
+
+        entries = ',\n'.join(
+            f"  {json.dumps(section_id)}: [{size}, {json.dumps(facility_counts, separators=(',', ':'))}]"
+            for section_id, (size, facility_counts) in counts.items()
+        )
+
+        content = f'''/**
+ * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+ * Generated from: {self.csv_path}, {self.metadata_path}
+ * Checklist hash: {self.checklist_hash}
+ *
+ * Answerable fields per DHIS2 section and facility type: the data elements a facility's
+ * filter keeps, minus labels ("--" / ALL CAPS) and Comments/Remarks fields. These are the
+ * progress bar denominators, so the form does not have to re-filter a section to get them.
+ * To regenerate this file, run: python src/config/generateFilters.py
+ */
+
+import {{ FACILITY_TYPES }} from './sectionVisibilityTable.js';
+
+// DHIS2 section id -> [data elements in the section, answerable fields per facility type
+// (aligned with FACILITY_TYPES)]
+export const SECTION_FIELD_COUNTS = {{
+{entries}
+}};
+'''
+
+        content += r'''
+const SERVICE_PREFIX = /^Service\s+/;
+
+/**
+ * Number of answerable fields a section shows for a facility type
+ * @param {Object} section - DHIS2 program stage section ({ id, dataElements })
+ * @param {string} facilityType - Facility type as used by facilityServiceFilters ("X" or "Service X")
+ * @returns {number|undefined} Count, or undefined when the section is unknown, its data elements
+ *   changed since generation, or the facility type has no filter
+ */
+export function getSectionFieldCount(section, facilityType) {
+  if (!section || !facilityType) return undefined;
+  const entry = SECTION_FIELD_COUNTS[section.id];
+  if (!entry || entry[0] !== (section.dataElements || []).length) return undefined;
+  const facility = FACILITY_TYPES.indexOf(String(facilityType).replace(SERVICE_PREFIX, ''));
+  return facility === -1 ? undefined : entry[1][facility];
+}
+
+export default {
+  SECTION_FIELD_COUNTS,
+  getSectionFieldCount
+};
+'''
+
+        counts_path = self.config_dir / "sectionFieldCounts.js"
+        with open(counts_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+        print(f"[DONE] Generated: {counts_path}")
+        print(f"Section field counts: {len(counts)} sections x {len(self.facility_types)} facility types")
+        return counts_path
+
+    def build_coverage_matrix(self):
+        """Count applicable questions per facility type and section.
+
+        Returns a (facility types x sections) list of lists in self.facility_types /
+        self.sections order, built in a single pass over the question rows. (A NumPy
+        version was slower: converting the rows to an array costs more than the counting.)
+        """
+        n_facilities = len(self.facility_types)
+        section_index = {section: i for i, section in enumerate(self.sections)}
+        # Rows before the first header sit in the implicit "GENERAL" section, which is not emitted
+        questions = [q for q in self.questions_data if q['section'] in section_index]
+
+        matrix = [[0] * len(self.sections) for _ in range(n_facilities)]
+        for q in questions:
+            column = section_index[q['section']]
+            for i, applies in enumerate(q['applicability'][:n_facilities]):
+                if applies:
+                    matrix[i][column] += 1
+        return matrix
+
+    def export_coverage_matrix(self, matrix):
+        """Write the facility x section matrix next to generation_report.json"""
+        sections = [self.normalize_section_name(s) for s in self.sections]
+
+        csv_path = self.config_dir / "coverage_matrix.csv"
+        with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["Facility Type"] + sections + ["Total"])
+            for facility_type, counts in zip(self.facility_types, matrix):
+                writer.writerow([facility_type] + counts + [sum(counts)])
+
+        json_path = self.config_dir / "coverage_matrix.json"
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump({
+                "generated_on": datetime.now().isoformat(),
+                "source_file": self.csv_path,
+                "facility_types": self.facility_types,
+                "sections": sections,
+                "matrix": matrix,
+                "totals": [sum(counts) for counts in matrix]
+            }, file, indent=2)
+
+        print(f"Generated coverage matrix: {csv_path}, {json_path}")
+        return csv_path, json_path
+
     def generate_summary_report(self):
         """Generate a summary report of the generation process"""
         summary = {
@@ -511,11 +1052,11 @@ export default {
             }
         }
 
-        # Add per-facility statistics
+        # Add per-facility statistics (row totals of the facility x section matrix)
+        matrix = self.build_coverage_matrix()
         summary["facility_statistics"] = {}
-        for i, facility_type in enumerate(self.facility_types):
-            applicable_count = sum(1 for q in self.questions_data
-                                 if i < len(q['applicability']) and q['applicability'][i])
+        for facility_type, counts in zip(self.facility_types, matrix):
+            applicable_count = sum(counts)
             summary["facility_statistics"][facility_type] = {
                 "applicable_questions": applicable_count,
                 "coverage_percentage": round((applicable_count / len(self.questions_data)) * 100, 1)
@@ -526,8 +1067,229 @@ export default {
             json.dump(summary, file, indent=2)
 
         print(f"Generated report: {report_path}")
+        self.export_coverage_matrix(matrix)
         return summary
 
+    def build_manifest(self):
+        """Facilities -> sections -> questions (as emitted into the .js modules) with CSV rows"""
+        facilities = []
+        for i, facility_type in enumerate(self.facility_types):
+            sections = []
+            for section in self.sections:
+                questions = [
+                    {
+                        "question": self.sanitize_question(q['question']),
+                        "row_number": q['row_number']
+                    }
+                    for q in self.questions_data
+                    if q['section'] == section and i < len(q['applicability']) and q['applicability'][i]
+                ]
+                if questions:
+                    sections.append({
+                        "section": self.normalize_section_name(section),
+                        "questions": questions
+                    })
+
+            if sections:
+                facilities.append({
+                    "facility_type": facility_type,
+                    "module": self.sanitize_filename(facility_type),
+                    "sections": sections
+                })
+
+        return {
+            "source_file": self.csv_path,
+            # Same hash as the "Checklist hash:" header of every generated module; the verifiers
+            # only trust the manifest for modules carrying it
+            "checklist_hash": self.checklist_hash,
+            "sections": [self.normalize_section_name(s) for s in self.sections],
+            "facilities": facilities
+        }
+
+    def generate_manifest(self):
+        """Write generation_manifest.json: facilities -> sections -> questions with CSV rows.
+
+        Questions carry the exact text emitted into the .js modules, so verification
+        tools can load this file instead of re-parsing the generated JavaScript.
+        """
+        manifest = {"generated_on": datetime.now().isoformat(), **self.build_manifest()}
+
+        manifest_path = self.config_dir / "generation_manifest.json"
+        with open(manifest_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2, ensure_ascii=False)
+
+        print(f"Generated manifest: {manifest_path}")
+        return manifest_path
+
+    def section_id(self, section):
+        """Stable slug id for a section ("FACILITY-RECEPTION/WAITING AREA" -> "facility-reception-waiting-area")"""
+        return re.sub(r'[^a-z0-9]+', '-', self.normalize_section_name(section).lower()).strip('-') or 'section'
+
+    def node_id(self, *parts):
+        """Content-derived id, unchanged by row moves and by whitespace/quote/case edits"""
+        key = '\x00'.join(canonical_key(part) for part in parts)
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]
+
+    def build_checklist_tree(self):
+        """Sections -> subsections -> questions, each with a stable id.
+
+        Questions carry the text emitted into the .js modules and an applicability
+        bitmask over self.facility_types (bit i set = shown for facility type i).
+        Questions before a section's first subsection row sit directly on the section.
+        """
+        rows_by_section = {}
+        for sub in self.subsection_rows:
+            rows_by_section.setdefault(sub['section'], []).append((sub['row_number'], 0, sub))
+        for q in self.questions_data:
+            rows_by_section.setdefault(q['section'], []).append((q['row_number'], 1, q))
+
+        tree = []
+        used_section_ids = set()
+        for section in self.sections:
+            section_id = self.section_id(section)
+            suffix = 2
+            while section_id in used_section_ids:
+                section_id = f"{self.section_id(section)}-{suffix}"
+                suffix += 1
+            used_section_ids.add(section_id)
+
+            node = {"id": section_id, "name": self.normalize_section_name(section), "questions": [], "subsections": []}
+            used_ids = set()
+            target = node
+
+            for row_number, kind, item in sorted(rows_by_section.get(section, []), key=lambda r: (r[0], r[1])):
+                if kind == 0:
+                    base_id = f"{section_id}.{self.node_id(section, item['name'])}"
+                    text = item['name']
+                else:
+                    text = self.sanitize_question(item['question'])
+                    base_id = self.node_id(section, text)
+                # Repeated text within a section gets an occurrence suffix
+                node_id, occurrence = base_id, 2
+                while node_id in used_ids:
+                    node_id = f"{base_id}-{occurrence}"
+                    occurrence += 1
+                used_ids.add(node_id)
+
+                if kind == 0:
+                    target = {"id": node_id, "name": text, "row": row_number, "questions": []}
+                    node["subsections"].append(target)
+                else:
+                    mask = sum(1 << i for i, applies in enumerate(item['applicability']) if applies)
+                    target["questions"].append({"id": node_id, "text": text, "row": row_number, "mask": mask})
+
+            tree.append(node)
+        return tree
+
+    def build_source_map(self):
+        """{facility_type: {module, sections: {section: [[row_number, raw_text], ...]}}}
+
+        Entry i of a section lines up with showOnly[i] of the same section in the
+        facility's .js module (sections are keyed and overwritten exactly as in
+        generate_facility_filter), so provenance is a lookup, not a CSV re-parse.
+        """
+        facilities = {}
+        for i, facility_type in enumerate(self.facility_types):
+            sections = {}
+            for section in self.sections:
+                sources = [
+                    [q['row_number'], q.get('raw_text', q['question'])]
+                    for q in self.questions_data
+                    if q['section'] == section and i < len(q['applicability']) and q['applicability'][i]
+                ]
+                if sources:
+                    sections[self.normalize_section_name(section)] = sources
+            if sections:
+                facilities[facility_type] = {
+                    "module": self.sanitize_filename(facility_type),
+                    "sections": sections
+                }
+        return facilities
+
+    def generate_source_map(self):
+        """Write filter_source_map.json next to the modules it describes.
+
+        No timestamp: the file only changes when the checklist does.
+        """
+        source_map = {
+            "source_file": self.csv_path,
+            "checklist_hash": self.checklist_hash,
+            "facilities": self.build_source_map()
+        }
+
+        source_map_path = self.config_dir / "filter_source_map.json"
+        with open(source_map_path, 'w', encoding='utf-8') as file:
+            json.dump(source_map, file, ensure_ascii=False, separators=(',', ':'))
+
+        print(f"Generated source map: {source_map_path}")
+        return source_map_path
+
+    def write_compact_json(self, directory, stem, payload):
+        """Write payload as compact JSON to <stem>.json; returns the file name"""
+        filename = f"{stem}.json"
+        with open(directory / filename, 'w', encoding='utf-8') as file:
+            json.dump(payload, file, ensure_ascii=False, separators=(',', ':'))
+        return filename
+
+    def remove_stale_files(self, directory, pattern, keep):
+        """Delete files matching pattern that were not written by this run"""
+        for stale in directory.glob(pattern):
+            if stale.name not in keep:
+                stale.unlink()
+
+    def generate_checklist_chunks(self, tree=None):
+        """Write the checklist tree as one compact JSON chunk per section plus an index.
+
+        index.json lists the sections (id, name, chunk file, question
+        count, union of question masks), so a reader can pick out the sections of one
+        facility type and load only those chunks (sections/<id>.json).
+        They are written to the local cache (chunks_dir), not public/: the PWA does not
+        read them, as its forms render the DHIS2 program stage sections.
+        """
+        tree = tree if tree is not None else self.build_checklist_tree()
+        sections_dir = self.chunks_dir / "sections"
+        sections_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.checklist_hash is None:
+            self.checklist_hash = pipeline.file_sha256(self.csv_path)
+
+        index_sections = []
+        written = set()
+        for node in tree:
+            questions = node["questions"] + [q for sub in node["subsections"] for q in sub["questions"]]
+            mask = 0
+            for q in questions:
+                mask |= q["mask"]
+
+            filename = self.write_compact_json(sections_dir, node['id'], node)
+            written.add(filename)
+
+            index_sections.append({
+                "id": node["id"],
+                "name": node["name"],
+                "file": f"sections/{filename}",
+                "questions": len(questions),
+                "subsections": len(node["subsections"]),
+                "mask": mask
+            })
+
+        # Drop chunks of sections (or section contents) that no longer exist
+        self.remove_stale_files(sections_dir, '*.json', written)
+
+        index = {
+            "version": 2,
+            "source_file": self.csv_path,
+            "source_sha256": self.checklist_hash,
+            "facility_types": self.facility_types,
+            "sections": index_sections
+        }
+        index_path = self.chunks_dir / "index.json"
+        with open(index_path, 'w', encoding='utf-8') as file:
+            json.dump(index, file, ensure_ascii=False, separators=(',', ':'))
+
+        print(f"Generated {len(index_sections)} checklist chunks: {self.chunks_dir}")
+        return index_path
+
     def run(self):
         """Main execution method"""
         print("Starting Facility Filter Generation...")
@@ -536,9 +1298,11 @@ export default {
         try:
             # Parse the CSV file
             self.parse_csv()
+            self.config_dir.mkdir(parents=True, exist_ok=True)
 
             print("\nGenerating individual filter files...")
             generated_files = []
+            filter_configs = {}
 
             # Generate filter file for each facility type
             for i, facility_type in enumerate(self.facility_types):
@@ -546,6 +1310,7 @@ export default {
                 if config:  # Only generate if there are applicable questions
                     filepath = self.write_facility_filter_file(facility_type, config)
                     generated_files.append(filepath)
+                    filter_configs[facility_type] = config
                 else:
                     print(f"[WARN] No applicable questions found for: {facility_type}")
 
@@ -557,15 +1322,38 @@ export default {
             print(f"\nGenerating facilityServiceDepartments.js...")
             self.generate_facility_service_departments_file()
 
+            # Precomputed section visibility for sectionVisibilityConfig.js
+            print(f"\nGenerating sectionVisibilityTable.js...")
+            self.generate_section_visibility_file()
+
+            # Comments/Remarks fields paired with their main data elements from the DHIS2 metadata
+            metadata = self.load_metadata()
+            print(f"\nGenerating commentFieldPairs.js...")
+            self.generate_comment_field_pairs_file(filter_configs, metadata)
+
+            # Progress bar denominators per DHIS2 section from the same metadata
+            print(f"\nGenerating sectionFieldCounts.js...")
+            self.generate_section_field_counts_file(filter_configs, metadata)
+
             # Generate summary report
             print(f"\nGenerating summary report...")
             self.generate_summary_report()
 
+            # Generate machine-readable manifest and source map for the verification tools
+            self.generate_manifest()
+            self.generate_source_map()
+
+            # Per-section checklist chunks (stable ids, facility masks)
+            self.generate_checklist_chunks()
+
             print("-" * 60)
             print("Generation Complete!")
             print(f" Generated {len(generated_files)} facility filter files")
             print(f" Generated main filter file: facilityServiceFilters.js")
             print(f" Generated departments file: facilityServiceDepartments.js")
+            print(f" Generated section visibility table: sectionVisibilityTable.js")
+            print(f" Generated comment field pairs: commentFieldPairs.js")
+            print(f" Generated section field counts: sectionFieldCounts.js")
             print(f"Total entries: {len(self.questions_data)}")
             print(f"Facility types: {len(self.facility_types)}")
             print(f"Sections: {len(self.sections)}")
@@ -24,11 +24,24 @@ Date: 2025-09-02
 Updated: 2025-09-21 (Added facilityServiceDepartments.js generation)
 """
 
-import csv
 import json
 from datetime import datetime
 from pathlib import Path
 
+import checklist_pipeline as pipeline
+from canonical_keys import repair_text
+from row_classifier import RULES, RowClassifier
+
+# This generator's header rule: fully capitalized names (no lowercase letters), longer
+# than 3 characters, no number prefix ("21.16 ELISA", "1.0 GOVERNANCE"), no trailing "--"
+# ("ELISA--"); names are used as written and no subsections are tracked
+HEADER_CLASSIFIER = RowClassifier({
+    **RULES,
+    'header_prefixes': (),
+    'header_normalize': False,
+    'subsection_patterns': (),
+})
+
 
 def normalize_text(text):
     """
@@ -36,66 +49,10 @@ def normalize_text(text):
 
     This handles common encoding problems when CSV files are created in Windows
     with Windows-1252 encoding but read as UTF-8 or Latin-1, causing character corruption.
-
-    Mappings:
-        ô → " (Left double quote)
-        ö → " (Right double quote)
-        ò → ' (Left single quote)
-        ó → ' (Right single quote)
-        – → - (En dash)
-        — → - (Em dash)
-        … → ... (Ellipsis)
-        � → (removed) (Unicode replacement character)
-
-    Windows-1252 control characters (when read as Latin-1):
-        \x91 → ' (Left single quote)
-        \x92 → ' (Right single quote / apostrophe)
-        \x93 → " (Left double quote)
-        \x94 → " (Right double quote)
-        \x96 → - (En dash)
-        \x97 → - (Em dash)
-        \x85 → ... (Ellipsis)
-
-    Unicode curly quotes:
-        ' → ' (Right single quote U+2019)
-        ' → ' (Left single quote U+2018)
-        " → " (Left double quote U+201C)
-        " → " (Right double quote U+201D)
+    The mapping table (mojibake, Windows-1252 control characters, curly quotes) lives in
+    canonical_keys.MOJIBAKE_REPLACEMENTS and is applied in a single str.translate pass.
     """
-    if not text:
-        return text
-
-    replacements = {
-        # Corrupted UTF-8 characters (Windows-1252 misread as UTF-8)
-        'ô': '"',   # Left double quote
-        'ö': '"',   # Right double quote
-        'ò': "'",   # Left single quote
-        'ó': "'",   # Right single quote
-        '–': '-',   # En dash
-        '—': '-',   # Em dash
-        '…': '...', # Ellipsis
-        '�': '',    # Unicode replacement character (remove)
-
-        # Windows-1252 control characters (when read as Latin-1)
-        '\x91': "'",   # Left single quote
-        '\x92': "'",   # Right single quote / apostrophe
-        '\x93': '"',   # Left double quote
-        '\x94': '"',   # Right double quote
-        '\x96': '-',   # En dash
-        '\x97': '-',   # Em dash
-        '\x85': '...', # Ellipsis
-
-        # Unicode curly quotes (normalize to straight quotes)
-        ''': "'",   # Right single quote U+2019
-        ''': "'",   # Left single quote U+2018
-        '"': '"',   # Left double quote U+201C
-        '"': '"',   # Right double quote U+201D
-    }
-
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-
-    return text
+    return repair_text(text)
 
 
 class FacilityFilterGenerator:
@@ -107,88 +64,41 @@ class FacilityFilterGenerator:
         self.config_dir = Path("src/config")
 
     def parse_csv(self):
-        """Parse the CSV file and extract facility types, sections, and questions"""
+        """Parse the CSV file and extract facility types, sections, and questions
+
+        Uses the streaming stages in checklist_pipeline.py with this script's own
+        normalizer (normalize_text) and section header rule plugged in.
+        """
         print(f"📄 Parsing CSV file: {self.csv_path}")
 
         # Try different encodings to handle the CSV file
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-        lines = None
-
-        for encoding in encodings:
-            try:
-                with open(self.csv_path, 'r', encoding=encoding) as file:
-                    reader = csv.reader(file)
-                    lines = list(reader)
-                print(f"✅ Successfully read CSV with {encoding} encoding")
-                break
-            except UnicodeDecodeError:
-                print(f"❌ Failed to read with {encoding} encoding")
-                continue
-
-        if lines is None:
-            raise ValueError("Could not read CSV file with any supported encoding")
-
-        if len(lines) < 2:
-            raise ValueError("CSV file must have at least 2 rows (headers and facility types)")
+        encoding = pipeline.detect_encoding(
+            self.csv_path, log=lambda message: print(message.replace('[ERROR]', '❌').replace('[OK]', '✅'))
+        )
+        rows = pipeline.decode(self.csv_path, encoding)
 
         # Extract facility types from row 1 (skip first empty column)
         # Apply normalization to handle corrupted special characters
-        self.facility_types = [normalize_text(ft.strip()) for ft in lines[0][1:] if ft.strip()]
+        self.facility_types = pipeline.read_facility_types(rows, [normalize_text])
         print(f"🏥 Found {len(self.facility_types)} facility types: {self.facility_types}")
 
         # Parse sections and questions
-        current_section = None
-
-        # Start from row 2 (index 1): row0 = headers of facility types, row1+ = sections/questions
-        for i, row in enumerate(lines[1:], start=2):
-            if not row or not row[0].strip():
-                continue
-
-            # Normalize text to handle corrupted special characters from CSV encoding issues
-            first_column = normalize_text(row[0].strip())
-
-            # Detect section headers - fully capitalized names (no lowercase letters)
-            # Rules:
-            # 1. Must be fully uppercase (punctuation allowed)
-            # 2. Must be longer than 3 characters
-            # 3. Must NOT start with a number (no number prefixes like "21.16 ELISA", "1.0 GOVERNANCE")
-            # 4. Must NOT end with "--" (excludes subsection headers like "ELISA--", "Rapid HIV Testing--")
-            if (first_column and
-                first_column.isupper() and
-                len(first_column) > 3 and
-                not first_column[0].isdigit() and
-                not first_column.endswith('--')):
-
-                current_section = first_column
-                if current_section not in self.sections:
-                    self.sections.append(current_section)
-                    print(f"📋 Found section: {current_section}")
-
-            # Detect questions (lines with ? that are not section headers)
-            elif current_section:
-                # Determine applicability per facility type on this row
-                applicability = []
-                for j, _ in enumerate(self.facility_types):
-                    cell_value = row[j + 1].strip() if j + 1 < len(row) else ''
-                    applicability.append(cell_value == '?')
-
-                # Treat as a question if either:
-                # - The text ends with '?', or
-                # - At least one facility column marks applicability with '?'
-                has_any_applicability = any(applicability)
-                if first_column.endswith('?') or has_any_applicability:
-                    self.questions_data.append({
-                        'section': current_section,
-                        'question': first_column,
-                        'applicability': applicability,
-                        'row_number': i
-                    })
+        # Normalize text to handle corrupted special characters from CSV encoding issues
+        records = pipeline.normalize(rows, [normalize_text])
+        events = pipeline.classify(records, len(self.facility_types), HEADER_CLASSIFIER)
+        self.sections, self.questions_data, _ = pipeline.collect(
+            pipeline.aggregate(events), log=lambda message: print(f"📋 {message}")
+        )
 
         print(f"📋 Found {len(self.sections)} sections")
         print(f"❓ Found {len(self.questions_data)} questions")
 
         return True
 
+    def section_header_name(self, first_column):
+        """Section name if the (normalized) first column is a section header, else None"""
+        return HEADER_CLASSIFIER.section_name(first_column)
+
     def normalize_section_name(self, section_name):
         """Normalize section names for consistency"""
         # Section names are already properly formatted in the CSV (fully capitalized)
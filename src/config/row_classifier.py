@@ -0,0 +1,168 @@
+"""
+One classifier for checklist CSV rows, shared by the generators and the root-level tools.
+
+Every row is labelled in a single pass from its (normalized) first cell and its
+applicability cells:
+
+    SECTION     section header: a known header prefix ("SECTION ", "FACILITY-", ...)
+                or ALL CAPS text, never starting with a digit or ending with "--"
+    QUESTION    ends with '?' or has a '?' applicability marker
+    SUBSECTION  "... --" rows, ":--" rows and numbered "22.7 ..." items
+    NOISE       everything else
+
+QUESTION and SUBSECTION are bit flags and can be combined (a "--" row with '?'
+markers is both); a SECTION row is never anything else.
+
+The rules are a declarative table (RULES) compiled once by RowClassifier into a
+prefix tuple and one alternation regex, so classifying a row costs one upper() of
+the first few characters, one isupper() and at most one regex search.
+"""
+
+import csv
+import re
+
+from canonical_keys import BULLET_RE
+
+NOISE = 0
+SECTION = 1
+QUESTION = 2
+SUBSECTION = 4
+
+LABELS = {SECTION: 'section', SUBSECTION: 'subsection', QUESTION: 'question', NOISE: 'noise'}
+
+RULES = {
+    # Case-insensitive prefixes that make a row a header even when it is not ALL CAPS
+    'header_prefixes': (
+        'SECTION ',
+        'FACILITY-',
+        'CUSTOMER SATISFACTION',
+        'LIASON WITH PRIMARY HEALTH CARE',
+        'TOILET FACILITIES',
+    ),
+    # ALL CAPS rows of at least this many characters are headers
+    'header_min_caps_length': 4,
+    # Header names are upper-cased, "A - B" becomes "A-B", trailing "--" and ?:.; are dropped
+    'header_normalize': True,
+    # Any match makes a non-header row a subsection
+    'subsection_patterns': (
+        r'--\Z',
+        r':--',
+        r'\A\d+(?:\.\d+){1,2}\s(?!.*\?\Z)',  # "22.7 Item" but not "22.7.1 Item?"
+    ),
+}
+
+_DASH_RE = re.compile(r'\s*-\s*')
+_TRAILING_DASHES_RE = re.compile(r'--\s*$')
+_TRAILING_PUNCTUATION_RE = re.compile(r'[?:\.;]+$')
+
+
+def clean_first_cell(text):
+    """Strip the leading bullets/dots/dashes the checklist uses (keeps trailing -- for detection)"""
+    return BULLET_RE.sub('', text)
+
+
+class RowClassifier:
+    """RULES compiled into a single-pass row classifier"""
+
+    def __init__(self, rules=RULES):
+        self.rules = rules
+        self.prefixes = tuple(p.upper() for p in rules['header_prefixes'])
+        # upper() never shortens a string, so the first len(prefix) characters decide a prefix match
+        self.prefix_span = max((len(p) for p in self.prefixes), default=0)
+        self.min_caps_length = rules['header_min_caps_length']
+        self.normalize = rules['header_normalize']
+        patterns = rules['subsection_patterns']
+        self.subsection_re = re.compile('|'.join(f'(?:{p})' for p in patterns), re.DOTALL) if patterns else None
+
+    def section_name(self, text):
+        """Header name if the (cleaned) first cell is a section header, else None"""
+        if not text or text[0].isdigit() or text.rstrip().endswith('--'):
+            return None
+        if not ((text.isupper() and len(text) >= self.min_caps_length)
+                or (self.prefixes and text[:self.prefix_span].upper().startswith(self.prefixes))):
+            return None
+        if not self.normalize:
+            return text
+
+        section = _DASH_RE.sub('-', text.upper())
+        section = _TRAILING_DASHES_RE.sub('', section).strip()
+        return _TRAILING_PUNCTUATION_RE.sub('', section).strip()
+
+    def is_subsection(self, text):
+        return bool(self.subsection_re and self.subsection_re.search(text))
+
+    @staticmethod
+    def applicability(cells, facility_count=None):
+        """'?' markers of the facility columns (all columns after the first when facility_count is None)"""
+        if facility_count is None:
+            return [cell.strip() == '?' for cell in cells[1:]]
+        marks = [cell.strip() == '?' for cell in cells[1:facility_count + 1]]
+        return marks + [False] * (facility_count - len(marks))
+
+    def classify(self, text, cells=(), facility_count=None):
+        """(flags, section name or None, applicability or None) for one row"""
+        name = self.section_name(text)
+        if name is not None:
+            return SECTION, name, None
+
+        applicability = self.applicability(cells, facility_count)
+        flags = QUESTION if text.endswith('?') or any(applicability) else NOISE
+        if self.is_subsection(text):
+            flags |= SUBSECTION
+        return flags, None, applicability
+
+    def iter_rows(self, rows, facility_count=None, start=1):
+        """Classify raw CSV rows, tracking the current section
+
+        Yields (row_number, flags, section, first_cell, cells) for every row with a
+        non-empty first cell; first_cell is the stripped, uncleaned cell the tools
+        report, section the header name the row belongs to (or is).
+        """
+        section = None
+        for row_number, cells in enumerate(rows, start=start):
+            if not cells or not cells[0].strip():
+                continue
+            first_cell = cells[0].strip()
+            flags, name, _ = self.classify(clean_first_cell(first_cell), cells, facility_count)
+            if flags == SECTION:
+                section = name
+            yield row_number, flags, section, first_cell, cells
+
+
+def label(flags):
+    """Primary label of a flag set: section > subsection > question > noise"""
+    for flag in (SECTION, SUBSECTION, QUESTION):
+        if flags & flag:
+            return LABELS[flag]
+    return LABELS[NOISE]
+
+
+ROW_CLASSIFIER = RowClassifier()
+
+
+def read_checklist_rows(path='checklist-final.csv', encodings=('utf-8', 'utf-8-sig', 'latin-1', 'cp1252')):
+    """All CSV rows with the first encoding that reads the whole file"""
+    for encoding in encodings:
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                return list(csv.reader(f))
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def iter_sections(rows, facility_count=None, classifier=ROW_CLASSIFIER):
+    """Group the QUESTION rows of raw CSV rows by section: yields (section, [(row_number, first_cell, cells)])
+
+    Sections come out in CSV order; a section whose header appears twice is yielded twice.
+    """
+    current, questions = None, []
+    for row_number, flags, section, first_cell, cells in classifier.iter_rows(rows, facility_count):
+        if flags == SECTION:
+            if current is not None:
+                yield current, questions
+            current, questions = section, []
+        elif current is not None and flags & QUESTION:
+            questions.append((row_number, first_cell, cells))
+    if current is not None:
+        yield current, questions
@@ -0,0 +1,77 @@
+/**
+ * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+ * Generated from: checklist-final.csv, dhis2_full_metadata_v2.json
+ * Checklist hash: 0c210a23b2f563962022feede57914aec778ba206f43463ae854f080d5b50cbb
+ *
+ * Answerable fields per DHIS2 section and facility type: the data elements a facility's
+ * filter keeps, minus labels ("--" / ALL CAPS) and Comments/Remarks fields. These are the
+ * progress bar denominators, so the form does not have to re-filter a section to get them.
+ * To regenerate this file, run: python src/config/generateFilters.py
+ */
+
+import { FACILITY_TYPES } from './sectionVisibilityTable.js';
+
+// DHIS2 section id -> [data elements in the section, answerable fields per facility type
+// (aligned with FACILITY_TYPES)]
+export const SECTION_FIELD_COUNTS = {
+  "u0PCMQsjZnU": [0, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]],
+  "GjvSxtEd4JA": [5, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,5]],
+  "HGLcAB3lX4R": [22, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,22]],
+  "mRY5b1RmbHc": [60, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,60]],
+  "YEcud3shpO8": [39, [1,1,1,1,1,1,1,1,1,1,1,1,1,1,39]],
+  "Twiz1k4a287": [32, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,32]],
+  "qCEoj588vmU": [42, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,42]],
+  "VtdLFdVWDPN": [18, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,18]],
+  "AThKRhifwIG": [51, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,48]],
+  "gzZwqucnCwK": [0, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]],
+  "s8TL3p1oxIb": [10, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,10]],
+  "VZDVq0eMP68": [1, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]],
+  "ye33CI1W8uZ": [50, [44,43,44,44,44,44,37,43,44,44,44,44,44,44,47]],
+  "ysppDGzvHJ8": [13, [10,10,10,10,10,10,6,10,10,10,10,10,10,10,12]],
+  "bZSnqFrzkOc": [18, [14,14,14,14,14,14,14,14,14,14,14,14,14,14,17]],
+  "Ky5idv6Pcst": [16, [15,15,15,15,15,15,15,15,15,15,15,14,14,15,16]],
+  "uFcA2E0sxwD": [12, [7,7,7,7,7,7,7,7,7,7,7,7,7,7,11]],
+  "sGL56AI8kDG": [18, [15,4,10,15,1,15,0,13,15,0,15,15,15,1,17]],
+  "nSo0tnro1gU": [141, [48,2,26,62,27,35,1,42,39,3,42,37,36,8,139]],
+  "UtMyBWadbH6": [51, [40,1,6,33,8,10,0,33,34,0,38,34,35,3,51]],
+  "gzoxItM534d": [15, [13,2,1,13,2,3,1,13,12,0,13,13,13,13,15]],
+  "WKZjlvrKUfk": [21, [18,18,5,18,6,6,1,18,18,0,18,18,18,2,21]],
+  "mHiS3ht85Bx": [12, [7,7,7,9,9,9,9,9,9,9,9,9,9,9,12]],
+  "RMx5u9KfwC5": [27, [0,0,0,0,0,0,0,0,26,0,26,0,19,0,26]],
+  "fuE0QvfKM8I": [19, [3,18,3,3,3,5,0,3,3,0,3,3,3,0,19]],
+  "bTKs8JaSzAx": [29, [0,26,0,0,0,2,0,0,0,0,0,0,0,0,27]],
+  "MjpHd6Sw6My": [39, [0,37,0,0,0,2,0,0,0,0,0,0,0,0,38]],
+  "QDmMfM6eNNP": [46, [1,38,0,1,0,1,0,1,1,0,1,1,1,0,44]],
+  "UlwufP7RbxR": [22, [20,20,20,20,20,20,20,20,20,20,20,20,20,20,22]],
+  "LCANr1gBBmt": [138, [4,4,4,4,46,57,37,4,4,4,4,4,4,4,129]],
+  "FCHgbrBDUlm": [1, [0,1,0,0,0,0,0,0,0,0,0,0,0,0,1]],
+  "nOuYQc25rqk": [6, [6,6,6,6,6,6,6,6,6,6,6,6,6,6,6]],
+  "WySJxYW0ogy": [2, [0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]],
+  "KlOAdjVy9Se": [2, [2,2,2,2,2,2,2,2,2,2,2,2,2,2,2]],
+  "OJdYNqMTlps": [43, [10,10,10,10,10,10,10,10,10,10,10,10,10,38,40]],
+  "NPMXeiRnaBS": [19, [7,7,3,7,4,17,1,7,7,0,7,7,7,2,19]],
+  "PGgpuTqRZol": [21, [0,0,0,0,0,0,0,0,0,20,0,0,0,0,20]],
+  "GuyxR4gRq8A": [7, [1,1,1,1,1,1,1,1,1,6,1,1,1,1,7]]
+};
+
+const SERVICE_PREFIX = /^Service\s+/;
+
+/**
+ * Number of answerable fields a section shows for a facility type
+ * @param {Object} section - DHIS2 program stage section ({ id, dataElements })
+ * @param {string} facilityType - Facility type as used by facilityServiceFilters ("X" or "Service X")
+ * @returns {number|undefined} Count, or undefined when the section is unknown, its data elements
+ *   changed since generation, or the facility type has no filter
+ */
+export function getSectionFieldCount(section, facilityType) {
+  if (!section || !facilityType) return undefined;
+  const entry = SECTION_FIELD_COUNTS[section.id];
+  if (!entry || entry[0] !== (section.dataElements || []).length) return undefined;
+  const facility = FACILITY_TYPES.indexOf(String(facilityType).replace(SERVICE_PREFIX, ''));
+  return facility === -1 ? undefined : entry[1][facility];
+}
+
+export default {
+  SECTION_FIELD_COUNTS,
+  getSectionFieldCount
+};
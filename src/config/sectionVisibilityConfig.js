@@ -1,410 +1,62 @@
-import { ALL_FACILITY_DEPARTMENTS, getDepartmentsForSpecialization } from './facilityServiceDepartments.js';
+import {
+  FACILITY_TYPES,
+  SECTIONS,
+  getCanonicalFacilityType,
+  getFacilityTypeIndex,
+  isSectionVisibleForFacility
+} from './sectionVisibilityTable.js';
 
 /**
  * Section Visibility Configuration
  *
- * This file defines which sections should be shown/hidden for each facility type.
- * You can easily customize these rules by modifying the values below.
+ * Which sections are shown/hidden for each facility type.
  *
- * Structure:
- * - Key: Facility type (must match exactly what's in your CSV or DHIS2)
- * - Value: Object with section names as keys and boolean visibility as values
+ * Sections that come from the CSV checklist are looked up in the generated
+ * sectionVisibilityTable.js (a facility type sees a section when it has at least one
+ * applicable question in it), together with the canonical facility types and their
+ * legacy aliases. Regenerate it with: python src/config/generateFilters.py
  *
- * Example:
- * 'laboratory': {
- *   'SECTION A-ORGANISATION AND MANAGEMENT': true,  // Show this section
- *   'SECTION B-STATUTORY REQUIREMENTS': true,      // Show this section
- *   'SECTION C-POLICIES AND PROCEDURES': false,    // Hide this section
- * }
+ * Only the DHIS2 sections that have no rows in the CSV are configured by hand here.
+ *
+ * Structure of sectionVisibilityConfig:
+ * - Key: Canonical facility type (as in the CSV header)
+ * - Value: Object with section names as keys and boolean visibility as values
  */
 
-export const CANONICAL_FACILITY_TYPES = [
-  'Obstetrics & Gynaecology',
-  'Laboratory',
-  'Psychology',
-  'Eye (Opthalmology /Optometry)',
-  'Physiotherapy',
-  'Dental',
-  'Dental Laboratory',
-  'Ear, Nose & Throat',
-  'Rehabilitation Centre',
-  'Radiology',
-  'General Practice',
-  'Paediatric',
-  'Nursing  Home',
-  'Emergency Medical Services',
-  'Hospital'
-];
-
-// Map a variety of legacy / DHIS2 / CSV labels to canonical facility types
-const LEGACY_TO_CANONICAL = {
-  // Hospital is now a canonical type
-  'hospital': 'Hospital',
-  'Clinic': 'General Practice',
-  'clinic': 'General Practice',
-  'Gynae Clinics': 'Obstetrics & Gynaecology',
-  'Gynae': 'Obstetrics & Gynaecology',
-  'Obstetrics & Gynaecology': 'Obstetrics & Gynaecology',
-  'Obstetrics & Gynaecology ': 'Obstetrics & Gynaecology',
-  'Laboratory': 'Laboratory',
-  'laboratory': 'Laboratory',
-  'Psychology': 'Psychology',
-  'Psychology ': 'Psychology',
-  'Psycology': 'Psychology',
-  'Psychology clinic': 'Psychology',
-  'Eye': 'Eye (Opthalmology /Optometry)',
-  'Eye (Opthalmology /Optometry)': 'Eye (Opthalmology /Optometry)',
-  'Eye (Opthalmology /Optometry) ': 'Eye (Opthalmology /Optometry)',
-  'Eye (opthalmologyoptometry  optician) Clinics': 'Eye (Opthalmology /Optometry)',
-  'Physiotherapy': 'Physiotherapy',
-  'Physiotheraphy': 'Physiotherapy',
-  'Physio': 'Physiotherapy',
-  'physiotheraphy': 'Physiotherapy',
-  'Dental': 'Dental',
-  'Dental ': 'Dental',
-  'Dental clinic': 'Dental',
-  'dental clinic': 'Dental',
-  'Dental Laboratory': 'Dental Laboratory',
-  'ENT': 'Ear, Nose & Throat',
-  'ENT clinic': 'Ear, Nose & Throat',
-  'Ear, Nose & Throat': 'Ear, Nose & Throat',
-  'Rehab': 'Rehabilitation Centre',
-  'Rehabilitation Centre': 'Rehabilitation Centre',
-  'Radiology': 'Radiology',
-  'Paediatric': 'Paediatric',
-  'Nursing Home': 'Nursing  Home',
-  'Nursing  Home': 'Nursing  Home',
-  'Emergency Medical Services': 'Emergency Medical Services',
-  'Potrait clinic': 'General Practice'
-};
+export const CANONICAL_FACILITY_TYPES = FACILITY_TYPES;
 
+const CLINICAL_FACILITY_TYPES = FACILITY_TYPES.filter(
+  (type) => !['Obstetrics & Gynaecology', 'Emergency Medical Services'].includes(type)
+);
 
+// DHIS2 sections without checklist rows -> facility types that show them
+const DHIS2_ONLY_SECTIONS = {
+  'Document Review': ['General Practice', 'Paediatric', 'Nursing  Home', 'Hospital'],
+  'STATUTORY REQUIREMENTS': CLINICAL_FACILITY_TYPES,
+  'POLICIES AND PROCEDURES': CLINICAL_FACILITY_TYPES,
+  'Inspection Type': FACILITY_TYPES,
+  'Inspectors Details': FACILITY_TYPES,
+  'RECORDS/ INFORMATION MANAGEMENT': FACILITY_TYPES.filter((type) => type !== 'Emergency Medical Services')
+};
 
 export const normalizeFacilityClassification = (raw) => {
   if (!raw) return null;
-  const trimmed = String(raw).trim();
-  // Exact canonical match
-  if (CANONICAL_FACILITY_TYPES.includes(trimmed)) {
-    return trimmed;
-  }
-  // Legacy mapping
-  if (LEGACY_TO_CANONICAL[trimmed]) {
-    return LEGACY_TO_CANONICAL[trimmed];
-  }
-  // Case-insensitive canonical match
-  const lower = trimmed.toLowerCase();
-  const canonicalMatch = CANONICAL_FACILITY_TYPES.find(
-    (type) => type.toLowerCase() === lower
-  );
-  if (canonicalMatch) {
-    return canonicalMatch;
-  }
-  // Fallback to trimmed value
-  return trimmed;
+  // Canonical types and legacy labels (case- and whitespace-insensitive), else the trimmed value
+  return getCanonicalFacilityType(raw) || String(raw).trim();
 };
 
-
-const legacySectionVisibilityConfig = {
-  // Hospital - show all sections
-  'Hospital': {
-    'Document Review': true,
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Clinic - show all sections
-  'Clinic': {
-    'Document Review': true,
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Laboratory - focus on technical and safety sections
-  'Laboratory': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Radiology - focus on safety and technical procedures
-  'Radiology': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false,
-    'X-RAY ROOM': true,
-    'ULTRASOUND ROOM': true
-  },
-
-  // ENT - focus on specialized procedures
-  'ENT': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Dental - focus on infection control and procedures
-  'Dental': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Eye - focus on specialized equipment and procedures
-  'Eye': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Psycology - focus on patient care and management
-  'Psycology': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Physio - focus on treatment protocols and safety
-  'Physio': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Rehab - focus on patient care and safety
-  'Rehab': {
-    'ORGANISATION AND MANAGEMENT': true,
-    'STATUTORY REQUIREMENTS': true,
-    'POLICIES AND PROCEDURES': true,
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false
-  },
-
-  // Gynae - show specific sections for gynecological facilities
-  'Gynae': {
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'ORGANISATION AND MANAGEMENT': true,
-    'SERVICES PROVIDED': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-RECEPTION/WAITING AREA': true,
-    'FACILITY-SCREENING ROOM': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-PROCEDURE ROOM': true,
-    'BLEEDING ROOM': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'PHARMACY/DISPENSARY': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'RECORDS/ INFORMATION MANAGEMENT': true,
-    'CUSTOMER SATISFACTION': false,
-    'ULTRASOUND ROOM': true
-  },
-
-  // Emergency Medical Services - includes call centre operations
-  'EMS': {
-    'Inspection Type': true,
-    'Inspectors Details': true,
-    'SECTION A-ORGANISATION AND MANAGEMENT': true,
-    'SERVICES PROVIDED': true,
-    'PERSONNEL': true,
-    'FACILITY-ENVIRONMENT': true,
-    'FACILITY-CONSULTATION/ TREATMENT ROOM': true,
-    'FACILITY-CALL CENTRE': true,
-    'SLUICE ROOM': true,
-    'TOILET FACILITIES': true,
-    'SAFETY AND WASTE MANAGEMENT': true,
-    'SUPPLIES': true,
-    'CUSTOMER SATISFACTION': true,
-    'INSTRUMENT WASHING/STERILISING ROOM': true,
-    'ULTRASOUND ROOM': true
-  }
-};
-
-export const sectionVisibilityConfig = {
-  ...legacySectionVisibilityConfig,
-
-  // Canonical CSV facility types mapped to legacy configs
-  'Obstetrics & Gynaecology': legacySectionVisibilityConfig['Gynae'],
-  'Laboratory': legacySectionVisibilityConfig['Laboratory'],
-  'Psychology': legacySectionVisibilityConfig['Psycology'],
-  'Eye (Opthalmology /Optometry)': legacySectionVisibilityConfig['Eye'],
-  'Physiotheraphy': legacySectionVisibilityConfig['Physio'],
-  'Dental': legacySectionVisibilityConfig['Dental'],
-  'Dental Laboratory': legacySectionVisibilityConfig['Dental'],
-  'Ear, Nose & Throat': legacySectionVisibilityConfig['ENT'],
-  'Rehabilitation Centre': legacySectionVisibilityConfig['Rehab'],
-  'Radiology': legacySectionVisibilityConfig['Radiology'],
-  'General Practice': legacySectionVisibilityConfig['Clinic'],
-  'Paediatric': legacySectionVisibilityConfig['Clinic'],
-  'Nursing  Home': legacySectionVisibilityConfig['Clinic'],
-  'Nursing  Home': legacySectionVisibilityConfig['Clinic'],
-  'Emergency Medical Services': legacySectionVisibilityConfig['EMS'],
-  'Hospital': {
-    ...legacySectionVisibilityConfig['Hospital'],
-    ...getDepartmentsForSpecialization('Hospital').reduce((acc, dept) => ({ ...acc, [dept]: true }), {})
-  }
-};
+export const sectionVisibilityConfig = Object.fromEntries(
+  FACILITY_TYPES.map((facilityType) => {
+    const visibility = {};
+    Object.entries(DHIS2_ONLY_SECTIONS).forEach(([sectionName, facilityTypes]) => {
+      if (facilityTypes.includes(facilityType)) visibility[sectionName] = true;
+    });
+    SECTIONS.forEach((sectionName) => {
+      visibility[sectionName] = isSectionVisibleForFacility(sectionName, facilityType);
+    });
+    return [facilityType, visibility];
+  })
+);
 
 
 /**
@@ -642,76 +294,29 @@ export const shouldShowSection = (sectionName, facilityClassification) => {
 
   const normalizedClassification = normalizeFacilityClassification(facilityClassification);
 
-  // Get the visibility config for this facility type from sectionVisibilityConfig
-  // No default fallback - only show sections explicitly configured
-  const facilityConfig = normalizedClassification
-    ? sectionVisibilityConfig[normalizedClassification]
-    : null;
-
-  if (!facilityConfig) {
+  // No default fallback - only show sections for facility types the checklist knows
+  if (getFacilityTypeIndex(normalizedClassification) === -1) {
     console.log(
       `🔍 No specific config for facility type "${facilityClassification}" (normalized: "${normalizedClassification}") - hiding section`
     );
     return false;
   }
 
-  // First, try direct lookup
-  let shouldShow = facilityConfig[rawSectionName];
-
-  // 1. Check if the section matches any of our dynamic CSV departments FOR THIS FACILITY
-  // This ensures that any section added to the CSV is automatically visible
-  // without needing manual updates to this file or the whitelist.
-
-  // CRITICAL FIX: Use strict matching against departments specifically available to this facility.
-  // This prevents leakage, e.g., preventing "TOILET FACILITIES HOSPITAL" from showing for "TOILET FACILITIES"
-  // just because one string contains the other.
-  const allowedDepartments = getDepartmentsForSpecialization(normalizedClassification);
-  const upperSectionName = rawSectionName.toUpperCase();
-
-  const isAllowedForFacility = allowedDepartments.some(dept => {
-    const upperDept = dept.toUpperCase();
-
-    // 1. Exact match
-    if (upperDept === upperSectionName) return true;
-
-    // 2. Handle "SECTION X-" prefix difference (standardize on stripping it)
-    // If CSV has "SECTION A-FOO" and we pass "FOO", it should match.
-    // But "TOILET FACILITIES HOSPITAL" should NOT match "TOILET FACILITIES".
-    const cleanDept = upperDept.replace(/^SECTION\s+[A-Z0-9]+\s*-\s*/, '');
-    if (cleanDept === upperSectionName) return true;
-
-    // 3. Reverse check: if we pass "SECTION A-FOO" and CSV has "FOO" (less likely but possible)
-    const cleanSection = upperSectionName.replace(/^SECTION\s+[A-Z0-9]+\s*-\s*/, '');
-    if (upperDept === cleanSection) return true;
-
-    return false;
-  });
-
-  if (isAllowedForFacility) {
+  // 1. CSV sections: direct lookup in the generated visibility table. Matching is exact
+  // (case-insensitive, ignoring a "SECTION X-" prefix), so "TOILET FACILITIES HOSPITAL"
+  // never leaks into "TOILET FACILITIES".
+  const csvVisibility = isSectionVisibleForFacility(rawSectionName, normalizedClassification);
+  if (csvVisibility !== undefined) {
     console.log(
-      `✅ Section "${sectionName}" is explicitly allowed for "${normalizedClassification}" via CSV mapping - defaulting to SHOW`
+      `${csvVisibility ? '✅' : '🚫'} Section "${sectionName}" for "${normalizedClassification}" via CSV table: ${csvVisibility ? 'SHOW' : 'HIDE'}`
     );
-    return true;
+    return csvVisibility;
   }
 
-  // Also check if it's a generic CSV section that is NOT allowed for this facility
-  // If so, we should explicitly HIDE it to prevent leakage
-  const isGenericCsvSection = ALL_FACILITY_DEPARTMENTS.some(dept => {
-    const upperDept = dept.toUpperCase();
-    if (upperDept === upperSectionName) return true;
-    const cleanDept = upperDept.replace(/^SECTION\s+[A-Z0-9]+\s*-\s*/, '');
-    if (cleanDept === upperSectionName) return true;
-    return false;
-  });
-
-  if (isGenericCsvSection && !isAllowedForFacility) {
-    console.log(
-      `🚫 Section "${sectionName}" is a known CSV section but NOT allowed for "${normalizedClassification}" - explicitly HIDING`
-    );
-    return false;
-  }
+  // 2. DHIS2-only sections configured by hand
+  const shouldShow = sectionVisibilityConfig[normalizedClassification][rawSectionName];
 
-  // 2. CSV-driven sections that should default to visible even if legacy config doesn't know them.
+  // 3. CSV-driven sections that should default to visible even if legacy config doesn't know them.
   // We keep this as a backup manual whitelist.
   const CSV_ALWAYS_VISIBLE_SECTION_TOKENS = [
     'SERVICES PROVIDED',
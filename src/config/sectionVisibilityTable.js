@@ -0,0 +1,309 @@
+/**
+ * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
+ * Generated from: checklist-final.csv
+ * Checklist hash: 0c210a23b2f563962022feede57914aec778ba206f43463ae854f080d5b50cbb
+ *
+ * Section visibility precomputed from the CSV applicability columns: a facility type
+ * sees a section when it has at least one applicable question in it.
+ * To regenerate this file, run: python src/config/generateFilters.py
+ */
+
+// Canonical facility types (CSV header order)
+export const FACILITY_TYPES = [
+  "Obstetrics & Gynaecology",
+  "Laboratory",
+  "Psychology",
+  "Eye (Opthalmology /Optometry)",
+  "Physiotherapy",
+  "Dental",
+  "Dental Laboratory",
+  "Ear, Nose & Throat",
+  "Rehabilitation Centre",
+  "Radiology",
+  "General Practice",
+  "Paediatric",
+  "Nursing  Home",
+  "Emergency Medical Services",
+  "Hospital"
+];
+
+// Sections in CSV order (same as ALL_FACILITY_DEPARTMENTS)
+export const SECTIONS = [
+  "SECTION A-ORGANISATION AND MANAGEMENT",
+  "SERVICES PROVIDED",
+  "PERSONNEL",
+  "FACILITY-ENVIRONMENT",
+  "FACILITY-RECEPTION/WAITING AREA",
+  "FACILITY-SCREENING ROOM",
+  "FACILITY-CONSULTATION/ TREATMENT ROOM",
+  "NURSES' STATION",
+  "IN PATIENT ADMISSION ROOMS",
+  "OFFICE FOR THE MANAGER",
+  "EMERGENCY EQUIPMENT",
+  "FACILITY-PROCEDURE ROOM",
+  "SLUICE ROOM",
+  "BLEEDING ROOM",
+  "TOILET FACILITIES",
+  "PHARMACY/DISPENSARY",
+  "SAFETY AND WASTE MANAGEMENT",
+  "SUPPLIES",
+  "TENS",
+  "CUSTOMER SATISFACTION",
+  "SPECIMEN RECEPTION ROOM",
+  "LABORATORY TESTING AREAS CHEMISTRY",
+  "LABORATORY TESTING AREAS HAEMATOLOGY",
+  "MICROBIOLOGY",
+  "HIV SCREENING",
+  "INSTRUMENT WASHING/STERILISING ROOM",
+  "X-RAY ROOM",
+  "ULTRASOUND ROOM",
+  "LIASON WITH PRIMARY HEALTH CARE DEPARTMENTS",
+  "FACILITY-CALL CENTRE",
+  "FACILITY GOVERNANCE AND MANAGEMENT",
+  "HUMAN RESOURCE MANAGEMENT",
+  "ADMINISTRATIVE SERVICES",
+  "FACILITY ENVIRONMENT",
+  "CUSTOMER CARE, RIGHTS AND SATISFACTION",
+  "INFECTION PREVENTION AND CONTROL",
+  "FACILITY RESUSCITATION SERVICES",
+  "ACCIDENT & EMERGENCY AND RESUSCITATION SERVICES",
+  "OUT PATIENT SERVICE",
+  "CRITICAL CARE UNIT (HIGH CARE)",
+  "COMBINED GENERAL MEDICAL/ SURGICAL/PAEDIATRIC WARDS",
+  "GENERAL MEDICAL WARDS",
+  "SURGICAL /ORTHOPAEDIC WARDS",
+  "PAEDIATRIC CARE/ SPECIALTIES AND WARDS/ NEONATOLOGY",
+  "OBSTETRICS AND GYNAECOLOGY",
+  "PSYCHIATRIC SERVICES AND WARDS",
+  "OPERATING THEATRE",
+  "CENTRAL SUPPLIES AND STERILISATION DEPARTMENT (CSSD)",
+  "PHARMACY",
+  "LABORATORY",
+  "RADIOLOGY (MEDICAL IMAGING; X-RAY DEPARTMENT)",
+  "DENTAL",
+  "EYE CLINIC",
+  "PHYSIOTHERAPY CARE",
+  "DIETETICS",
+  "FOOD SERVICE AND KITCHEN",
+  "HOUSEKEEPING SERVICE",
+  "LAUNDRY SERVICES",
+  "MAINTENANCE SERVICES",
+  "EQUIPMENT AND HEALTHCARE TECHNOLOGY",
+  "HOSPITAL SUPPLIES",
+  "OCCUPATIONAL THERAPY",
+  "SPEECH THERAPY",
+  "SOCIAL WORK"
+];
+
+// facilityTypeKey(label) -> index into FACILITY_TYPES (canonical names and legacy labels)
+export const FACILITY_TYPE_ALIASES = {
+  "obstetrics & gynaecology": 0,
+  "laboratory": 1,
+  "psychology": 2,
+  "eye (opthalmology /optometry)": 3,
+  "physiotherapy": 4,
+  "dental": 5,
+  "dental laboratory": 6,
+  "ear, nose & throat": 7,
+  "rehabilitation centre": 8,
+  "radiology": 9,
+  "general practice": 10,
+  "paediatric": 11,
+  "nursing home": 12,
+  "emergency medical services": 13,
+  "hospital": 14,
+  "clinic": 10,
+  "potrait clinic": 10,
+  "gynae": 0,
+  "gynae clinics": 0,
+  "psycology": 2,
+  "psychology clinic": 2,
+  "eye": 3,
+  "eye (opthalmologyoptometry optician) clinics": 3,
+  "physio": 4,
+  "physiotheraphy": 4,
+  "dental clinic": 5,
+  "ent": 7,
+  "ent clinic": 7,
+  "rehab": 8,
+  "ems": 13
+};
+
+// Upper-case section name, with and without the "SECTION X-" prefix -> index into SECTIONS
+export const SECTION_INDEX = {
+  "SECTION A-ORGANISATION AND MANAGEMENT": 0,
+  "SERVICES PROVIDED": 1,
+  "PERSONNEL": 2,
+  "FACILITY-ENVIRONMENT": 3,
+  "FACILITY-RECEPTION/WAITING AREA": 4,
+  "FACILITY-SCREENING ROOM": 5,
+  "FACILITY-CONSULTATION/ TREATMENT ROOM": 6,
+  "NURSES' STATION": 7,
+  "IN PATIENT ADMISSION ROOMS": 8,
+  "OFFICE FOR THE MANAGER": 9,
+  "EMERGENCY EQUIPMENT": 10,
+  "FACILITY-PROCEDURE ROOM": 11,
+  "SLUICE ROOM": 12,
+  "BLEEDING ROOM": 13,
+  "TOILET FACILITIES": 14,
+  "PHARMACY/DISPENSARY": 15,
+  "SAFETY AND WASTE MANAGEMENT": 16,
+  "SUPPLIES": 17,
+  "TENS": 18,
+  "CUSTOMER SATISFACTION": 19,
+  "SPECIMEN RECEPTION ROOM": 20,
+  "LABORATORY TESTING AREAS CHEMISTRY": 21,
+  "LABORATORY TESTING AREAS HAEMATOLOGY": 22,
+  "MICROBIOLOGY": 23,
+  "HIV SCREENING": 24,
+  "INSTRUMENT WASHING/STERILISING ROOM": 25,
+  "X-RAY ROOM": 26,
+  "ULTRASOUND ROOM": 27,
+  "LIASON WITH PRIMARY HEALTH CARE DEPARTMENTS": 28,
+  "FACILITY-CALL CENTRE": 29,
+  "FACILITY GOVERNANCE AND MANAGEMENT": 30,
+  "HUMAN RESOURCE MANAGEMENT": 31,
+  "ADMINISTRATIVE SERVICES": 32,
+  "FACILITY ENVIRONMENT": 33,
+  "CUSTOMER CARE, RIGHTS AND SATISFACTION": 34,
+  "INFECTION PREVENTION AND CONTROL": 35,
+  "FACILITY RESUSCITATION SERVICES": 36,
+  "ACCIDENT & EMERGENCY AND RESUSCITATION SERVICES": 37,
+  "OUT PATIENT SERVICE": 38,
+  "CRITICAL CARE UNIT (HIGH CARE)": 39,
+  "COMBINED GENERAL MEDICAL/ SURGICAL/PAEDIATRIC WARDS": 40,
+  "GENERAL MEDICAL WARDS": 41,
+  "SURGICAL /ORTHOPAEDIC WARDS": 42,
+  "PAEDIATRIC CARE/ SPECIALTIES AND WARDS/ NEONATOLOGY": 43,
+  "OBSTETRICS AND GYNAECOLOGY": 44,
+  "PSYCHIATRIC SERVICES AND WARDS": 45,
+  "OPERATING THEATRE": 46,
+  "CENTRAL SUPPLIES AND STERILISATION DEPARTMENT (CSSD)": 47,
+  "PHARMACY": 48,
+  "LABORATORY": 49,
+  "RADIOLOGY (MEDICAL IMAGING; X-RAY DEPARTMENT)": 50,
+  "DENTAL": 51,
+  "EYE CLINIC": 52,
+  "PHYSIOTHERAPY CARE": 53,
+  "DIETETICS": 54,
+  "FOOD SERVICE AND KITCHEN": 55,
+  "HOUSEKEEPING SERVICE": 56,
+  "LAUNDRY SERVICES": 57,
+  "MAINTENANCE SERVICES": 58,
+  "EQUIPMENT AND HEALTHCARE TECHNOLOGY": 59,
+  "HOSPITAL SUPPLIES": 60,
+  "OCCUPATIONAL THERAPY": 61,
+  "SPEECH THERAPY": 62,
+  "SOCIAL WORK": 63,
+  "ORGANISATION AND MANAGEMENT": 0
+};
+
+// Visible sections per facility type (aligned with FACILITY_TYPES), hex bitmaps: bit i = SECTIONS[i]
+export const SECTION_VISIBILITY = [
+  "100b7c7f",
+  "11fb685f",
+  "100b405f",
+  "100b7c7f",
+  "100b407f",
+  "120b407f",
+  "100b401f",
+  "100b7c7f",
+  "100bffff",
+  "1c0b405f",
+  "100bfc7f",
+  "100b7c7f",
+  "100bffff",
+  "300b520f",
+  "ffffffffc0010000"
+];
+
+const SECTION_PREFIX = /^SECTION\s+[A-Z0-9]+\s*-\s*/;
+const WORD_COUNT = Math.max(1, Math.ceil(SECTIONS.length / 32));
+
+// Hex bitmap -> 32-bit words, least significant word first
+const decodeBitmap = (hex) => {
+  const words = new Uint32Array(WORD_COUNT);
+  for (let word = 0, end = hex.length; end > 0 && word < WORD_COUNT; word += 1, end -= 8) {
+    words[word] = parseInt(hex.slice(Math.max(0, end - 8), end), 16);
+  }
+  return words;
+};
+
+const VISIBILITY_WORDS = SECTION_VISIBILITY.map(decodeBitmap);
+
+const isBitSet = (words, index) => ((words[index >>> 5] >>> (index & 31)) & 1) === 1;
+
+export const facilityTypeKey = (label) => String(label).trim().toLowerCase().replace(/\s+/g, ' ');
+
+/**
+ * Index of a facility type or legacy label in FACILITY_TYPES
+ * @param {string} label - Facility type, legacy label or DHIS2 value
+ * @returns {number} Index, or -1 when unknown
+ */
+export function getFacilityTypeIndex(label) {
+  if (!label) return -1;
+  const index = FACILITY_TYPE_ALIASES[facilityTypeKey(label)];
+  return index === undefined ? -1 : index;
+}
+
+/**
+ * Canonical facility type for a facility type or legacy label
+ * @param {string} label - Facility type, legacy label or DHIS2 value
+ * @returns {string|null} Canonical facility type, or null when unknown
+ */
+export function getCanonicalFacilityType(label) {
+  const index = getFacilityTypeIndex(label);
+  return index === -1 ? null : FACILITY_TYPES[index];
+}
+
+/**
+ * Index of a (DHIS2 or CSV) section name in SECTIONS, ignoring case and "SECTION X-" prefixes
+ * @param {string} sectionName - Section name
+ * @returns {number} Index, or -1 when the CSV has no such section
+ */
+export function getSectionIndex(sectionName) {
+  const key = String(sectionName || '').trim().toUpperCase();
+  let index = SECTION_INDEX[key];
+  if (index === undefined) {
+    index = SECTION_INDEX[key.replace(SECTION_PREFIX, '')];
+  }
+  return index === undefined ? -1 : index;
+}
+
+/**
+ * Whether a CSV section is visible for a facility type
+ * @param {string} sectionName - Section name
+ * @param {string} facilityType - Facility type or legacy label
+ * @returns {boolean|undefined} Visibility, or undefined when the section or facility type is unknown
+ */
+export function isSectionVisibleForFacility(sectionName, facilityType) {
+  const facility = getFacilityTypeIndex(facilityType);
+  const section = getSectionIndex(sectionName);
+  if (facility === -1 || section === -1) return undefined;
+  return isBitSet(VISIBILITY_WORDS[facility], section);
+}
+
+/**
+ * Sections visible for a facility type, in CSV order
+ * @param {string} facilityType - Facility type or legacy label
+ * @returns {Array<string>} Section names (empty for unknown facility types)
+ */
+export function getVisibleSectionsForFacilityType(facilityType) {
+  const facility = getFacilityTypeIndex(facilityType);
+  if (facility === -1) return [];
+  return SECTIONS.filter((_, section) => isBitSet(VISIBILITY_WORDS[facility], section));
+}
+
+export default {
+  FACILITY_TYPES,
+  SECTIONS,
+  FACILITY_TYPE_ALIASES,
+  SECTION_INDEX,
+  SECTION_VISIBILITY,
+  facilityTypeKey,
+  getFacilityTypeIndex,
+  getCanonicalFacilityType,
+  getSectionIndex,
+  isSectionVisibleForFacility,
+  getVisibleSectionsForFacilityType
+};
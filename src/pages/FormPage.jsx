@@ -16,6 +16,8 @@ import {
 
 import facilityServiceFilters, { shouldShowDataElementForService } from '../config/facilityServiceFilters';
 import { ALL_FACILITY_DEPARTMENTS, getDepartmentsForSpecialization, getDepartmentStats } from '../config/facilityServiceDepartments';
+import { isCommentFieldVisible } from '../config/commentFieldPairs';
+import { getSectionFieldCount } from '../config/sectionFieldCounts';
 
 import CustomSignatureCanvas from '../components/CustomSignatureCanvas';
 import { ChecklistDebugTable } from '../components/ChecklistDebugTable';
@@ -1354,7 +1356,13 @@ function FormSection({ section, formData, onChange, errors, serviceSections, loa
         return true;
       }
 
-      // Check if this is a Comments/Remarks data element
+      // Comments/Remarks fields paired at build time inherit their main element's visibility
+      const pairedCommentVisible = isCommentFieldVisible(psde.dataElement.id, filteringFacilityType);
+      if (pairedCommentVisible !== undefined) {
+        return pairedCommentVisible;
+      }
+
+      // Comments/Remarks fields missing from the exported metadata (added in DHIS2 since)
       const isComment = /\s*(Comments?|Remarks?)\s*$/i.test(displayName);
       if (isComment) {
         // For Comments/Remarks elements, check if the main element would pass the filter.
@@ -1491,7 +1499,13 @@ function FormSection({ section, formData, onChange, errors, serviceSections, loa
           }
 
 
-          // Check if this is a Comments/Remarks data element
+          // Comments/Remarks fields paired at build time inherit their main element's visibility
+          const pairedCommentVisible = isCommentFieldVisible(psde.dataElement.id, filteringFacilityType);
+          if (pairedCommentVisible !== undefined) {
+            return pairedCommentVisible;
+          }
+
+          // Comments/Remarks fields missing from the exported metadata (added in DHIS2 since)
           const isComment = /\s*(Comments?|Remarks?)\s*$/i.test(displayName);
           if (isComment) {
             // For Comments/Remarks elements, check if the main element would pass the filter.
@@ -1847,7 +1861,7 @@ function FormSection({ section, formData, onChange, errors, serviceSections, loa
 
 
   // Helper to decide visibility consistent with filter logic, including Comments pairing
-  const shouldShowForName = (name) => {
+  const shouldShowForName = (name, dataElementId) => {
     if (isInspectionTypeSection || isDocumentReviewSection) return true; // Exclude from filters
     if (!name) return false;
 
@@ -1855,6 +1869,10 @@ function FormSection({ section, formData, onChange, errors, serviceSections, loa
     if (isSectionHeaderName(name)) return true;
     if (isNumberPrefixedAllCapsLabel(name)) return true;
 
+    const pairedCommentVisible = isCommentFieldVisible(dataElementId, filteringFacilityType);
+    if (pairedCommentVisible !== undefined) return pairedCommentVisible;
+
+    // Comments/Remarks fields missing from the exported metadata (added in DHIS2 since)
     const isComment = /\s*(Comments?|Remarks?)\s*$/i.test(name);
     if (isComment) {
       const mainElementName = name
@@ -1875,7 +1893,7 @@ function FormSection({ section, formData, onChange, errors, serviceSections, loa
 
   // Compute unmatched (hidden) DEs for debug vis
   const unmatchedDEs = (isInspectionTypeSection || isDocumentReviewSection) ? [] : ((section.dataElements || [])
-    .filter(psde => psde?.dataElement && !shouldShowForName(psde.dataElement.displayName))
+    .filter(psde => psde?.dataElement && !shouldShowForName(psde.dataElement.displayName, psde.dataElement.id))
     .map(psde => psde.dataElement.displayName));
   if (!shouldShow) {
 
@@ -3309,30 +3327,55 @@ function FormPage() {
     return true;
   };
 
-  // Function to get section completion status for progress tracking
-  const getSectionStatus = (section) => {
-    if (!section?.dataElements) return { completed: false, total: 0, filled: 0, percentage: 0 };
-
-    let total = 0;
-    let filled = 0;
-
-    // Get current facility type for filtering
+  // Answerable fields of every section for the current facility type. The visibility
+  // filter runs once per stage / facility type change instead of on every answer; labels
+  // ("--" / ALL CAPS) and comment fields are never counted.
+  const progressFieldsBySection = useMemo(() => {
     const currentFacilityType = manualSpecialization || facilityType;
+    const fieldsBySection = new Map();
 
-    section.dataElements.forEach((psde) => {
-      if (!psde?.dataElement) return;
+    (serviceSections || []).forEach((section) => {
+      if (!section?.dataElements) return;
 
-      // Apply the same filtering logic used in FormSection rendering
-      // Only count data elements that should be visible for this facility type
       const sectionName = section?.displayName || '';
       const cleanedSectionName = sectionName.replace(/^SECTION\s+[A-Z]\s*-\s*/i, '');
-      const elementName = cleanDHIS2Name(psde.dataElement.formName || psde.dataElement.displayFormName || psde.dataElement.displayName);
-      if (!shouldShowDataElementForService(elementName, currentFacilityType, cleanedSectionName)) {
-        return; // Skip this data element - it shouldn't be counted
-      }
+      const fieldNames = [];
 
-      total++;
-      const fieldName = `dataElement_${psde.dataElement.id}`;
+      section.dataElements.forEach((psde) => {
+        if (!psde?.dataElement) return;
+
+        const elementName = cleanDHIS2Name(psde.dataElement.formName || psde.dataElement.displayFormName || psde.dataElement.displayName);
+        if (isSectionHeaderName(elementName) || isAllCaps(elementName) || isNumberPrefixedAllCapsLabel(elementName) ||
+          /\s*(Comments?|Remarks?)\s*$/i.test(elementName)) {
+          return;
+        }
+
+        // Apply the same filtering logic used in FormSection rendering
+        if (!shouldShowDataElementForService(elementName, currentFacilityType, cleanedSectionName)) {
+          return; // Skip this data element - it shouldn't be counted
+        }
+
+        fieldNames.push(`dataElement_${psde.dataElement.id}`);
+      });
+
+      fieldsBySection.set(section.id, fieldNames);
+    });
+
+    return fieldsBySection;
+  }, [serviceSections, manualSpecialization, facilityType]);
+
+  // Function to get section completion status for progress tracking
+  const getSectionStatus = (section) => {
+    if (!section?.dataElements) return { completed: false, total: 0, filled: 0, percentage: 0 };
+
+    // Numerator and denominator both count the section's rendered answerable fields: the
+    // denominator is precomputed per facility type (sectionFieldCounts.js) while the section
+    // matches the metadata it was generated from, else taken from the memoized field list
+    const fieldNames = progressFieldsBySection.get(section.id) || [];
+    const total = getSectionFieldCount(section, manualSpecialization || facilityType) ?? fieldNames.length;
+
+    let filled = 0;
+    fieldNames.forEach((fieldName) => {
       const value = formData[fieldName];
 
       // Check if field is filled (same logic as isFieldFilled helper)
@@ -4655,6 +4698,8 @@ function FormPage() {
             const shown = (s.dataElements || []).filter((psde2) => {
               if (!psde2?.dataElement) return false;
               const displayName2 = cleanDHIS2Name(psde2.dataElement.formName || psde2.dataElement.displayFormName || psde2.dataElement.displayName);
+              const pairedCommentVisible2 = isCommentFieldVisible(psde2.dataElement.id, currentSpecialization);
+              if (pairedCommentVisible2 !== undefined) return pairedCommentVisible2;
               const isComment2 = /\s(Comments?|Remarks?)$/i.test(displayName2);
               if (isComment2) {
                 const main2 = displayName2
@@ -1,5 +1,7 @@
 import csv
-import re
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from row_classifier import ROW_CLASSIFIER, SECTION, clean_first_cell
 
 csv_path = 'checklist-final.csv'
 
@@ -32,26 +34,11 @@ if lines:
     for i, row in enumerate(lines[1:], start=2):
         if not row or not row[0].strip(): continue
         
-        clean_text = re.sub(r'^[·\.\-\s]+', '', row[0].strip())
-        
-        applicability = []
-        for j in range(len(raw_types)):
-            val = row[j+1].strip() if j+1 < len(row) else ''
-            applicability.append(val == '?')
-        
-        has_any_applicability = any(applicability)
-        
-        is_section_header = (not has_any_applicability) and (
-            (clean_text.isupper() and len(clean_text) > 3) or
-            clean_text.upper().startswith('FACILITY-') or
-            clean_text.upper().startswith('CUSTOMER SATISFACTION') or
-            clean_text.upper().startswith('LIASON WITH PRIMARY HEALTH CARE')
-        )
-
-        if is_section_header:
-            current_section = clean_text.upper()
-        
-        if hospital_index < len(applicability) and applicability[hospital_index]:
+        flags, section, applicability = ROW_CLASSIFIER.classify(clean_first_cell(row[0].strip()), row, len(raw_types))
+
+        if flags == SECTION:
+            current_section = section
+        elif hospital_index < len(applicability) and applicability[hospital_index]:
             sections_for_hospital[current_section] = sections_for_hospital.get(current_section, 0) + 1
 
     print("Sections for Hospital:")
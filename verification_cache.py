@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+
+CACHE_DIR = '.checklist_cache'
+CACHE_VERSION = 1
+
+
+def content_hash(value):
+    """Stable sha256 of any JSON-serialisable value (lists of rows, sets of names...)"""
+    if isinstance(value, (set, frozenset)):
+        value = sorted(value)
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class SectionCache:
+    """Per-section verification results keyed by a content fingerprint.
+
+    Each entry stores the fingerprint it was computed for (typically the hash of
+    the section's CSV rows combined with the hash of its DHIS2 data element set)
+    and the result. A lookup only hits when the fingerprint is unchanged, so
+    editing one section re-verifies just that section.
+
+    `meta` holds derived data keyed by source file digests (e.g. the DHIS2 side
+    fingerprint of each section for a given metadata file), so unchanged inputs
+    do not even need to be re-parsed.
+    """
+
+    def __init__(self, name, cache_dir=CACHE_DIR):
+        self.path = os.path.join(cache_dir, f'{name}.json')
+        self.sections = {}
+        self.meta = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get('version') == CACHE_VERSION:
+            self.sections = data.get('sections', {})
+            self.meta = data.get('meta', {})
+
+    def lookup(self, section, fingerprint):
+        entry = self.sections.get(section)
+        if entry and entry.get('fingerprint') == fingerprint:
+            self.hits += 1
+            return entry['result']
+        self.misses += 1
+        return None
+
+    def store(self, section, fingerprint, result):
+        self.sections[section] = {'fingerprint': fingerprint, 'result': result}
+
+    def prune(self, live_sections):
+        """Drop entries for sections that no longer exist"""
+        live = set(live_sections)
+        self.sections = {k: v for k, v in self.sections.items() if k in live}
+
+    def clear(self):
+        self.sections = {}
+        self.meta = {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'sections': self.sections, 'meta': self.meta},
+                      f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
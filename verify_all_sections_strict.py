@@ -1,7 +1,29 @@
-import csv
-import json
-import re
+import argparse
 import os
+import sys
+
+import config_path  # noqa: F401  (puts src/config on sys.path)
+import canonical_keys
+import section_resolver
+from section_resolver import ALIASES_PATH, SectionResolver, load_metadata, normalize_name
+from row_classifier import iter_sections, read_checklist_rows
+from verification_cache import SectionCache, content_hash, file_digest
+
+CSV_PATH = 'checklist-final.csv'
+METADATA_PATH = 'dhis2_full_metadata_v2.json'
+
+# Code that decides how a section resolves and how it is compared; editing any of it
+# invalidates cached results just like a changed input file does
+RESOLVER_SOURCES = [__file__, section_resolver.__file__, canonical_keys.__file__]
+
+
+def inputs_digest(metadata_path=METADATA_PATH, aliases_path=ALIASES_PATH):
+    """Digest of everything besides the CSV that a cached section result depends on"""
+    return content_hash([
+        file_digest(metadata_path),
+        file_digest(aliases_path) if os.path.exists(aliases_path) else None,
+        [file_digest(path) for path in RESOLVER_SOURCES],
+    ])
 
 def get_credentials():
     env_path = '.env'
@@ -36,81 +58,111 @@ def fetch_latest_metadata():
     except Exception as e:
         print(f"❌ Error running fetch script: {e}")
 
-def verify_all_sections():
+def verify_all_sections(full=False, csv_path=CSV_PATH, metadata_path=METADATA_PATH):
+    """Compare every CSV section with DHIS2; returns True when all sections match"""
     print("Starting Global Strict Comparison for all sections")
     
     # 1. Update Metadata
     fetch_latest_metadata()
 
-    # 2. Parse CSV
+    # 2. Parse CSV (sections and questions as the generator sees them)
     section_map = {} # {section_name: [questions]}
-    current_section = None
-    
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-    lines = None
-
-    for encoding in encodings:
-        try:
-            with open('checklist-final.csv', 'r', encoding=encoding) as f:
-                reader = csv.reader(f)
-                lines = list(reader)
-            print(f"Successfully read CSV with {encoding} encoding")
-            break
-        except UnicodeDecodeError:
-            continue
-    
+
+    lines = read_checklist_rows(csv_path)
     if not lines:
         print("Failed to read CSV with any supported encoding")
-        return
+        return False
 
-    try:
-        # Skip header 1 and header 2
-        for row in lines[2:]:
-            if not row or not row[0]: continue
-            
-            col1 = row[0].strip()
-            # Check for section header: 
-            # 1. In first column
-            # 2. No "?" in any column (sections aren't questions)
-            # 3. Followed by many empty columns (at least 10)
-            # 4. Or specifically ALL CAPS or ends with --
-            is_section_format = (len(row) > 10 and all(not c.strip() for c in row[1:10]))
-            has_question_mark = col1.endswith('?') or any(c.strip() == '?' for c in row[1:])
-            
-            is_header = col1 and not has_question_mark and (col1.isupper() or is_section_format or col1.endswith('--'))
-
-            if is_header:
-                # Handle potential dash normalization (similar to how the app might)
-                current_section = normalize_name(re.sub(r'\s*-\s*', '-', col1))
-                if current_section not in section_map:
-                    section_map[current_section] = []
-            
-            # If inside a section and it looks like a question
-            elif current_section and (col1.endswith('?') or any(c.strip() == '?' for c in row[1:])):
-                section_map[current_section].append(normalize_name(col1))
-                    
-        print(f"Found {len(section_map)} sections in CSV")
-    except Exception as e:
-        print(f"Error parsing CSV data: {e}")
-        return
+    # Skip header 1 and header 2; a section whose header repeats keeps one question list
+    for section, questions in iter_sections(lines[2:]):
+        section_map.setdefault(normalize_name(section), []).extend(
+            normalize_name(first_cell) for _, first_cell, _ in questions
+        )
+    print(f"Found {len(section_map)} sections in CSV")
+
+    # 3. Verify each section, reusing cached results whose fingerprint is unchanged.
+    # A section's fingerprint is the hash of its CSV questions plus the hash of its
+    # DHIS2 data element set; the DHIS2 halves are cached per digest of the metadata
+    # file, section_aliases.json and the resolver code (inputs_digest), so the 4 MB
+    # JSON is only parsed when something actually has to be re-checked.
+    cache = SectionCache('strict_verification')
+    if full:
+        cache.clear()
+
+    digest = inputs_digest(metadata_path)
+    if cache.meta.get('inputs_digest') != digest:
+        cache.meta = {'inputs_digest': digest, 'dhis2_fingerprints': {}}
+    dhis2_fingerprints = cache.meta['dhis2_fingerprints']
 
-    # 2. Parse DHIS2 Metadata
-    metadata = None
-    json_encodings = ['utf-8-sig', 'utf-8', 'latin-1']
+    view = None
+    results = []
+    reverified = 0
+
+    for section_name, questions in section_map.items():
+        if not questions: continue
+
+        csv_fingerprint = content_hash(questions)
+        dhis2_fingerprint = dhis2_fingerprints.get(section_name)
+        result = None
+        if dhis2_fingerprint:
+            result = cache.lookup(section_name, csv_fingerprint + dhis2_fingerprint)
+
+        if result is None:
+            if view is None:
+                view = load_dhis2_view(metadata_path)
+                if not view:
+                    print("Failed to read DHIS2 Metadata")
+                    return False
+            resolver, de_cand_map = view
+
+            dhis2_section, dhis2_candidates = resolve_section_candidates(section_name, resolver, de_cand_map)
+            dhis2_fingerprint = content_hash([digest, dhis2_section.get('id') if dhis2_section else None,
+                                              dhis2_candidates])
+            dhis2_fingerprints[section_name] = dhis2_fingerprint
+
+            fingerprint = csv_fingerprint + dhis2_fingerprint
+            result = cache.lookup(section_name, fingerprint)
+            if result is None:
+                result = verify_section(section_name, questions, dhis2_section, dhis2_candidates)
+                cache.store(section_name, fingerprint, result)
+                reverified += 1
+
+        results.append(result)
+
+    # Nothing to persist when every section was served from the cache
+    if view is not None:
+        cache.prune(section_map.keys())
+        cache.save()
+
+    # 4. Rebuild the full report from the (cached) per-section results
+    print("\n--- GLOBAL STRICT COMPARISON RESULTS ---\n")
     
-    for encoding in json_encodings:
-        try:
-            with open('dhis2_full_metadata_v2.json', 'r', encoding=encoding) as f:
-                metadata = json.load(f)
-            print(f"Successfully read DHIS2 Metadata with {encoding} encoding")
-            break
-        except (UnicodeDecodeError, json.JSONDecodeError):
-            continue
-            
+    overall_mismatches = 0
+    passed_sections = 0
+    
+    for result in results:
+        for line in result['lines']:
+            print(line)
+        if result['status'] == 'ok':
+            passed_sections += 1
+        else:
+            overall_mismatches += 1
+
+    print(f"\nVerification Complete.")
+    print(f"Passed Sections: {passed_sections}")
+    print(f"Sections with Mismatches: {overall_mismatches}")
+    print(f"Re-verified Sections: {reverified} (others unchanged, served from cache)")
+    return overall_mismatches == 0
+
+def load_dhis2_view(path=METADATA_PATH):
+    """(resolver, {data element id: [candidate names]}) built from the metadata file"""
+    metadata = load_metadata(path)
     if not metadata:
-         print("Failed to read DHIS2 Metadata")
-         return
+        return None
+    return build_dhis2_view(metadata)
 
+def build_dhis2_view(metadata):
+    """(resolver, {data element id: [candidate names]}) for already loaded metadata"""
     # Map for all data elements globally
     all_psdes = metadata.get('programStageDataElements', [])
     de_cand_map = {}
@@ -125,72 +177,65 @@ def verify_all_sections():
             ]
             de_cand_map[de['id']] = [normalize_name(c) for c in cands if c]
 
-    dhis2_sections = metadata.get('programStageSections', [])
-    
-    print("\n--- GLOBAL STRICT COMPARISON RESULTS ---\n")
-    
-    overall_mismatches = 0
-    passed_sections = 0
+    # Build all section lookup keys once (exact, space-insensitive, prefix-stripped, aliases)
+    return SectionResolver.from_metadata(metadata), de_cand_map
+
+def resolve_section_candidates(section_name, resolver, de_cand_map):
+    """Return (dhis2_section, candidate names); for unresolved sections the names of near sections"""
+    dhis2_section = resolver.resolve(section_name)
+    if not dhis2_section:
+        return None, [resolver.display_name(s) for s in resolver.candidates(section_name)]
+
+    # Collect all candidates for this section
+    dhis2_candidates = []
+    for de_ref in dhis2_section.get('dataElements', []):
+        de_id = de_ref.get('id')
+        if de_id in de_cand_map:
+            dhis2_candidates.extend(de_cand_map[de_id])
+    return dhis2_section, dhis2_candidates
+
+def verify_section(section_name, questions, dhis2_section, dhis2_candidates):
+    """Compare one section; returns {'status': 'ok'|'fail'|'missed', 'lines': [report lines]}"""
+    lines = []
+
+    if not dhis2_section:
+        lines.append(f"Section [MISSED]: \"{section_name}\" - Not found in DHIS2 Sections")
+        # Try to print near matches for section names
+        lines.append("  Possible candidates:")
+        for name in dhis2_candidates:
+            lines.append(f"  - {name}")
+        return {'status': 'missed', 'lines': lines}
+
+    csv_set = set(questions)
+    dhis2_set = set(dhis2_candidates)
+    missing = csv_set - dhis2_set
     
-    for section_name, questions in section_map.items():
-        if not questions: continue
-        
-        # Find corresponding DHIS2 section
-        dhis2_section = None
-        for s in dhis2_sections:
-            s_name = normalize_name(s.get('name', ''))
-            # Try exact match first
-            if s_name == section_name:
-                dhis2_section = s
-                break
-            # Try match with single dash vs spaces etc
-            if s_name.replace(" ", "") == section_name.replace(" ", ""):
-                dhis2_section = s
-                break
-        
-        if not dhis2_section:
-            print(f"Section [MISSED]: \"{section_name}\" - Not found in DHIS2 Sections")
-            # Try to print near matches for section names
-            print("  Possible candidates:")
-            for s in dhis2_sections:
-                sn = s.get('name','')
-                if section_name[:10].lower() in sn.lower():
-                    print(f"  - {sn}")
-            overall_mismatches += 1
-            continue
-
-        # Collect all candidates for this section
-        dhis2_candidates = []
-        for de_ref in dhis2_section.get('dataElements', []):
-            de_id = de_ref.get('id')
-            if de_id in de_cand_map:
-                dhis2_candidates.extend(de_cand_map[de_id])
-        
-        csv_set = set(questions)
-        dhis2_set = set(dhis2_candidates)
-        missing = csv_set - dhis2_set
-        
-        if not missing:
-            passed_sections += 1
-            # print(f"Section [OK]: \"{section_name}\" - Perfect match")
-        else:
-            print(f"Section [FAIL]: \"{section_name}\" - {len(missing)} mismatches")
-            overall_mismatches += 1
-            for q in sorted(missing):
-                safe_q = q.encode('ascii', 'replace').decode('ascii')
-                print(f"  - CSV: \"{safe_q}\"")
-                # Look for near misses
-                norm_q = q.lower().replace(" ", "")
-                near_misses = [c for c in dhis2_candidates if c.lower().replace(" ", "") == norm_q]
-                if near_misses:
-                    for nm in set(near_misses):
-                        print(f"    Near Miss: \"{nm}\"")
-                else:
-                    print("    No similar item found in DHIS2")
+    if not missing:
+        return {'status': 'ok', 'lines': lines}
 
-    print(f"\nVerification Complete.")
-    print(f"Passed Sections: {passed_sections}")
-    print(f"Sections with Mismatches: {overall_mismatches}")
+    lines.append(f"Section [FAIL]: \"{section_name}\" - {len(missing)} mismatches")
+
+    # Index candidates by their near-miss key once per section
+    near_index = {}
+    for c in dhis2_candidates:
+        near_index.setdefault(c.lower().replace(" ", ""), set()).add(c)
+
+    for q in sorted(missing):
+        safe_q = q.encode('ascii', 'replace').decode('ascii')
+        lines.append(f"  - CSV: \"{safe_q}\"")
+        # Look for near misses
+        near_misses = near_index.get(q.lower().replace(" ", ""))
+        if near_misses:
+            for nm in sorted(near_misses):
+                lines.append(f"    Near Miss: \"{nm}\"")
+        else:
+            lines.append("    No similar item found in DHIS2")
+    return {'status': 'fail', 'lines': lines}
 
 if __name__ == "__main__":
-    verify_all_sections()
+    parser = argparse.ArgumentParser(description="Strict CSV vs DHIS2 comparison for all sections")
+    parser.add_argument('--full', action='store_true', help="ignore cached section results and re-verify everything")
+    parser.add_argument('--csv', default=CSV_PATH, help="checklist CSV (default: checklist-final.csv)")
+    parser.add_argument('--metadata', default=METADATA_PATH, help="DHIS2 program stage metadata JSON")
+    args = parser.parse_args()
+    sys.exit(0 if verify_all_sections(full=args.full, csv_path=args.csv, metadata_path=args.metadata) else 1)
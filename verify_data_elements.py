@@ -1,6 +1,22 @@
+import argparse
+import io
 import json
+import multiprocessing
 import os
-import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from generation_manifest import (MANIFEST_PATH, SOURCE_MAP_PATH, describes_module, find_facility, load_manifest,
+                                 load_source_map, questions_by_section, section_sources)
+from js_config_reader import JSConfigParseError, read_filter_config
+from section_resolver import strip_bullets
+
+# Generated modules in src/config that are not per-facility filters
+NON_FACILITY_CONFIGS = ['facilityServiceDepartments.js', 'facilityServiceFilters.js', 'sectionVisibilityConfig.js',
+                        'sectionVisibilityTable.js', 'commentFieldPairs.js', 'sectionFieldCounts.js']
+
+# Metadata index shared with worker processes (inherited copy-on-write under fork)
+_DHIS2_INDEX = None
 
 def get_credentials():
     env_path = '.env'
@@ -41,60 +57,60 @@ def load_dhis2_metadata():
     
     try:
         with open('dhis2_full_metadata_v2.json', 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
-            dhis2_elements = {}
-            for psde in data.get('programStageDataElements', []):
-                de = psde['dataElement']
-                # App logic: formName || displayFormName || name (displayName)
-                # We use .strip() because the app likely trims input too
-                best_name = de.get('formName') or de.get('displayFormName') or de.get('displayName')
-                if best_name:
-                    dhis2_elements[best_name.strip()] = de['id']
-            # Fallback for older metadata structure or direct dataElements list
-            if not dhis2_elements and 'dataElements' in data:
-                 for de in data['dataElements']:
-                    best_name = de.get('formName') or de.get('displayFormName') or de.get('displayName')
-                    if best_name:
-                        dhis2_elements[best_name.strip()] = de['id']
-            
-            return dhis2_elements
+            return form_name_elements(json.load(f))
     except Exception as e:
         print(f"❌ Error loading DHIS2 metadata: {e}")
         return {}
 
 
+def form_name_elements(data):
+    """{form name: data element id} for a program stage export"""
+    dhis2_elements = {}
+    for psde in data.get('programStageDataElements', []):
+        de = psde['dataElement']
+        # App logic: formName || displayFormName || name (displayName)
+        # We use .strip() because the app likely trims input too
+        best_name = de.get('formName') or de.get('displayFormName') or de.get('displayName')
+        if best_name:
+            dhis2_elements[best_name.strip()] = de['id']
+    # Fallback for older metadata structure or direct dataElements list
+    if not dhis2_elements and 'dataElements' in data:
+         for de in data['dataElements']:
+            best_name = de.get('formName') or de.get('displayFormName') or de.get('displayName')
+            if best_name:
+                dhis2_elements[best_name.strip()] = de['id']
+    return dhis2_elements
+
+
 def extract_questions_from_js_config(file_path):
-    questions_by_section = {}
-    current_section = None
-    
+    # Tokenizer-based reader: handles escaped quotes and multi-line strings
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        for line in lines:
-            line = line.strip()
-            section_match = re.search(r'"([^"]+)":\s*{', line)
-            if section_match:
-                current_section = section_match.group(1)
-                questions_by_section[current_section] = []
-                continue
-                
-            if current_section and line.startswith('"') and line.endswith(','):
-                question = line[1:-2]
-                if question == 'showOnly": [': 
-                    continue
-                questions_by_section[current_section].append(question)
-                
-    except Exception as e:
+        return read_filter_config(file_path) or {}
+    except (OSError, JSConfigParseError) as e:
         print(f"❌ Error reading config file {file_path}: {e}")
-        
-    return questions_by_section
+        return {}
+
+def build_dhis2_index(dhis2_elements):
+    """Exact names plus a lowercase lookup so the case-insensitive fallback is a dict hit"""
+    lowered = {}
+    for name in dhis2_elements:
+        lowered.setdefault(name.lower(), name)
+    return {'exact': dhis2_elements, 'lower': lowered}
+
+def _init_worker(index):
+    global _DHIS2_INDEX
+    _DHIS2_INDEX = index
+
+def check_facility_type(facility_name, config_file, dhis2_elements, report_file, lowered=None, local_questions=None,
+                        sources=None):
+    if lowered is None:
+        lowered = build_dhis2_index(dhis2_elements)['lower']
 
-def check_facility_type(facility_name, config_file, dhis2_elements, report_file):
     report_file.write(f"\n🏥 Check: {facility_name.upper()}\n")
     report_file.write("=" * 60 + "\n")
     
-    local_questions = extract_questions_from_js_config(config_file)
+    if local_questions is None:
+        local_questions = extract_questions_from_js_config(config_file)
     
     total_questions = 0
     total_missing = 0
@@ -103,32 +119,31 @@ def check_facility_type(facility_name, config_file, dhis2_elements, report_file)
     for section, questions in local_questions.items():
         missing_in_section = []
         formatting_mismatches = []
+        # CSV provenance of each entry, from the generator's source map
+        section_rows = (sources or {}).get(section, [])
+        where = lambda i: f"  (CSV row {section_rows[i][0]})" if i < len(section_rows) else ""
         
-        for q in questions:
+        for i, q in enumerate(questions):
             if q.strip() in dhis2_elements:
                 continue
                 
             # Check for formatting match
             # Normalize: remove bullets, dots at start, generic spaces
-            normalized_q = re.sub(r'^[·\.\-\s]+', '', q.strip()).strip()
+            normalized_q = strip_bullets(q)
             
             # Find if there is a DHIS2 element that matches normalized_q
             # We need to normalize DHIS2 keys too roughly for this check? 
             # Or just check if normalized_q exists in dhis2_elements (assuming dhis2 is "clean")
             
             if normalized_q in dhis2_elements:
-                 formatting_mismatches.append((q, normalized_q))
+                 formatting_mismatches.append((q, normalized_q, where(i)))
             else:
                  # Try case-insensitive match
-                 match_found = False
-                 for d_key in dhis2_elements.keys():
-                     if d_key.lower() == normalized_q.lower():
-                         formatting_mismatches.append((q, d_key))
-                         match_found = True
-                         break
-                 
-                 if not match_found:
-                     missing_in_section.append(q)
+                 d_key = lowered.get(normalized_q.lower())
+                 if d_key is not None:
+                     formatting_mismatches.append((q, d_key, where(i)))
+                 else:
+                     missing_in_section.append((q, where(i)))
 
         total_questions += len(questions)
         total_missing += len(missing_in_section)
@@ -139,36 +154,90 @@ def check_facility_type(facility_name, config_file, dhis2_elements, report_file)
             
             if formatting_mismatches:
                 report_file.write(f"     ⚠️  FORMATTING MISMATCH: {len(formatting_mismatches)} questions (Fix items in CSV/Config)\n")
-                for original, match in formatting_mismatches:
-                    report_file.write(f"      - \"{original}\"  -> matches DHIS2: \"{match}\"\n")
+                for original, match, row in formatting_mismatches:
+                    report_file.write(f"      - \"{original}\"  -> matches DHIS2: \"{match}\"{row}\n")
             
             if missing_in_section:
                 report_file.write(f"     ❌ TRULY MISSING in DHIS2: {len(missing_in_section)} questions\n")
-                for m in missing_in_section:
-                    report_file.write(f"      - \"{m}\"\n")
+                for m, row in missing_in_section:
+                    report_file.write(f"      - \"{m}\"{row}\n")
 
     if total_missing == 0 and total_formatting_mismatch == 0:
         report_file.write(f"  ✅ ALL {total_questions} questions match exactly in DHIS2!\n")
     else:
         report_file.write(f"\n  ⚠️  SUMMARY: {total_missing} missing, {total_formatting_mismatch} formatting issues out of {total_questions} questions.\n")
 
-def main():
+def check_facility_report(job):
+    """Worker entry point: returns the report text for one facility config"""
+    facility_name, config_file, local_questions, sources = job
+    buffer = io.StringIO()
+    check_facility_type(facility_name, config_file, _DHIS2_INDEX['exact'], buffer, _DHIS2_INDEX['lower'],
+                        local_questions, sources)
+    return buffer.getvalue()
+
+def list_facility_configs(config_dir='src/config', manifest_path=MANIFEST_PATH, source_map_path=SOURCE_MAP_PATH):
+    """Jobs of (facility_name, config_file, questions, sources) in a deterministic order.
+
+    Questions come from the generation manifest when it covers the module and was
+    written from the same checklist (matching "Checklist hash:" header); legacy modules
+    (physio.js, gynaeClinics.js, ...) fall back to parsing the JavaScript. sources is
+    the module's source map entry (CSV rows), used under the same rule.
+    """
+    manifest = load_manifest(manifest_path)
+    source_map = load_source_map(source_map_path)
+
+    # Sorted so parallel and sequential runs produce the same report
+    jobs = []
+    for filename in sorted(os.listdir(config_dir)):
+        if filename.endswith('.js') and filename not in NON_FACILITY_CONFIGS:
+            config_file = os.path.join(config_dir, filename)
+            local_questions = None
+            sources = None
+            facility = find_facility(manifest, filename) if manifest else None
+            if facility and describes_module(manifest, config_file):
+                local_questions = questions_by_section(facility)
+            if source_map and describes_module(source_map, config_file):
+                sources = section_sources(source_map, filename)
+            jobs.append((filename.replace('.js', ''), config_file, local_questions, sources))
+    return jobs
+
+def run_checks(jobs, index, workers=None):
+    """Check every facility config, fanning out over a process pool when workers > 1"""
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        _init_worker(index)
+        return [check_facility_report(job) for job in jobs]
+
+    # Prefer fork so workers share the parent's index pages instead of unpickling a copy
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(index,)) as pool:
+        # map() yields in submission order, keeping the merged report deterministic
+        return list(pool.map(check_facility_report, jobs, chunksize=chunksize))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify generated facility filters against DHIS2 data elements")
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = sequential)")
+    args = parser.parse_args(argv)
+
     dhis2_elements = load_dhis2_metadata()
     
     with open('DATA_ELEMENT_COMPARISON_REPORT.txt', 'w', encoding='utf-8') as report_file:
         if not dhis2_elements:
             report_file.write("Could not verify without DHIS2 data.\n")
-            return
+            return 1
 
         report_file.write(f"Loaded {len(dhis2_elements)} Data Elements from DHIS2.\n")
         
-        config_dir = 'src/config'
-        for filename in os.listdir(config_dir):
-            if filename.endswith('.js') and filename not in ['facilityServiceDepartments.js', 'facilityServiceFilters.js', 'sectionVisibilityConfig.js']:
-                facility_name = filename.replace('.js', '')
-                check_facility_type(facility_name, os.path.join(config_dir, filename), dhis2_elements, report_file)
+        index = build_dhis2_index(dhis2_elements)
+        for section_report in run_checks(list_facility_configs(), index, args.jobs):
+            report_file.write(section_report)
         
         print("✅ Report generated: DATA_ELEMENT_COMPARISON_REPORT.txt")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -2,6 +2,8 @@ import json
 import re
 import os
 
+from section_resolver import strip_name_prefix
+
 # Paths
 metadata_path = 'dhis2_full_metadata_v2.json'
 config_path = 'src/config/laboratory.js'
@@ -21,14 +23,7 @@ def load_config_strings(path):
     return [s for s in strings if len(s) > 5]
 
 def clean_dhis2_name(name):
-    if not name: return ""
-    clean = name
-    clean = re.sub(r'^[\d-]*\s*Inspection:\s*', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'^FACILITY:-?\s*', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'^SO,\d+\s*', '', clean, flags=re.IGNORECASE)
-    # Also handle the bullet point issue if DHIS2 has them (unlikely)
-    clean = re.sub(r'^[·\.\-\s]+', '', clean)
-    return clean.strip()
+    return strip_name_prefix(name)
 
 def verify():
     print("Loading Data Elements from Metadata...")
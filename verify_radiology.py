@@ -1,6 +1,9 @@
 import csv
 import json
 
+import config_path  # noqa: F401  (puts src/config on sys.path)
+from row_classifier import ROW_CLASSIFIER, clean_first_cell
+
 # Open and read the CSV file
 with open('checklist-final.csv', 'r', encoding='latin-1') as f:
     reader = csv.reader(f)
@@ -26,11 +29,10 @@ for i, row in enumerate(lines[1:], start=2):
     
     first_col = row[0].strip()
     
-    # Detect section headers
-    if (first_col.isupper() and 
-        not first_col.endswith('?') and 
-        len(first_col) > 3):
-        current_section = first_col
+    # Detect section headers (same rule as the generator)
+    section = ROW_CLASSIFIER.section_name(clean_first_cell(first_col))
+    if section is not None:
+        current_section = section
         if current_section not in section_data:
             section_data[current_section] = []
     
@@ -1,17 +1,20 @@
-import json
 import re
 import os
 
+from generation_manifest import describes_module, load_manifest
+from section_resolver import SectionResolver, load_metadata, strip_section_prefix
+
 # Paths
 metadata_path = 'dhis2_full_metadata_v2.json'
 config_path = 'src/config/facilityServiceDepartments.js'
 
-def load_json(path):
-    # Use utf-8-sig to handle BOM
-    with open(path, 'r', encoding='utf-8-sig') as f:
-        return json.load(f)
-
 def load_config_sections(path):
+    # The generator's manifest lists the same sections as ALL_FACILITY_DEPARTMENTS of the
+    # module it was generated with
+    manifest = load_manifest()
+    if manifest and describes_module(manifest, path):
+        return manifest['sections']
+
     sections = []
     # Config file likely utf-8? Or sig? Try sig safely?
     # Python open handles utf-8-sig fine on plain utf-8 too usually.
@@ -24,12 +27,7 @@ def load_config_sections(path):
     return sections
 
 def clean_dhis2_name(name):
-    clean = name
-    clean = re.sub(r'^[\d-]*\s*Inspection:\s*', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'^FACILITY:-?\s*', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'^SO,\d+\s+SERVICES OFFERED:\s*', '', clean, flags=re.IGNORECASE)
-    clean = re.sub(r'^SO,\d+\s*', '', clean, flags=re.IGNORECASE)
-    return clean.strip()
+    return strip_section_prefix(name)
 
 def verify():
     print("Loading Metadata...")
@@ -37,10 +35,9 @@ def verify():
         print(f"Error: {metadata_path} not found.")
         return
 
-    try:
-        data = load_json(metadata_path)
-    except Exception as e:
-        print(f"Error loading JSON: {e}")
+    data = load_metadata(metadata_path)
+    if not data:
+        print(f"Error loading JSON: {metadata_path}")
         return
 
     dhis2_sections = {}
@@ -63,26 +60,15 @@ def verify():
     missing_count = 0
     
     dhis2_names = list(dhis2_sections.values())
-    dhis2_clean_names = [clean_dhis2_name(n) for n in dhis2_names]
-
-    clean_to_orig = {clean_dhis2_name(n): n for n in dhis2_names}
+    resolver = SectionResolver.from_metadata(data)
 
     for cfg_sec in config_sections:
-        match_found = False
-        
-        if cfg_sec in dhis2_names:
-            match_found = True
-        
-        if not match_found:
-             if cfg_sec in dhis2_clean_names:
-                 match_found = True
-
-        if match_found:
+        if resolver.resolve(cfg_sec):
             found_count += 1
         else:
             missing_count += 1
             print(f"❌ MISSING IN DHIS2: '{cfg_sec}'")
-            potential = [n for n in dhis2_names if cfg_sec.lower() in n.lower() or n.lower() in cfg_sec.lower()]
+            potential = [resolver.display_name(s) for s in resolver.candidates(cfg_sec)]
             if potential:
                 print(f"   Potential Candidates in DHIS2: {potential}")
             else:
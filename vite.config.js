@@ -11,6 +11,9 @@ export default defineConfig({
       injectRegister: 'auto',
       workbox: {
         globPatterns: ['**/*.{js,css,html,ico,png,svg,woff2}'],
+        // The generator's source map (~470 KB, lazy chunk of ChecklistDebugTable) is a
+        // debugging aid: load it on demand instead of precaching it for every install
+        globIgnores: ['**/node_modules/**/*', '**/filter_source_map-*.js'],
         runtimeCaching: [
           {
             urlPattern: /^https:\/\/fonts\.googleapis\.com\/.*/i,